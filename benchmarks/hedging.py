@@ -0,0 +1,156 @@
+"""
+Request hedging check against a local stub of the provider API.
+
+Starts an in-process stub of the chat completions endpoint whose latency is
+drawn from an injected distribution: lognormal around --median-ms, with a
+--slow-prob chance of being --slow-factor times slower (a slow replica).
+--concurrency callers then send --requests requests through load_chat_model,
+hedged unless --no-hedge, and the latency percentiles and the extra requests
+hedging cost are reported.
+
+Usage: uv run --extra server python benchmarks/hedging.py [--no-hedge] [--slow-prob P]
+"""
+
+# ruff: noqa: T201
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+
+import uvicorn
+
+from langgraph_runner.logging import configure_logging
+from langgraph_runner.metrics import metrics
+from langgraph_runner.models import load_chat_model, model_pool
+
+MODEL = "stub-model"
+
+
+class StubProvider:
+    """ASGI stub of /v1/chat/completions with random latency."""
+
+    def __init__(
+        self, median_s: float, sigma: float, slow_prob: float, slow_factor: float
+    ):
+        self.median_s = median_s
+        self.sigma = sigma
+        self.slow_prob = slow_prob
+        self.slow_factor = slow_factor
+        self.received = 0
+
+    def latency(self) -> float:
+        latency = random.lognormvariate(math.log(self.median_s), self.sigma)
+        if random.random() < self.slow_prob:
+            latency *= self.slow_factor
+        return latency
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        while (await receive()).get("more_body"):
+            pass
+        self.received += 1
+        await asyncio.sleep(self.latency())
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": MODEL,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 5,
+                    "completion_tokens": 1,
+                    "total_tokens": 6,
+                },
+            }
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    stub = StubProvider(
+        args.median_ms / 1000, args.sigma, args.slow_prob, args.slow_factor
+    )
+    server = uvicorn.Server(uvicorn.Config(stub, port=args.port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    model = load_chat_model(
+        MODEL,
+        model_provider="openai",
+        base_url=f"http://127.0.0.1:{args.port}/v1",
+        max_retries=0,
+        hedge=not args.no_hedge,
+    )
+    latencies: list[float] = []
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await model.ainvoke("ping")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    await model_pool.aclose()
+    server.should_exit = True
+    await serving
+
+    counters = metrics.snapshot()["counters"]
+    fired = counters.get(f"hedge.{MODEL}.fired", 0)
+    won = counters.get(f"hedge.{MODEL}.won", 0)
+    print(f"hedging: {'off' if args.no_hedge else 'on'}, {args.requests} requests")
+    print(
+        f"latency:  p50={_percentile(latencies, 50):.0f} ms  "
+        f"p95={_percentile(latencies, 95):.0f} ms  "
+        f"p99={_percentile(latencies, 99):.0f} ms  max={max(latencies):.0f} ms"
+    )
+    print(
+        f"hedges:   {fired:.0f} fired ({fired / args.requests:.1%} extra requests), "
+        f"{won:.0f} won"
+    )
+    print(f"stub:     {stub.received} requests received")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--median-ms", type=float, default=80.0)
+    parser.add_argument("--sigma", type=float, default=0.25)
+    parser.add_argument("--slow-prob", type=float, default=0.03)
+    parser.add_argument("--slow-factor", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--no-hedge", action="store_true", help="Disable hedging")
+    configure_logging()
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Load test: concurrent multi-turn chat sessions against the HTTP/SSE server.
+
+Each session sends --turns messages on its own thread_id to
+/graphs/{graph}/stream and records time to first token and total latency.
+Without --url, an in-process server is started with a synthetic "echo"
+graph that streams tokens with a fixed per-token delay, so server and
+event-loop overhead can be measured without provider calls.
+
+Usage: uv run --extra server python benchmarks/http_load.py [--sessions N] [--turns T] [--url URL --graph G]
+"""
+
+# ruff: noqa: T201
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from collections.abc import AsyncIterator
+
+import httpx
+import uvicorn
+
+from langgraph_runner.graphs.base.runner import ChatRequest, ChatResponse, PregelRunner
+from langgraph_runner.graphs.registry import register
+from langgraph_runner.logging import configure_logging
+from langgraph_runner.server import ChatServer
+
+ECHO_TOKENS = 40
+
+
+class EchoRunner(PregelRunner):
+    """Synthetic graph streaming the question back one word at a time."""
+
+    def __init__(self, token_delay_s: float):
+        self._delay = token_delay_s
+
+    @property
+    def name(self) -> str:
+        return "echo"
+
+    async def awarmup(self) -> None:
+        return None
+
+    def invoke(self, request: ChatRequest, thread_id: str = "default") -> ChatResponse:
+        return ChatResponse(content=request.messages[-1]["content"])
+
+    async def ainvoke(
+        self, request: ChatRequest, thread_id: str = "default"
+    ) -> ChatResponse:
+        return ChatResponse(content="".join([c async for c in self.astream(request)]))
+
+    async def astream(
+        self, request: ChatRequest, thread_id: str = "default"
+    ) -> AsyncIterator[str]:
+        words = request.messages[-1]["content"].split()
+        for i in range(ECHO_TOKENS):
+            await asyncio.sleep(self._delay)
+            yield words[i % len(words)] + " "
+
+
+async def _session(url: str, turns: int, timeout: float) -> list[tuple[float, float]]:
+    """Run one multi-turn session, returning (ttft_s, total_s) per turn."""
+    thread_id = uuid.uuid4().hex
+    timings = []
+    # A client per session, like separate users: one shared pool of hundreds
+    # of connections makes httpcore's pool bookkeeping the bottleneck
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        for turn in range(turns):
+            timings.append(await _turn(client, url, turn, thread_id))
+    return timings
+
+
+async def _turn(
+    client: httpx.AsyncClient, url: str, turn: int, thread_id: str
+) -> tuple[float, float]:
+    """Send one message, returning (ttft_s, total_s)."""
+    start = time.perf_counter()
+    ttft = None
+    body = {
+        "message": f"turn {turn} of session {thread_id}",
+        "thread_id": thread_id,
+    }
+    async with client.stream("POST", url, json=body) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("event: error"):
+                raise RuntimeError("server reported a stream error")
+            if ttft is None and line.startswith("data: ") and "content" in line:
+                ttft = time.perf_counter() - start
+    total = time.perf_counter() - start
+    return (ttft if ttft is not None else total, total)
+
+
+def _percentiles(values: list[float]) -> str:
+    q = (
+        statistics.quantiles(values, n=100, method="inclusive")
+        if len(values) > 1
+        else values * 99
+    )
+    return f"p50={q[49] * 1000:8.1f} ms  p95={q[94] * 1000:8.1f} ms  max={max(values) * 1000:8.1f} ms"
+
+
+async def _run(args: argparse.Namespace) -> None:
+    server = None
+    url = args.url
+    if url is None:
+        register("echo", lambda: EchoRunner(args.token_delay_ms / 1000))
+        app = ChatServer(warmup_graphs=("echo",))
+        server = uvicorn.Server(
+            uvicorn.Config(
+                app, port=args.port, log_level="warning", backlog=args.sessions * 2
+            )
+        )
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+        url = f"http://127.0.0.1:{args.port}"
+
+    stream_url = f"{url}/graphs/{args.graph}/stream"
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_session(stream_url, args.turns, args.timeout) for _ in range(args.sessions)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.should_exit = True
+        await serving
+
+    timings = [t for r in results if isinstance(r, list) for t in r]
+    errors = [r for r in results if isinstance(r, BaseException)]
+    print(f"{args.sessions} sessions x {args.turns} turns against {stream_url}")
+    print(f"requests: {len(timings)} ok, {len(errors)} failed sessions")
+    if errors:
+        print(f"first error: {errors[0]!r}")
+    if timings:
+        print(f"throughput: {len(timings) / elapsed:.1f} req/s over {elapsed:.1f} s")
+        print(f"ttft   {_percentiles([t for t, _ in timings])}")
+        print(f"total  {_percentiles([t for _, t in timings])}")
+    if args.url is None:
+        ideal = ECHO_TOKENS * args.token_delay_ms
+        print(f"(echo graph: {ideal:.0f} ms of simulated generation per request)")
+    print(json.dumps({"ok": len(timings), "failed_sessions": len(errors)}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--url", help="Running server; default starts one in-process")
+    parser.add_argument("--graph", default="echo")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token-delay-ms", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    configure_logging()
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Rate limiter check against a local stub of the provider API.
+
+Starts an in-process stub of the chat completions endpoint that enforces an
+RPM quota with a token bucket, answering 429 with retry-after-ms when it is
+exceeded and x-ratelimit-* headers otherwise (the limit is learned from them,
+nothing is configured client-side). --workers callers then send requests
+through load_chat_model for --seconds, with the SDK's own retries disabled,
+and the achieved rate is compared with the quota.
+
+Usage: uv run --extra server python benchmarks/rate_limit.py [--rpm N] [--workers N] [--no-limit]
+"""
+
+# ruff: noqa: T201
+import argparse
+import asyncio
+import json
+import time
+
+import uvicorn
+
+from langgraph_runner.config import settings
+from langgraph_runner.logging import configure_logging
+from langgraph_runner.metrics import metrics
+from langgraph_runner.models import load_chat_model, model_pool
+
+MODEL = "stub-model"
+
+
+class StubProvider:
+    """ASGI stub of /v1/chat/completions with an RPM token bucket."""
+
+    def __init__(self, rpm: int, burst_s: float, latency_s: float):
+        self.rpm = rpm
+        self.rate = rpm / 60
+        self.capacity = max(self.rate * burst_s, 1.0)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self.latency_s = latency_s
+        self.accepted = 0
+        self.throttled = 0
+
+    def _take(self) -> float | None:
+        """Take one request from the bucket, or return seconds until one is free."""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.level >= 1:
+            self.level -= 1
+            return None
+        return (1 - self.level) / self.rate
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        while (await receive()).get("more_body"):
+            pass
+        wait = self._take()
+        if wait is not None:
+            self.throttled += 1
+            await self._send(
+                send,
+                429,
+                {"error": {"message": "Rate limit reached", "code": "rate_limit"}},
+                [(b"retry-after-ms", str(int(wait * 1000) + 1).encode())],
+            )
+            return
+        self.accepted += 1
+        await asyncio.sleep(self.latency_s)
+        await self._send(
+            send,
+            200,
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": MODEL,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 5,
+                    "completion_tokens": 1,
+                    "total_tokens": 6,
+                },
+            },
+            [
+                (b"x-ratelimit-limit-requests", str(self.rpm).encode()),
+                (b"x-ratelimit-remaining-requests", str(int(self.level)).encode()),
+            ],
+        )
+
+    @staticmethod
+    async def _send(send, status: int, body: dict, headers: list) -> None:
+        payload = json.dumps(body).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"), *headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.RATE_LIMITING = not args.no_limit
+    stub = StubProvider(
+        args.rpm, settings.RATE_LIMIT_BURST_SECONDS, args.latency_ms / 1000
+    )
+    server = uvicorn.Server(uvicorn.Config(stub, port=args.port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    model = load_chat_model(
+        MODEL,
+        model_provider="openai",
+        base_url=f"http://127.0.0.1:{args.port}/v1",
+        max_retries=0,
+    )
+    ok = failed = 0
+    deadline = time.perf_counter() + args.seconds
+
+    async def worker() -> None:
+        nonlocal ok, failed
+        while time.perf_counter() < deadline:
+            try:
+                await model.ainvoke("ping")
+                ok += 1
+            except Exception:
+                failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.workers)))
+    elapsed = time.perf_counter() - start
+    await model_pool.aclose()
+    server.should_exit = True
+    await serving
+
+    delays = metrics.snapshot()["summaries"].get(f"ratelimit.{MODEL}.delay_ms")
+    print(f"rate limiting: {'off' if args.no_limit else 'on'}, {args.workers} workers")
+    print(f"quota:    {args.rpm / 60:.1f} req/s (+{stub.capacity:.0f} burst)")
+    print(f"achieved: {ok / elapsed:.1f} req/s over {elapsed:.1f} s")
+    print(f"requests: {ok} ok, {failed} failed, {stub.throttled} throttled by stub")
+    if delays:
+        print(f"pacing delay: mean={delays['mean']:.0f} ms  p95={delays['p95']:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rpm", type=int, default=1200)
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--no-limit", action="store_true", help="Disable rate limiting")
+    configure_logging()
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: Chroma HNSW vs in-process NumPy exact search.
+
+Builds a synthetic corpus shaped like the ingested outlook PDFs (a few
+thousand chunks, two doc_types, text-embedding-3-large dimensions) in an
+ephemeral Chroma collection, loads it into NumpyVectorStore, and compares
+doc_type-filtered search latency and Chroma's recall@k against exact results.
+No provider calls are made.
+
+Usage: uv run python benchmarks/vector_search.py [--docs N] [--dim D] [--queries Q] [-k K]
+"""
+
+# ruff: noqa: T201
+import argparse
+import time
+
+import chromadb
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.embeddings import FakeEmbeddings
+
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+
+DOC_TYPES = ("forecast", "mid_year")
+
+
+def _normalized(rng: np.random.Generator, n: int, dim: int) -> np.ndarray:
+    vectors = rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _build_chroma(vectors: np.ndarray, doc_types: list[str]) -> Chroma:
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection("bench_vector_search")
+    ids = [str(i) for i in range(len(vectors))]
+    for start in range(0, len(ids), 1000):
+        end = start + 1000
+        collection.add(
+            ids=ids[start:end],
+            embeddings=vectors[start:end],
+            documents=[f"chunk {i}" for i in range(start, min(end, len(ids)))],
+            metadatas=[{"doc_type": t} for t in doc_types[start:end]],
+        )
+    return Chroma(
+        client=client,
+        collection_name="bench_vector_search",
+        embedding_function=FakeEmbeddings(size=vectors.shape[1]),
+    )
+
+
+def _ms_per_query(elapsed: float, queries: int) -> float:
+    return elapsed / queries * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=4000)
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    corpus = _normalized(rng, args.docs, args.dim)
+    doc_types = [DOC_TYPES[i % len(DOC_TYPES)] for i in range(args.docs)]
+
+    # Queries near corpus points, like real questions near relevant chunks
+    anchors = rng.integers(0, args.docs, args.queries)
+    queries = corpus[anchors] + 0.5 * _normalized(rng, args.queries, args.dim)
+    filters = [{"doc_type": DOC_TYPES[i % len(DOC_TYPES)]} for i in range(args.queries)]
+
+    print(f"Building corpus: {args.docs} docs x {args.dim} dims ...")
+    chroma = _build_chroma(corpus, doc_types)
+    start = time.perf_counter()
+    store = NumpyVectorStore.from_chroma(chroma)
+    load_s = time.perf_counter() - start
+
+    query_lists = queries.tolist()
+
+    start = time.perf_counter()
+    chroma_results = [
+        chroma.similarity_search_by_vector_with_relevance_scores(q, k=args.k, filter=f)
+        for q, f in zip(query_lists, filters, strict=True)
+    ]
+    chroma_ms = _ms_per_query(time.perf_counter() - start, args.queries)
+
+    start = time.perf_counter()
+    exact_results = [
+        store.similarity_search_by_vector_with_relevance_scores(q, k=args.k, filter=f)
+        for q, f in zip(query_lists, filters, strict=True)
+    ]
+    numpy_ms = _ms_per_query(time.perf_counter() - start, args.queries)
+
+    start = time.perf_counter()
+    store.search_many(queries, k=args.k, filters=filters)
+    batched_ms = _ms_per_query(time.perf_counter() - start, args.queries)
+
+    recall = np.mean(
+        [
+            len({d.id for d, _ in c} & {d.id for d, _ in e}) / max(len(e), 1)
+            for c, e in zip(chroma_results, exact_results, strict=True)
+        ]
+    )
+
+    print(f"NumPy load from Chroma: {load_s * 1000:.0f} ms\n")
+    print(f"{'backend':<24}{'ms/query':>12}{'recall@k':>12}")
+    print(f"{'chroma (hnsw)':<24}{chroma_ms:>12.3f}{recall:>12.3f}")
+    print(f"{'numpy (single)':<24}{numpy_ms:>12.3f}{1.0:>12.3f}")
+    print(f"{'numpy (batched)':<24}{batched_ms:>12.3f}{1.0:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
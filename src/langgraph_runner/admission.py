@@ -0,0 +1,218 @@
+"""
+Admission control for provider and vector store calls.
+
+Every model and backend gets a gate: a concurrency limit with a bounded
+priority queue in front of it. A burst of requests waits in the queue instead
+of fanning out to the provider, and is shed with AdmissionRejected when the
+queue is full or a request has waited longer than its deadline.
+
+Gates are named "model:<model_id>" (async chat model HTTP requests, admitted
+in transport.py) and "backend:<name>" (embedding requests and Chroma
+queries). Callers are "interactive" unless they run inside
+admission_priority("batch"); queued interactive requests are always admitted
+first, and batch requests wait without a deadline since their callers bound
+their own concurrency.
+
+Metrics per gate: "admission.<gate>.wait_ms" and ".queue_depth" summaries,
+and ".shed" counters.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Literal
+
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import metrics
+
+Priority = Literal["interactive", "batch"]
+
+# Admission order of queued requests
+PRIORITIES: tuple[Priority, ...] = ("interactive", "batch")
+
+_priority: ContextVar[Priority] = ContextVar(
+    "admission_priority", default="interactive"
+)
+
+
+class AdmissionRejected(Exception):
+    """A request was shed: its gate's queue was full or its deadline passed."""
+
+    def __init__(self, gate: str, reason: str):
+        super().__init__(f"{gate}: {reason}")
+        self.gate = gate
+        self.reason = reason
+
+
+@contextmanager
+def admission_priority(priority: Priority) -> Iterator[None]:
+    """Admit calls made in this scope (and tasks it starts) with a priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """Priority of calls made in the current context."""
+    return _priority.get()
+
+
+class AdmissionGate:
+    """
+    Concurrency limit with one bounded FIFO queue per priority class.
+
+    A released slot is handed directly to the next queued request, highest
+    priority first, so queued requests are never overtaken by new arrivals.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        max_queue: int,
+        queue_timeout: float | None,
+    ):
+        """
+        Args:
+            name: Gate name, used in metrics and errors
+            limit: Max concurrent admitted requests
+            max_queue: Max queued requests per priority class
+            queue_timeout: Max seconds an interactive request waits for a
+                slot. None to wait indefinitely.
+        """
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._queues: dict[Priority, deque[asyncio.Future[None]]] = {
+            p: deque() for p in PRIORITIES
+        }
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        # Futures of requests that just gave up stay queued until they resume
+        return sum(not f.done() for q in self._queues.values() for f in q)
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait for a slot; raises AdmissionRejected if shed."""
+        metric = f"admission.{self.name}"
+        if self._active < self.limit and not self.queue_depth:
+            self._active += 1
+            metrics.observe(f"{metric}.wait_ms", 0.0)
+            return
+
+        priority = priority or current_priority()
+        queue = self._queues[priority]
+        if len(queue) >= self.max_queue:
+            metrics.incr(f"{metric}.shed")
+            raise AdmissionRejected(self.name, f"{priority} queue is full")
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        metrics.observe(f"{metric}.queue_depth", self.queue_depth)
+        timeout = self.queue_timeout if priority == "interactive" else None
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was handed over as we gave up: pass it on
+                self.release()
+            if isinstance(e, TimeoutError):
+                metrics.incr(f"{metric}.shed")
+                raise AdmissionRejected(
+                    self.name, f"no slot within {timeout:g}s"
+                ) from None
+            raise
+        finally:
+            if future in queue:
+                queue.remove(future)
+        metrics.observe(f"{metric}.wait_ms", (time.perf_counter() - start) * 1000)
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free now, without queueing."""
+        if self._active >= self.limit or self.queue_depth:
+            return False
+        self._active += 1
+        return True
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next queued request if any."""
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the scope."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class AdmissionController:
+    """
+    Registry of gates, created on first use with limits from settings.
+
+    Gates are scoped to the running event loop, since their queues hold
+    loop-bound futures.
+    """
+
+    def __init__(self) -> None:
+        self._loop_gates: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, AdmissionGate]
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def limit(name: str) -> int:
+        """Concurrency limit for a gate name."""
+        default = (
+            settings.ADMISSION_MODEL_CONCURRENCY
+            if name.startswith("model:")
+            else settings.ADMISSION_BACKEND_CONCURRENCY
+        )
+        return settings.ADMISSION_LIMITS.get(name, default)
+
+    def gate(self, name: str) -> AdmissionGate:
+        """Gate for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        gates = self._loop_gates.setdefault(loop, {})
+        gate = gates.get(name)
+        if gate is None:
+            gate = gates[name] = AdmissionGate(
+                name,
+                limit=self.limit(name),
+                max_queue=settings.ADMISSION_MAX_QUEUE,
+                queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            )
+        return gate
+
+    @asynccontextmanager
+    async def admit(self, name: str) -> AsyncIterator[None]:
+        """Hold a slot of the named gate, or pass through if disabled."""
+        if not settings.ADMISSION_CONTROL:
+            yield
+            return
+        async with self.gate(name).slot():
+            yield
+
+
+admission = AdmissionController()
@@ -0,0 +1,85 @@
+"""
+Cancellation of abandoned requests, and the work they wasted.
+
+Cancelling a request's task (Ctrl-C in the CLI, a client leaving the server)
+reaches every step it is awaiting: LangGraph cancels running nodes and tool
+subgraphs, and httpx closes provider connections so generation stops. Two
+kinds of work need help to stop with it:
+
+- Async generators abandoned mid-iteration are only closed when garbage
+  collected, so streams are consumed under closing_stream, which closes the
+  graph streams beneath them (and cancels their nodes) right away.
+- Threads cannot be interrupted. to_thread skips work still queued when its
+  caller is cancelled and accounts for work that runs on for nobody.
+
+Wasted work is recorded as "cancelled.<what>" counters with a
+"cancelled.<what>.wasted_ms" summary: "chat" (request time spent before the
+caller left), "model.<model>" (provider calls abandoned mid-flight) and
+"thread.<what>" (thread time after the caller left, plus a ".skipped" counter
+for queued work that never ran).
+"""
+
+import asyncio
+import contextvars
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from langgraph_runner.metrics import metrics
+
+
+def record_abandoned(what: str, wasted_s: float) -> None:
+    """Count an abandoned piece of work and how long it ran for nothing."""
+    metrics.incr(f"cancelled.{what}")
+    metrics.observe(f"cancelled.{what}.wasted_ms", wasted_s * 1000)
+
+
+@asynccontextmanager
+async def closing_stream[T](
+    stream: AsyncIterator[T],
+) -> AsyncIterator[AsyncIterator[T]]:
+    """
+    contextlib.aclosing for streams typed as plain async iterators.
+
+    Closes the stream on exit, whether it ended, failed, or its consumer
+    stopped early or was cancelled.
+    """
+    try:
+        yield stream
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def to_thread[T](what: str, fn: Callable[..., T], /, *args, **kwargs) -> T:
+    """
+    Like asyncio.to_thread, but stops what it can when the caller is cancelled.
+
+    A call still queued for a worker thread is skipped. One already running
+    finishes (threads cannot be interrupted) and its time past the
+    cancellation is recorded as wasted under "thread.<what>".
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    started = False
+    abandoned_at: float | None = None
+
+    def run() -> T | None:
+        nonlocal started
+        if abandoned_at is not None:
+            return None
+        started = True
+        try:
+            return ctx.run(fn, *args, **kwargs)
+        finally:
+            if abandoned_at is not None:
+                record_abandoned(f"thread.{what}", time.monotonic() - abandoned_at)
+
+    try:
+        return await loop.run_in_executor(None, run)  # type: ignore[arg-type]
+    except asyncio.CancelledError:
+        abandoned_at = time.monotonic()
+        if not started:
+            metrics.incr(f"cancelled.thread.{what}.skipped")
+        raise
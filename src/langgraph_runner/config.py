@@ -39,15 +39,189 @@ class Settings(BaseSettings):
     )
     DEFAULT_TEMPERATURE: float = Field(default=0.0, ge=0.0, le=2.0)
 
+    # Model tiering settings
+    FAST_MODEL_ID: str = Field(
+        default="gpt-5-mini",
+        description="Model for requests tiering judges simple",
+    )
+    RAG_SYNTHESIS_TIER: Literal["auto", "fast", "default"] = Field(
+        default="default",
+        description="Synthesis model tier: 'auto' picks FAST_MODEL_ID for simple "
+        "questions, 'default' always uses the request's model",
+    )
+    AGENT_MODEL_TIER: Literal["auto", "fast", "default"] = Field(
+        default="default",
+        description="Agent step model tier, as for RAG_SYNTHESIS_TIER",
+    )
+    TIERING_MAX_SOURCES: int = Field(
+        default=1, ge=0, description="Most sources a 'fast' RAG question may query"
+    )
+    TIERING_MAX_CONTEXT_TOKENS: int = Field(
+        default=3000,
+        ge=0,
+        description="Most retrieved or history tokens a 'fast' step may have",
+    )
+    TIERING_MAX_QUERY_TOKENS: int = Field(
+        default=40, ge=0, description="Longest query a 'fast' step may have"
+    )
+    PREWARM_MODELS: bool = Field(
+        default=False,
+        description="Warm clients, connections and indexes before a single `ask` "
+        "(chat sessions always warm up once at start)",
+    )
+    RUNNABLE_CACHE_SIZE: int = Field(
+        default=128,
+        ge=1,
+        description="Max cached structured-output/tool-bound model runnables",
+    )
+
+    # HTTP client settings (shared keep-alive pool for provider SDKs)
+    HTTP_MAX_CONNECTIONS: int = Field(default=1000, ge=1)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=100, ge=0)
+    HTTP_KEEPALIVE_EXPIRY: float = Field(default=30.0, ge=0.0)
+
     # Embedding settings
     EMBEDDING_MODEL: str = Field(default="text-embedding-3-large")
+    EMBEDDING_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache embeddings in memory and on disk by (model, content hash)",
+    )
+    EMBEDDING_CACHE_MEMORY_SIZE: int = Field(default=10_000, ge=1)
+    EMBEDDING_CACHE_DISK_MAX_ENTRIES: int = Field(default=200_000, ge=1)
+    EMBEDDING_BATCH_WINDOW_MS: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Window for coalescing concurrent embedding calls. 0 to disable.",
+    )
+    EMBEDDING_BATCH_MAX_SIZE: int = Field(default=64, ge=1)
+
+    # Routing settings
+    RAG_FAST_PATH_ROUTING: bool = Field(
+        default=True,
+        description="Resolve unambiguous RAG routing locally before the router LLM",
+    )
+    RAG_LEARNED_ROUTING: bool = Field(
+        default=False,
+        description="Serve confident routing decisions from the trained local model",
+    )
+    RAG_LEARNED_ROUTING_THRESHOLD: float = Field(default=0.85, ge=0.0, le=1.0)
+    RAG_LOG_ROUTING_DECISIONS: bool = Field(
+        default=False,
+        description="Log LLM routing decisions (with raw queries) as training data",
+    )
+    RAG_SPECULATIVE_RETRIEVAL: bool = Field(
+        default=False,
+        description="Retrieve from every source on the raw query while routing",
+    )
+    RAG_SPECULATIVE_REUSE: Literal["match", "always"] = Field(
+        default="match",
+        description="Reuse speculative results when the routed sub-query shares "
+        "most of the raw query's keywords ('match'), or whenever selected ('always')",
+    )
+    RAG_BATCHED_RETRIEVAL: bool = Field(
+        default=True,
+        description="Embed all routed sub-queries in one batched request",
+    )
+
+    # Synthesis settings
+    RAG_CONTEXT_PACKING: bool = Field(
+        default=True,
+        description="Merge overlapping chunks, drop near-duplicates and fit "
+        "synthesis context into RAG_CONTEXT_TOKEN_BUDGET",
+    )
+    RAG_CONTEXT_TOKEN_BUDGET: int | None = Field(
+        default=6000,
+        ge=1,
+        description="Max chunk tokens in the synthesis prompt. None for no limit.",
+    )
+    RAG_TOOL_DIRECT_RETURN: bool = Field(
+        default=True,
+        description="Stream the RAG tool's synthesized answer as the agent's final "
+        "answer instead of having the agent model restate it",
+    )
+    RAG_SINGLE_FLIGHT: bool = Field(
+        default=True,
+        description="Share one execution between concurrent identical RAG "
+        "requests (same normalized query and model settings)",
+    )
+
+    # Deadline settings
+    REQUEST_TIMEOUT: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Default seconds a chat request has to answer; nodes "
+        "degrade rather than overrun it. None for no deadline.",
+    )
+    RAG_CLASSIFY_TIMEOUT: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Seconds routing may take before falling back to "
+        "searching every source with the raw query. None to disable.",
+    )
+    RAG_RETRIEVAL_TIMEOUT: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Seconds each source's retrieval may take before synthesis "
+        "proceeds without it. None to disable.",
+    )
+    RAG_SYNTHESIS_TIMEOUT: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Seconds synthesis may take before the partial answer is "
+        "returned. None to disable.",
+    )
+
+    # Agent history settings
+    AGENT_HISTORY_TOKEN_BUDGET: int = Field(
+        default=16_000,
+        ge=1,
+        description="Max conversation history tokens sent to the agent model per step",
+    )
+    AGENT_HISTORY_MODEL_BUDGETS: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-model overrides of AGENT_HISTORY_TOKEN_BUDGET (JSON object)",
+    )
+    AGENT_HISTORY_SUMMARIZATION: bool = Field(
+        default=False,
+        description="Fold turns that no longer fit into a rolling summary kept in "
+        "state, instead of only leaving them out of the prompt",
+    )
+    AGENT_HISTORY_SUMMARY_MODEL_ID: str | None = Field(
+        default=None,
+        description="Model for history summaries. None to use ROUTER_MODEL_ID.",
+    )
 
     # Retrieval settings
+    VECTORSTORE_BACKEND: Literal["chroma", "numpy"] = Field(
+        default="chroma",
+        description="Search backend: Chroma HNSW or in-memory NumPy exact search",
+    )
+    VECTORSTORE_PARTITIONED: bool = Field(
+        default=False,
+        description="Store each doc_type in its own collection instead of "
+        "filtering one shared collection by metadata",
+    )
     RETRIEVAL_K: int = Field(default=10, ge=1, le=20)
     RETRIEVAL_MAX_DISTANCE: float | None = Field(
         default=None,
         description="Max distance threshold for retrieval (lower = more similar). None to disable.",
     )
+    RETRIEVAL_ADAPTIVE_K: bool = Field(
+        default=False,
+        description="Fetch RETRIEVAL_CANDIDATE_K hits and truncate by distance "
+        "gap / token budget instead of always returning RETRIEVAL_K",
+    )
+    RETRIEVAL_CANDIDATE_K: int = Field(default=20, ge=1, le=100)
+    RETRIEVAL_MAX_RELATIVE_GAP: float | None = Field(
+        default=0.25,
+        ge=0.0,
+        description="Drop hits more than this fraction farther than the best hit",
+    )
+    RETRIEVAL_TOKEN_BUDGET: int | None = Field(
+        default=None,
+        ge=1,
+        description="Max total chunk tokens per retrieval. None to disable.",
+    )
     CHUNK_SIZE: int = Field(default=600, ge=100, le=4000)
     CHUNK_OVERLAP: int = Field(default=150, ge=0)
 
@@ -55,8 +229,105 @@ class Settings(BaseSettings):
     DATA_DIR: Path = Field(default=_PROJECT_ROOT / "data")
     PDF_DIR: Path = Field(default=_PROJECT_ROOT / "data" / "pdfs")
     CHROMA_DIR: Path = Field(default=_PROJECT_ROOT / "data" / "chroma_db")
+    ROUTING_DIR: Path = Field(default=_PROJECT_ROOT / "data" / "routing")
+    EMBEDDING_CACHE_PATH: Path = Field(
+        default=_PROJECT_ROOT / "data" / "embedding_cache.sqlite3"
+    )
 
     DEFAULT_GRAPH: str = Field(default="jpm_react_agent")
+    BATCH_CONCURRENCY: int = Field(
+        default=8, ge=1, description="Questions in flight for the `batch` command"
+    )
+
+    # Admission control settings
+    ADMISSION_CONTROL: bool = Field(
+        default=True,
+        description="Queue async model, embedding and Chroma calls behind "
+        "per-model and per-backend concurrency limits",
+    )
+    ADMISSION_MODEL_CONCURRENCY: int = Field(
+        default=16, ge=1, description="Concurrent requests per chat model"
+    )
+    ADMISSION_BACKEND_CONCURRENCY: int = Field(
+        default=8,
+        ge=1,
+        description="Concurrent requests per backend (embeddings, chroma)",
+    )
+    ADMISSION_LIMITS: dict[str, int] = Field(
+        default_factory=dict,
+        description='Per-gate overrides, e.g. {"model:gpt-5": 4, "backend:chroma": 16}',
+    )
+    ADMISSION_MAX_QUEUE: int = Field(
+        default=256,
+        ge=0,
+        description="Max queued requests per gate and priority before shedding",
+    )
+    ADMISSION_QUEUE_TIMEOUT: float | None = Field(
+        default=30.0,
+        gt=0.0,
+        description="Max seconds an interactive request waits for a slot before "
+        "it is shed. None to wait indefinitely.",
+    )
+
+    # Provider rate limiting settings
+    RATE_LIMITING: bool = Field(
+        default=True,
+        description="Pace provider requests per model to its RPM/TPM quota and "
+        "retry 429s after backing off all callers",
+    )
+    RATE_LIMIT_RPM: dict[str, int] = Field(
+        default_factory=dict,
+        description="Requests per minute per model (JSON object). Models not "
+        "listed use the limit reported in provider response headers.",
+    )
+    RATE_LIMIT_TPM: dict[str, int] = Field(
+        default_factory=dict,
+        description="Tokens per minute per model (JSON object), as RATE_LIMIT_RPM",
+    )
+    RATE_LIMIT_BURST_SECONDS: float = Field(
+        default=6.0,
+        gt=0.0,
+        description="Bucket capacity, in seconds of quota, usable in a burst",
+    )
+    RATE_LIMIT_MAX_RETRIES: int = Field(
+        default=4, ge=0, description="Retries of a throttled (429) request"
+    )
+    RATE_LIMIT_MAX_BACKOFF: float = Field(
+        default=60.0, gt=0.0, description="Max seconds to back off after a 429"
+    )
+
+    # Request hedging settings
+    HEDGING: bool = Field(
+        default=False,
+        description="Hedge the RAG graph's classification and synthesis calls: "
+        "duplicate requests that outlast the model's recent HEDGE_QUANTILE latency",
+    )
+    HEDGE_QUANTILE: float = Field(
+        default=95.0,
+        gt=0.0,
+        le=100.0,
+        description="Latency percentile after which a duplicate is sent",
+    )
+    HEDGE_MAX_FRACTION: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description="Max hedges as a fraction of each model's hedged requests",
+    )
+    HEDGE_MIN_SAMPLES: int = Field(
+        default=20,
+        ge=1,
+        description="Latencies to observe for a model before hedging it",
+    )
+
+    # HTTP server settings (`serve` command)
+    SERVER_HOST: str = Field(default="127.0.0.1")
+    SERVER_PORT: int = Field(default=8000, ge=1, le=65535)
+    SERVER_DRAIN_TIMEOUT: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Seconds to let in-flight requests finish on shutdown",
+    )
 
     # Checkpointer settings
     CHECKPOINTER_TYPE: Literal["memory", "postgres"] = Field(
@@ -89,6 +360,7 @@ class Settings(BaseSettings):
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
         self.PDF_DIR.mkdir(parents=True, exist_ok=True)
         self.CHROMA_DIR.mkdir(parents=True, exist_ok=True)
+        self.ROUTING_DIR.mkdir(parents=True, exist_ok=True)
         return self
 
 
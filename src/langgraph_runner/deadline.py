@@ -0,0 +1,59 @@
+"""
+Per-request deadlines.
+
+A deadline is an absolute time.monotonic() value by which a request should be
+answered. ChatRequest carries it, runners pass it to every node as the
+"deadline" field of the graph config, and each step bounds its own work by
+the earlier of the deadline and its per-step timeout. A step that runs out of
+time degrades (skips a source, returns what it has) rather than delaying the
+whole answer.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Iterable
+
+
+def deadline_after(seconds: float | None) -> float | None:
+    """Deadline seconds from now, or None for no limit."""
+    return None if seconds is None else time.monotonic() + seconds
+
+
+def earliest(*deadlines: float | None) -> float | None:
+    """The earliest of the given deadlines, ignoring None."""
+    return min((d for d in deadlines if d is not None), default=None)
+
+
+def remaining(deadline: float | None) -> float | None:
+    """Seconds left before deadline (0 once passed), or None for no limit."""
+    return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+
+def expired(deadline: float | None) -> bool:
+    """Whether deadline has passed."""
+    return deadline is not None and time.monotonic() >= deadline
+
+
+async def gather_until[T](
+    aws: Iterable[Awaitable[T]], deadline: float | None
+) -> list[T | None]:
+    """
+    Like asyncio.gather, but stop waiting at deadline.
+
+    Awaitables still running at the deadline are cancelled and their results
+    are None. If finished ones raised, the exception of the first in
+    argument order propagates.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=remaining(deadline))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    return [
+        task.result() if task in done and not task.cancelled() else None
+        for task in tasks
+    ]
@@ -10,6 +10,7 @@ from typing import TypeVar
 from langchain_core.runnables import RunnableConfig, ensure_config
 
 from langgraph_runner.config import settings
+from langgraph_runner.tiering import TierSetting
 
 GraphConfigType = TypeVar("GraphConfigType", bound="BaseGraphConfig")
 
@@ -30,6 +31,24 @@ class BaseGraphConfig:
         default=settings.DEFAULT_TEMPERATURE,
         metadata={"description": "Sampling temperature"},
     )
+    fast_model_id: str = field(
+        default=settings.FAST_MODEL_ID,
+        metadata={"description": "Model of the 'fast' tier"},
+    )
+    model_tier: TierSetting | None = field(
+        default=None,
+        metadata={
+            "description": "Per-request model tier, overriding the graph's. "
+            "None uses the graph's tier setting"
+        },
+    )
+    deadline: float | None = field(
+        default=None,
+        metadata={
+            "description": "time.monotonic() by which the request should be "
+            "answered. Nodes bound their work by it and degrade when it passes"
+        },
+    )
 
     @classmethod
     def from_runnable_config(
@@ -9,6 +9,9 @@ from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
+from langgraph_runner.progress import StreamEvent
+from langgraph_runner.tiering import TierSetting
+
 
 @dataclass
 class ChatRequest:
@@ -17,6 +20,10 @@ class ChatRequest:
     messages: list[dict[str, str]]
     model_id: str
     temperature: float = 0.0
+    # time.monotonic() by which to answer, degrading if needed. None for no limit
+    deadline: float | None = None
+    # Model tier for this request, overriding the graph's ("auto", "fast", "default")
+    model_tier: TierSetting | None = None
 
 
 @dataclass
@@ -52,6 +59,11 @@ class PregelRunner(Protocol):
         """Execute the graph asynchronously."""
         ...
 
+    async def awarmup(self) -> None:
+        """Create clients, open connections and load indexes ahead of the first
+        request. Call from the event loop that will serve requests."""
+        ...
+
     async def astream(
         self, request: ChatRequest, thread_id: str = "default"
     ) -> AsyncIterator[str]:
@@ -59,3 +71,11 @@ class PregelRunner(Protocol):
         raise NotImplementedError
         if False:
             yield {}
+
+    async def astream_events(
+        self, request: ChatRequest, thread_id: str = "default"
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream the answer as "token" events among progress events (progress.py)."""
+        raise NotImplementedError
+        if False:
+            yield {}
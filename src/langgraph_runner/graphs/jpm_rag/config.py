@@ -4,8 +4,17 @@ Configuration for JPM RAG graph.
 
 from dataclasses import dataclass, field
 
+from langchain_core.runnables import RunnableConfig
+
 from langgraph_runner.config import settings
+from langgraph_runner.deadline import remaining
 from langgraph_runner.graphs.base.config import BaseGraphConfig
+from langgraph_runner.graphs.jpm_rag.speculation import ReusePolicy
+from langgraph_runner.singleflight import normalize_query
+from langgraph_runner.tiering import TierSetting
+
+# Width of the remaining-time buckets that coalescing keys group deadlines by
+DEADLINE_BUCKET_S = 5.0
 
 
 @dataclass(kw_only=True)
@@ -16,3 +25,86 @@ class RAGGraphConfig(BaseGraphConfig):
         default_factory=lambda: settings.ROUTER_MODEL_ID,
     )
     classification_temperature: float = 0.0
+    fast_path_routing: bool = field(
+        default_factory=lambda: settings.RAG_FAST_PATH_ROUTING,
+        metadata={
+            "description": "Route unambiguous queries with local rules, "
+            "calling the classification LLM only for ambiguous ones"
+        },
+    )
+    learned_routing: bool = field(
+        default_factory=lambda: settings.RAG_LEARNED_ROUTING,
+        metadata={
+            "description": "Route with the embedding model trained on logged "
+            "LLM decisions when it is confident"
+        },
+    )
+    speculative_retrieval: bool = field(
+        default_factory=lambda: settings.RAG_SPECULATIVE_RETRIEVAL,
+        metadata={
+            "description": "Start retrieval for every source on the raw query "
+            "while the classification LLM is running"
+        },
+    )
+    speculative_reuse: ReusePolicy = field(
+        default_factory=lambda: settings.RAG_SPECULATIVE_REUSE,
+    )
+    context_packing: bool = field(
+        default_factory=lambda: settings.RAG_CONTEXT_PACKING,
+        metadata={
+            "description": "Merge overlapping chunks, drop near-duplicates and "
+            "fill the context token budget in score order"
+        },
+    )
+    context_token_budget: int | None = field(
+        default_factory=lambda: settings.RAG_CONTEXT_TOKEN_BUDGET,
+    )
+    batched_retrieval: bool = field(
+        default_factory=lambda: settings.RAG_BATCHED_RETRIEVAL,
+        metadata={
+            "description": "Embed all routed sub-queries in one request and "
+            "search concurrently before fanning out"
+        },
+    )
+    synthesis_tier: TierSetting = field(
+        default_factory=lambda: settings.RAG_SYNTHESIS_TIER,
+        metadata={
+            "description": "Synthesis model tier: 'auto' picks the fast model for "
+            "simple single-source questions"
+        },
+    )
+    hedge_requests: bool = field(
+        default_factory=lambda: settings.HEDGING,
+        metadata={
+            "description": "Duplicate classification and synthesis requests "
+            "that outlast the model's recent p95 latency"
+        },
+    )
+    classify_timeout: float | None = field(
+        default_factory=lambda: settings.RAG_CLASSIFY_TIMEOUT,
+        metadata={"description": "Max seconds for routing"},
+    )
+    retrieval_timeout: float | None = field(
+        default_factory=lambda: settings.RAG_RETRIEVAL_TIMEOUT,
+        metadata={"description": "Max seconds for each source's retrieval"},
+    )
+    synthesis_timeout: float | None = field(
+        default_factory=lambda: settings.RAG_SYNTHESIS_TIMEOUT,
+        metadata={"description": "Max seconds for synthesis"},
+    )
+
+
+def coalescing_key(query: str, config: RunnableConfig | None = None) -> tuple:
+    """
+    Key under which concurrent RAG requests share one execution.
+
+    The graph is stateless, so requests with the same normalized query and
+    graph config produce equivalent answers. Callers that join a run share the
+    deadline of the caller that started it, so the key holds the time left
+    rounded down to DEADLINE_BUCKET_S: a caller is never cut short by a much
+    tighter deadline, nor kept waiting past its own by a much looser one.
+    """
+    graph_config = RAGGraphConfig.from_runnable_config(config).to_dict()
+    budget = remaining(graph_config.pop("deadline"))
+    bucket = None if budget is None else int(budget // DEADLINE_BUCKET_S)
+    return (normalize_query(query), bucket, *sorted(graph_config.items()))
@@ -2,43 +2,74 @@
 Stateless RAG router graph.
 """
 
+import asyncio
 from functools import lru_cache
 
 from langgraph.graph import END, START, StateGraph
 
 from langgraph_runner.config import settings
 from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig
+from langgraph_runner.graphs.jpm_rag.learned_router import create_learned_router
 from langgraph_runner.graphs.jpm_rag.nodes.classify import create_classify_node
 from langgraph_runner.graphs.jpm_rag.nodes.retrieval import create_retrieval_nodes
 from langgraph_runner.graphs.jpm_rag.nodes.routing import route_to_sources
 from langgraph_runner.graphs.jpm_rag.nodes.synthesis import create_synthesis_node
-from langgraph_runner.graphs.jpm_rag.state import RAGGraphInputState, RAGGraphState
+from langgraph_runner.graphs.jpm_rag.rules import create_rule_router
+from langgraph_runner.graphs.jpm_rag.state import (
+    SOURCES,
+    RAGGraphInputState,
+    RAGGraphState,
+)
+from langgraph_runner.retrieval.adaptive import AdaptiveK
 from langgraph_runner.retrieval.retriever import FilteredRetriever
 from langgraph_runner.retrieval.vectorstore import create_vectorstore
+from langgraph_runner.routing import LearnedRouter, QueryRouter
 
 
 @lru_cache(maxsize=1)
 def _get_default_retriever() -> FilteredRetriever:
     """Lazily create default retriever."""
-    vectorstore = create_vectorstore(settings.CHROMA_DIR)
+    vectorstore = create_vectorstore(
+        settings.CHROMA_DIR,
+        partitions=SOURCES if settings.VECTORSTORE_PARTITIONED else None,
+    )
+    adaptive = None
+    if settings.RETRIEVAL_ADAPTIVE_K:
+        adaptive = AdaptiveK(
+            candidate_k=settings.RETRIEVAL_CANDIDATE_K,
+            max_relative_gap=settings.RETRIEVAL_MAX_RELATIVE_GAP,
+            token_budget=settings.RETRIEVAL_TOKEN_BUDGET,
+        )
     return FilteredRetriever(
         vectorstore,
         k=settings.RETRIEVAL_K,
         max_distance=settings.RETRIEVAL_MAX_DISTANCE,
+        adaptive=adaptive,
     )
 
 
-def build_graph(retriever: FilteredRetriever | None = None):
+def build_graph(
+    retriever: FilteredRetriever | None = None,
+    rule_router: QueryRouter | None = None,
+    learned_router: LearnedRouter | None = None,
+):
     """
     Build the stateless RAG router graph.
 
     Args:
         retriever: Optional retriever for testing. If None, uses default.
+        rule_router: Optional fast-path router. If None, uses the JPM rules.
+        learned_router: Optional embedding router. If None, uses the JPM model
+            with the retriever's embeddings.
     """
     if retriever is None:
         retriever = _get_default_retriever()
+    if rule_router is None:
+        rule_router = create_rule_router()
+    if learned_router is None and retriever.embeddings is not None:
+        learned_router = create_learned_router(retriever.embeddings)
 
-    classify = create_classify_node()
+    classify = create_classify_node(rule_router, learned_router, retriever)
     retrieve_forecast, retrieve_mid_year = create_retrieval_nodes(retriever)
     synthesize = create_synthesis_node()
 
@@ -59,7 +90,8 @@ def build_graph(retriever: FilteredRetriever | None = None):
     builder.add_edge("mid_year", "synthesize")
     builder.add_edge("synthesize", END)
 
-    graph = builder.compile()
+    # Stateless: don't inherit a checkpointer when run inside an agent's tool
+    graph = builder.compile(checkpointer=False)
     graph.name = "jpm_rag"
     return graph
 
@@ -68,3 +100,11 @@ def build_graph(retriever: FilteredRetriever | None = None):
 def get_graph():
     """Get the cached default graph instance."""
     return build_graph()
+
+
+async def awarmup_retriever(retriever: FilteredRetriever | None = None) -> None:
+    """Open the retriever (default if None) and warm its embeddings and index."""
+    if retriever is None:
+        # Opening Chroma / loading the NumPy store is blocking
+        retriever = await asyncio.to_thread(_get_default_retriever)
+    await retriever.awarmup()
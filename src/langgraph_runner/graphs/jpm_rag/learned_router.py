@@ -0,0 +1,30 @@
+"""
+Learned (embedding-based) router wiring for JPM RAG graph.
+"""
+
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.config import settings
+from langgraph_runner.graphs.jpm_rag.rules import create_rule_router
+from langgraph_runner.routing.learned import DecisionLog, LearnedRouter
+
+DECISION_LOG_PATH = settings.ROUTING_DIR / "jpm_rag_decisions.jsonl"
+ROUTER_MODEL_PATH = settings.ROUTING_DIR / "jpm_rag_router.npz"
+
+
+def create_decision_log() -> DecisionLog:
+    """Log of LLM routing decisions used as training data."""
+    return DecisionLog(DECISION_LOG_PATH)
+
+
+def create_learned_router(embeddings: Embeddings) -> LearnedRouter:
+    """Create the learned router for JPM documents."""
+    return LearnedRouter(
+        embeddings,
+        model_path=ROUTER_MODEL_PATH,
+        decision_log=(
+            create_decision_log() if settings.RAG_LOG_ROUTING_DECISIONS else None
+        ),
+        threshold=settings.RAG_LEARNED_ROUTING_THRESHOLD,
+        sub_query=create_rule_router().sub_query,
+    )
@@ -1,20 +1,49 @@
 """
 Classification node using structured output.
+
+Unambiguous queries are resolved by a local fast-path router, then by a learned
+embedding router when it is confident; the LLM is only called for the rest.
+Optionally, retrieval starts speculatively while the routers are running.
+
+Routing that overruns its timeout falls back to searching every source with
+the raw query. Classify also sets the retrieval deadline shared by batched
+prefetching and the retrieval nodes.
 """
 
+import asyncio
+import time
+from dataclasses import replace
 from typing import Literal, cast
 
 import structlog
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 
+from langgraph_runner.deadline import deadline_after, earliest, remaining
 from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig
+from langgraph_runner.graphs.jpm_rag.nodes.retrieval import (
+    DEADLINE_METRIC,
+    prefetch_classifications,
+)
 from langgraph_runner.graphs.jpm_rag.prompts import CLASSIFY_SYSTEM
-from langgraph_runner.graphs.jpm_rag.state import Classification, RAGGraphState
-from langgraph_runner.models import load_chat_model
+from langgraph_runner.graphs.jpm_rag.speculation import SpeculativeRetrieval
+from langgraph_runner.graphs.jpm_rag.state import (
+    SOURCES,
+    Classification,
+    RAGGraphState,
+    Source,
+)
+from langgraph_runner.metrics import metrics
+from langgraph_runner.models import load_chat_model, with_structured_output
+from langgraph_runner.progress import report_progress
+from langgraph_runner.retrieval.retriever import FilteredRetriever
+from langgraph_runner.routing import LearnedRouter, QueryRouter, RoutingDecision
 
 logger = structlog.stdlib.get_logger(__name__)
 
+FAST_PATH_METRIC = "rag.routing.fast_path"
+LEARNED_METRIC = "rag.routing.learned"
+
 
 class ClassificationSchema(BaseModel):
     """Schema for a single classification with retrieval-optimized query."""
@@ -39,34 +68,137 @@ class ClassificationResult(BaseModel):
     )
 
 
-def create_classify_node():
-    """Factory for classification node."""
-
-    async def classify(state: RAGGraphState, config: RunnableConfig) -> dict:
-        """Classify the query and determine which sources to search."""
-        cfg = RAGGraphConfig.from_runnable_config(config)
+def _to_classifications(decision: RoutingDecision) -> list[Classification]:
+    """Convert a local routing decision into state classifications."""
+    return [
+        Classification(source=cast(Source, source), query=query)
+        for source, query in decision.routes.items()
+    ]
+
+
+def create_classify_node(
+    rule_router: QueryRouter | None = None,
+    learned_router: LearnedRouter | None = None,
+    retriever: FilteredRetriever | None = None,
+):
+    """
+    Factory for classification node.
+
+    Args:
+        rule_router: Optional fast-path router tried before the LLM. Queries it
+            cannot resolve unambiguously fall back to the classification LLM.
+        learned_router: Optional embedding router tried after the rules. LLM
+            decisions are recorded to it as training data.
+        retriever: Optional retriever used for speculative and batched
+            retrieval when enabled in the graph config.
+    """
+
+    async def classify_with_llm(
+        query: str, cfg: RAGGraphConfig
+    ) -> list[Classification]:
+        """Classify the query with the structured-output classification LLM."""
         llm = load_chat_model(
-            cfg.classification_model_id, temperature=cfg.classification_temperature
+            cfg.classification_model_id,
+            temperature=cfg.classification_temperature,
+            hedge=cfg.hedge_requests,
         )
 
         result = cast(
             ClassificationResult,
-            await llm.with_structured_output(ClassificationResult).ainvoke([
+            await with_structured_output(llm, ClassificationResult).ainvoke([
                 {"role": "system", "content": CLASSIFY_SYSTEM},
-                {"role": "user", "content": state.query},
+                {"role": "user", "content": query},
             ]),
         )
 
         # Convert schema to state dataclass
-        classifications = [
+        return [
             Classification(source=c.source, query=c.query)
             for c in result.classifications
         ]
 
+    async def classify(state: RAGGraphState, config: RunnableConfig) -> dict:
+        """Classify the query and determine which sources to search."""
+        cfg = RAGGraphConfig.from_runnable_config(config)
+        routing_deadline = earliest(deadline_after(cfg.classify_timeout), cfg.deadline)
+
+        decision = None
+        if rule_router is not None and cfg.fast_path_routing:
+            decision = await rule_router.aroute(state.query)
+            metrics.incr(f"{FAST_PATH_METRIC}.{'hit' if decision else 'miss'}")
+
+        # Rules resolve instantly; only speculate while slower routers run
+        speculation = None
+        if decision is None and retriever is not None and cfg.speculative_retrieval:
+            speculation = SpeculativeRetrieval(retriever, state.query)
+
+        try:
+            try:
+                async with asyncio.timeout(remaining(routing_deadline)):
+                    if (
+                        decision is None
+                        and learned_router is not None
+                        and cfg.learned_routing
+                    ):
+                        decision = await learned_router.aroute(state.query)
+                        metrics.incr(
+                            f"{LEARNED_METRIC}.{'hit' if decision else 'miss'}"
+                        )
+
+                    if decision is not None:
+                        router = decision.router
+                        classifications = _to_classifications(decision)
+                    else:
+                        router = "llm"
+                        start = time.perf_counter()
+                        classifications = await classify_with_llm(state.query, cfg)
+                        if learned_router is not None:
+                            await learned_router.arecord(
+                                state.query,
+                                [c.source for c in classifications],
+                                llm_latency_ms=(time.perf_counter() - start) * 1000,
+                            )
+            except TimeoutError:
+                # Searching everything is slower to synthesize but never misroutes
+                router = "timeout"
+                classifications = [
+                    Classification(source=source, query=state.query)
+                    for source in SOURCES
+                ]
+                metrics.incr(f"{DEADLINE_METRIC}.classify")
+                await logger.awarning("classification_timed_out", query=state.query)
+            report_progress(
+                "classified",
+                sources=[c.source for c in classifications],
+                router=router,
+            )
+
+            retrieval_deadline = earliest(
+                deadline_after(cfg.retrieval_timeout), cfg.deadline
+            )
+            classifications = [
+                replace(c, deadline=retrieval_deadline) for c in classifications
+            ]
+            if speculation is not None:
+                classifications = await speculation.aresolve(
+                    classifications, cfg.speculative_reuse, retrieval_deadline
+                )
+        finally:
+            if speculation is not None:
+                speculation.cancel()
+
+        if retriever is not None and cfg.batched_retrieval:
+            classifications = await prefetch_classifications(
+                retriever, classifications, retrieval_deadline
+            )
+
         await logger.adebug(
             "classification_result",
+            router=router,
             sources=[c.source for c in classifications],
             sub_queries={c.source: c.query for c in classifications},
+            fast_path_hit_rate=metrics.hit_rate(FAST_PATH_METRIC),
+            learned_hit_rate=metrics.hit_rate(LEARNED_METRIC),
         )
 
         return {"classifications": classifications}
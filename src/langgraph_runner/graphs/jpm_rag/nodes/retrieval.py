@@ -1,21 +1,69 @@
 """
 Retrieval node implementations for Send pattern.
+
+Each source's retrieval is bounded by the deadline classify sets for it; a
+source that misses it yields a timed-out result and synthesis proceeds
+without it.
 """
 
-from typing import TypedDict
+import asyncio
+from dataclasses import replace
+from typing import NotRequired, TypedDict
 
 import structlog
+from langchain_core.documents import Document
 
-from langgraph_runner.graphs.jpm_rag.state import RetrievalResult
+from langgraph_runner.deadline import remaining
+from langgraph_runner.graphs.jpm_rag.state import (
+    Classification,
+    RetrievalResult,
+    Source,
+)
+from langgraph_runner.metrics import metrics
+from langgraph_runner.progress import report_progress
 from langgraph_runner.retrieval.retriever import FilteredRetriever
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Counted per step: "<metric>.classify", ".forecast", ".mid_year", ".synthesize"
+DEADLINE_METRIC = "rag.deadline_exceeded"
+
 
 class RetrievalInput(TypedDict):
     """Input from Send - contains the query for this retrieval."""
 
     query: str
+    # Results already retrieved speculatively for this query
+    prefetched: NotRequired[list[tuple[Document, float]]]
+    # time.monotonic() by which retrieval must finish
+    deadline: NotRequired[float]
+
+
+async def prefetch_classifications(
+    retriever: FilteredRetriever,
+    classifications: list[Classification],
+    deadline: float | None = None,
+) -> list[Classification]:
+    """
+    Retrieve for all classifications without results in one batched call.
+
+    Sub-queries share a single embeddings request and their searches run
+    concurrently; the retrieval nodes then reuse the prefetched results.
+    Classifications whose search misses the deadline are returned unchanged.
+    """
+    pending = [c for c in classifications if c.prefetched is None]
+    if not pending:
+        return classifications
+
+    results = iter(
+        await retriever.retrieve_many(
+            [(c.query, c.source) for c in pending], deadline=deadline
+        )
+    )
+    return [
+        c if c.prefetched is not None else replace(c, prefetched=next(results))
+        for c in classifications
+    ]
 
 
 def create_retrieval_nodes(retriever: FilteredRetriever):
@@ -25,17 +73,37 @@ def create_retrieval_nodes(retriever: FilteredRetriever):
     Returns tuple of (retrieve_forecast, retrieve_mid_year).
     """
 
-    async def retrieve_forecast(state: RetrievalInput) -> dict:
-        """Retrieve from forecast document only."""
+    async def retrieve(state: RetrievalInput, source: Source) -> dict:
+        """Retrieve from a single source, reusing prefetched results if present."""
         query = state["query"]
-        await logger.adebug("retrieval_query", doc_type="forecast", query=query)
-        results_with_scores = await retriever.retrieve_with_scores(
-            query, doc_type="forecast"
+        prefetched = state.get("prefetched")
+        await logger.adebug(
+            "retrieval_query",
+            doc_type=source,
+            query=query,
+            prefetched=prefetched is not None,
         )
+        if prefetched is not None:
+            results_with_scores = prefetched
+        else:
+            try:
+                async with asyncio.timeout(remaining(state.get("deadline"))):
+                    results_with_scores = await retriever.retrieve_with_scores(
+                        query, doc_type=source
+                    )
+            except TimeoutError:
+                metrics.incr(f"{DEADLINE_METRIC}.{source}")
+                await logger.awarning("retrieval_timed_out", doc_type=source)
+                report_progress("retrieved", source=source, chunks=0, timed_out=True)
+                return {
+                    "results": [
+                        RetrievalResult(source=source, documents=[], timed_out=True)
+                    ]
+                }
         docs = [doc for doc, _ in results_with_scores]
         await logger.adebug(
             "retrieval_results",
-            doc_type="forecast",
+            doc_type=source,
             num_chunks=len(docs),
             pages=[
                 doc.metadata.get("page_number", doc.metadata.get("page"))
@@ -43,26 +111,23 @@ def create_retrieval_nodes(retriever: FilteredRetriever):
             ],
             distances=[round(score, 3) for _, score in results_with_scores],
         )
-        return {"results": [RetrievalResult(source="forecast", documents=docs)]}
+        report_progress("retrieved", source=source, chunks=len(docs), timed_out=False)
+        return {
+            "results": [
+                RetrievalResult(
+                    source=source,
+                    documents=docs,
+                    distances=[score for _, score in results_with_scores],
+                )
+            ]
+        }
+
+    async def retrieve_forecast(state: RetrievalInput) -> dict:
+        """Retrieve from forecast document only."""
+        return await retrieve(state, "forecast")
 
     async def retrieve_mid_year(state: RetrievalInput) -> dict:
         """Retrieve from mid-year document only."""
-        query = state["query"]
-        await logger.adebug("retrieval_query", doc_type="mid_year", query=query)
-        results_with_scores = await retriever.retrieve_with_scores(
-            query, doc_type="mid_year"
-        )
-        docs = [doc for doc, _ in results_with_scores]
-        await logger.adebug(
-            "retrieval_results",
-            doc_type="mid_year",
-            num_chunks=len(docs),
-            pages=[
-                doc.metadata.get("page_number", doc.metadata.get("page"))
-                for doc in docs
-            ],
-            distances=[round(score, 3) for _, score in results_with_scores],
-        )
-        return {"results": [RetrievalResult(source="mid_year", documents=docs)]}
+        return await retrieve(state, "mid_year")
 
     return retrieve_forecast, retrieve_mid_year
@@ -9,4 +9,12 @@ from langgraph_runner.graphs.jpm_rag.state import RAGGraphState
 
 def route_to_sources(state: RAGGraphState) -> list[Send]:
     """Fan out to sources based on classifications."""
-    return [Send(c.source, {"query": c.query}) for c in state.classifications]
+    sends = []
+    for c in state.classifications:
+        payload: dict = {"query": c.query}
+        if c.prefetched is not None:
+            payload["prefetched"] = c.prefetched
+        if c.deadline is not None:
+            payload["deadline"] = c.deadline
+        sends.append(Send(c.source, payload))
+    return sends
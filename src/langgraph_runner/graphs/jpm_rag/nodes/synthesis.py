@@ -1,14 +1,34 @@
 """
 Synthesis node.
+
+Retrieved chunks are packed (merged, deduplicated and fitted to a token
+budget) before being formatted into the synthesis prompt. Sources whose
+retrieval timed out are named in the prompt so the answer says what it is
+missing, and an answer still generating at the deadline is returned as far
+as it got. The synthesis model is picked by the tiering policy.
 """
 
+import asyncio
+from dataclasses import asdict
+
 import structlog
 from langchain_core.runnables import RunnableConfig
 
+from langgraph_runner.deadline import deadline_after, earliest, remaining
 from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig
-from langgraph_runner.graphs.jpm_rag.prompts import build_synthesis_messages
+from langgraph_runner.graphs.jpm_rag.nodes.retrieval import DEADLINE_METRIC
+from langgraph_runner.graphs.jpm_rag.prompts import (
+    TIMED_OUT_ANSWER,
+    TRUNCATED_NOTE,
+    build_synthesis_messages,
+)
 from langgraph_runner.graphs.jpm_rag.state import RAGGraphState
+from langgraph_runner.metrics import metrics
 from langgraph_runner.models import load_chat_model
+from langgraph_runner.progress import report_progress
+from langgraph_runner.retrieval.packing import ScoredChunk, pack_context
+from langgraph_runner.tiering import TierSignals, select_model
+from langgraph_runner.tokens import document_tokens
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -19,32 +39,91 @@ def create_synthesis_node():
     async def synthesize_node(state: RAGGraphState, config: RunnableConfig) -> dict:
         """Generate a cited answer from retrieved documents."""
         cfg = RAGGraphConfig.from_runnable_config(config)
-        llm = load_chat_model(cfg.model_id, temperature=cfg.temperature)
+
+        chunks = [
+            ScoredChunk(
+                document=doc,
+                # Fall back to retrieval order when distances are missing
+                distance=(
+                    result.distances[i] if i < len(result.distances) else float(i)
+                ),
+                source=result.source,
+            )
+            for result in state.results
+            for i, doc in enumerate(result.documents)
+        ]
+        if cfg.context_packing:
+            chunks, report = pack_context(chunks, cfg.context_token_budget)
+            metrics.observe("rag.context.tokens_saved", report.tokens_saved)
+            await logger.adebug(
+                "context_packed",
+                input_chunks=report.input_chunks,
+                output_chunks=report.output_chunks,
+                merged=report.merged,
+                duplicates=report.duplicates,
+                over_budget=report.over_budget,
+                input_tokens=report.input_tokens,
+                output_tokens=report.output_tokens,
+                tokens_saved=report.tokens_saved,
+            )
 
         # Collect documents by source
-        forecast_docs = []
-        mid_year_docs = []
-        for result in state.results:
-            if result.source == "forecast":
-                forecast_docs.extend(result.documents)
-            elif result.source == "mid_year":
-                mid_year_docs.extend(result.documents)
+        forecast_docs = [c.document for c in chunks if c.source == "forecast"]
+        mid_year_docs = [c.document for c in chunks if c.source == "mid_year"]
+
+        missing_sources = [r.source for r in state.results if r.timed_out]
+
+        signals = TierSignals.from_query(
+            state.query,
+            context_tokens=sum(document_tokens(c.document) for c in chunks),
+            sources=len(state.results),
+        )
+        decision = select_model(
+            cfg.model_tier or cfg.synthesis_tier,
+            cfg.model_id,
+            cfg.fast_model_id,
+            signals,
+        )
+        await logger.ainfo(
+            "model_tier_selected",
+            node="synthesize",
+            tier=decision.tier,
+            model_id=decision.model_id,
+            reason=decision.reason,
+            **asdict(signals),
+        )
+        llm = load_chat_model(
+            decision.model_id, temperature=cfg.temperature, hedge=cfg.hedge_requests
+        )
 
         await logger.adebug(
             "synthesis_input",
             query=state.query,
             forecast_chunks=len(forecast_docs),
             mid_year_chunks=len(mid_year_docs),
+            missing_sources=missing_sources,
         )
 
-        messages = build_synthesis_messages(state.query, forecast_docs, mid_year_docs)
-        response = await llm.ainvoke(messages)
-
-        await logger.adebug(
-            "synthesis_output",
-            answer_preview=response.content[:200] if response.content else "",
+        messages = build_synthesis_messages(
+            state.query, forecast_docs, mid_year_docs, missing_sources
+        )
+        deadline = earliest(deadline_after(cfg.synthesis_timeout), cfg.deadline)
+        report_progress(
+            "synthesis_started", model_id=decision.model_id, tier=decision.tier
         )
+        answer = ""
+        try:
+            async with asyncio.timeout(remaining(deadline)):
+                # Streamed so that a timeout keeps what was generated
+                async for chunk in llm.astream(messages, config):
+                    answer += chunk.text
+        except TimeoutError:
+            metrics.incr(f"{DEADLINE_METRIC}.synthesize")
+            await logger.awarning("synthesis_timed_out", partial_chars=len(answer))
+            answer = answer + TRUNCATED_NOTE if answer else TIMED_OUT_ANSWER
+
+        await logger.adebug("synthesis_output", answer_preview=answer[:200])
 
-        return {"answer": response.content}
+        return {"answer": answer}
 
     return synthesize_node
@@ -2,8 +2,12 @@
 All prompts for JPM RAG graph.
 """
 
+from collections.abc import Collection
+
 from langchain_core.documents import Document
 
+from langgraph_runner.graphs.jpm_rag.state import Source
+
 CLASSIFY_SYSTEM = """You are a document routing expert for J.P. Morgan investment analysis.
 
 Determine which document sources to search.
@@ -66,6 +70,11 @@ RESPONSE GUIDELINES:
 """
 
 
+# Answers when synthesis runs out of time, with and without a partial answer
+TIMED_OUT_ANSWER = "Sorry, I couldn't answer within the time limit. Please try again."
+TRUNCATED_NOTE = "\n\n_(Answer cut short: the time limit was reached.)_"
+
+
 def _format_documents(docs: list[Document], source_name: str) -> str:
     """Format documents for prompt."""
     if not docs:
@@ -79,22 +88,42 @@ def _format_documents(docs: list[Document], source_name: str) -> str:
     return "\n\n---\n\n".join(formatted)
 
 
+def _missing_source_note(source_name: str) -> str:
+    return (
+        f"{source_name} could not be searched in time. Tell the user in one "
+        f"sentence that this answer does not cover {source_name}; do not "
+        "imply it has no relevant content."
+    )
+
+
 def build_synthesis_messages(
     query: str,
     forecast_docs: list[Document],
     mid_year_docs: list[Document],
+    missing_sources: Collection[Source] = (),
 ) -> list[dict]:
-    """Build messages for synthesis LLM call."""
+    """
+    Build messages for synthesis LLM call.
+
+    missing_sources are sources that were queried but timed out; the answer
+    is asked to say which are missing.
+    """
     parts = [f"Question: {query}\n"]
 
-    if forecast_docs:
+    if forecast_docs or "forecast" in missing_sources:
         parts.append("## Outlook 2025 (Predictions)")
-        parts.append(_format_documents(forecast_docs, "Outlook 2025"))
+        if "forecast" in missing_sources:
+            parts.append(_missing_source_note("Outlook 2025"))
+        else:
+            parts.append(_format_documents(forecast_docs, "Outlook 2025"))
         parts.append("")
 
-    if mid_year_docs:
+    if mid_year_docs or "mid_year" in missing_sources:
         parts.append("## Mid-Year Outlook 2025 (Actual Results)")
-        parts.append(_format_documents(mid_year_docs, "Mid-Year Outlook"))
+        if "mid_year" in missing_sources:
+            parts.append(_missing_source_note("Mid-Year Outlook"))
+        else:
+            parts.append(_format_documents(mid_year_docs, "Mid-Year Outlook"))
         parts.append("")
 
     return [
@@ -0,0 +1,67 @@
+"""
+Lexical routing rules for JPM RAG graph.
+
+Mirrors the routing rules in CLASSIFY_SYSTEM so unambiguous queries can be
+routed without the classification LLM call.
+"""
+
+from langgraph_runner.routing.rules import RoutingRule, RuleRouter
+
+# "Mid-Year Outlook 2025" must not match the forecast document reference
+_NOT_MID_YEAR = r"(?<!mid-year )(?<!mid year )(?<!midyear )"
+
+ROUTING_RULES = [
+    # RULE 1 - Explicit document reference (highest priority)
+    RoutingRule(
+        name="explicit_forecast",
+        sources=frozenset({"forecast"}),
+        patterns=(
+            rf"{_NOT_MID_YEAR}\boutlook 2025\b",
+            # Only the capitalised title: "the outlook for equities" is generic
+            r"(?-i:\bthe Outlook\b)",
+            r"\baccording to (the )?outlook\b",
+        ),
+        priority=0,
+        strip_from_query=True,
+    ),
+    RoutingRule(
+        name="explicit_mid_year",
+        sources=frozenset({"mid_year"}),
+        # "actual results" is left to the comparison/implicit tiers so that
+        # "predictions vs actual results" still routes to both sources
+        patterns=(r"\bmid[- ]?year( outlook( 2025)?)?\b",),
+        priority=0,
+        strip_from_query=True,
+    ),
+    # RULE 2 - Explicit comparison of predictions vs actuals
+    RoutingRule(
+        name="comparison",
+        sources=frozenset({"forecast", "mid_year"}),
+        patterns=(
+            r"^(?=.*\b(compar\w*|versus|vs)\b)"
+            r"(?=.*\b(predict\w*|forecast\w*|expect\w*)\b)"
+            r"(?=.*\b(actual\w*|results?|happened|perform\w*|reality)\b)",
+        ),
+        priority=1,
+    ),
+    # RULE 3 - Implicit routing (no document mentioned)
+    RoutingRule(
+        name="implicit_forecast",
+        sources=frozenset({"forecast"}),
+        patterns=(r"\b(predict\w*|forecast\w*|expect\w*|projected)\b",),
+        priority=2,
+    ),
+    RoutingRule(
+        name="implicit_mid_year",
+        sources=frozenset({"mid_year"}),
+        patterns=(
+            r"\b(actual(ly)?|results?|happened|performed|so far|year[- ]to[- ]date)\b",
+        ),
+        priority=2,
+    ),
+]
+
+
+def create_rule_router() -> RuleRouter:
+    """Create the fast-path router for JPM documents."""
+    return RuleRouter(ROUTING_RULES)
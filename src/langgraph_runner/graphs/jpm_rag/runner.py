@@ -2,15 +2,25 @@
 Runner for direct JPM RAG graph invocation.
 """
 
+import asyncio
 from collections.abc import AsyncIterator
+from typing import Any, cast
 
+from langchain_core.messages import BaseMessage
 from langchain_core.runnables import RunnableConfig
 
+from langgraph_runner.cancellation import closing_stream
+from langgraph_runner.config import settings
 from langgraph_runner.graphs.base.runner import ChatRequest, ChatResponse, PregelRunner
-from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig
-from langgraph_runner.graphs.jpm_rag.graph import build_graph
+from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig, coalescing_key
+from langgraph_runner.graphs.jpm_rag.graph import awarmup_retriever, build_graph
 from langgraph_runner.graphs.jpm_rag.state import RAGGraphInputState
+from langgraph_runner.models import model_pool
+from langgraph_runner.progress import StreamEvent, StreamTimer
 from langgraph_runner.retrieval.retriever import FilteredRetriever
+from langgraph_runner.singleflight import SingleFlight
+
+COALESCING_METRIC = "rag.runner.coalesced"
 
 
 class JPMRagRunner(PregelRunner):
@@ -18,20 +28,30 @@ class JPMRagRunner(PregelRunner):
     Runner for direct RAG graph invocation (no agent wrapper).
 
     Use this when you want simple query -> answer without conversation.
+    Because the graph keeps no per-thread state, concurrent async requests
+    with the same normalized query and config share one execution
+    (RAG_SINGLE_FLIGHT), and every streaming caller receives the full stream.
     """
 
     def __init__(self, retriever: FilteredRetriever | None = None):
+        self._retriever = retriever
         self._graph = build_graph(retriever)
+        self._flight = SingleFlight(COALESCING_METRIC)
 
     @property
     def name(self) -> str:
         return self._graph.name
 
+    async def awarmup(self) -> None:
+        await asyncio.gather(model_pool.aprewarm(), awarmup_retriever(self._retriever))
+
     def _build_runnable_config(self, request: ChatRequest) -> RunnableConfig:
         """Build RunnableConfig from ChatRequest."""
         config = RAGGraphConfig(
             model_id=request.model_id,
             temperature=request.temperature,
+            deadline=request.deadline,
+            model_tier=request.model_tier,
         )
         return RunnableConfig(configurable=config.to_dict())
 
@@ -56,23 +76,75 @@ class JPMRagRunner(PregelRunner):
     ) -> ChatResponse:
         input_state = self._build_input_state(request)
         config = self._build_runnable_config(request)
-        result = await self._graph.ainvoke(input_state, config=config)
-        return ChatResponse(content=result["answer"])
+
+        async def run() -> ChatResponse:
+            result = await self._graph.ainvoke(input_state, config=config)
+            return ChatResponse(content=result["answer"])
+
+        if not settings.RAG_SINGLE_FLIGHT:
+            return await run()
+        return await self._flight.do(
+            ("invoke", *coalescing_key(input_state.query, config)), run
+        )
 
     async def astream(
         self, request: ChatRequest, thread_id: str = "default"
     ) -> AsyncIterator[str]:
+        async with closing_stream(self.astream_events(request, thread_id)) as events:
+            async for event in events:
+                if event.type == "token":
+                    yield event.data["content"]
+
+    async def astream_events(
+        self, request: ChatRequest, thread_id: str = "default"
+    ) -> AsyncIterator[StreamEvent]:
         input_state = self._build_input_state(request)
         config = self._build_runnable_config(request)
+        if settings.RAG_SINGLE_FLIGHT:
+            # Coalesced callers get the shared run's events, timed from its start
+            events = self._flight.stream(
+                ("stream", *coalescing_key(input_state.query, config)),
+                lambda: self._astream_events(input_state, config),
+            )
+        else:
+            events = self._astream_events(input_state, config)
+        # Closing early (the caller left) stops the graph at once
+        async with closing_stream(events):
+            async for event in events:
+                yield event
 
-        async for msg_chunk, metadata in self._graph.astream(
-            input_state, config, stream_mode="messages"
-        ):
-            # Only stream from the synthesis node, skip classify and retrieval nodes
-            node_name = metadata.get("langgraph_node", "")  # type: ignore[union-attr]
-            if node_name != "synthesize":
-                continue
-            # msg_chunk is an AIMessageChunk with .content attribute
-            content = getattr(msg_chunk, "content", "")
-            if content:
-                yield content
+    async def _astream_events(
+        self, input_state: RAGGraphInputState, config: RunnableConfig
+    ) -> AsyncIterator[StreamEvent]:
+        timer = StreamTimer(self.name)
+        streamed = ""
+        stream = self._graph.astream(
+            input_state, config, stream_mode=["messages", "updates", "custom"]
+        )
+        async with closing_stream(stream):
+            async for mode, data in stream:
+                if mode == "custom":
+                    # Progress reported by a node (see progress.py)
+                    yield timer.progress(data)
+                    continue
+                if mode == "updates":
+                    # Text the synthesis node added without the LLM, e.g. a note
+                    # that the answer was cut short by the deadline
+                    updates = cast(dict[str, dict[str, Any] | None], data)
+                    answer = (updates.get("synthesize") or {}).get("answer", "")
+                    if answer.startswith(streamed) and len(answer) > len(streamed):
+                        for event in timer.tokens(answer[len(streamed) :]):
+                            yield event
+                    continue
+                msg_chunk, metadata = cast(tuple[BaseMessage, dict[str, Any]], data)
+                # Only stream from the synthesis node, skip classify and retrieval nodes
+                node_name = metadata.get("langgraph_node", "")
+                if node_name != "synthesize":
+                    continue
+                # msg_chunk is an AIMessageChunk with .content attribute
+                content = getattr(msg_chunk, "content", "")
+                if content:
+                    streamed += content
+                    for event in timer.tokens(content):
+                        yield event
+        yield timer.summary()
@@ -37,8 +37,15 @@ def main():
     logger.info("setup_started", graph="jpm_rag")
     logger.info("loading_documents", source_dir=str(settings.PDF_DIR))
 
+    # One collection per doc_type when partitioned
+    partitions = None
+    if settings.VECTORSTORE_PARTITIONED:
+        partitions = sorted({meta["doc_type"] for meta in DOCUMENT_CATALOG.values()})
+
     processor = UnstructuredProcessor(strategy="hi_res")
-    vectorstore = create_vectorstore(settings.CHROMA_DIR)
+    vectorstore = create_vectorstore(
+        settings.CHROMA_DIR, backend="chroma", partitions=partitions
+    )
     service = IngestionService(processor, vectorstore)
 
     total = service.ingest_directory(settings.PDF_DIR, DOCUMENT_CATALOG)
@@ -46,6 +53,7 @@ def main():
         "setup_complete",
         total_chunks=total,
         chroma_dir=str(settings.CHROMA_DIR),
+        partitions=partitions,
     )
 
 
@@ -0,0 +1,135 @@
+"""
+Speculative retrieval for JPM RAG graph.
+
+Starts retrieval for every source on the raw query while the router is still
+deciding, so vector search latency hides behind the classification LLM call.
+"""
+
+import asyncio
+from collections.abc import Collection
+from dataclasses import replace
+from typing import Literal
+
+import structlog
+from langchain_core.documents import Document
+
+from langgraph_runner.deadline import remaining
+from langgraph_runner.graphs.jpm_rag.state import SOURCES, Classification, Source
+from langgraph_runner.metrics import metrics
+from langgraph_runner.retrieval.retriever import FilteredRetriever
+from langgraph_runner.routing import keyword_query
+
+logger = structlog.stdlib.get_logger(__name__)
+
+SPECULATION_METRIC = "rag.retrieval.speculative"
+
+# "match": reuse when the routed sub-query is mostly the raw query's keywords.
+# "always": reuse whenever the source was selected.
+ReusePolicy = Literal["match", "always"]
+
+# Share of the smaller keyword set the two queries must have in common. The
+# router rewrites queries (drops filler, adds a year or "outlook"), so an exact
+# match is rare even when both would retrieve the same chunks.
+MIN_KEYWORD_OVERLAP = 0.5
+
+
+def _keywords(query: str) -> set[str]:
+    return set(keyword_query(query).casefold().split())
+
+
+def keyword_overlap(a: str, b: str) -> float:
+    """Overlap coefficient of two queries' keyword sets."""
+    a_keywords, b_keywords = _keywords(a), _keywords(b)
+    smaller = min(len(a_keywords), len(b_keywords))
+    if not smaller:
+        return 1.0
+    return len(a_keywords & b_keywords) / smaller
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    """Mark a discarded task's exception as retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+class SpeculativeRetrieval:
+    """In-flight retrievals for every source, resolved against the routing."""
+
+    def __init__(
+        self,
+        retriever: FilteredRetriever,
+        query: str,
+        sources: tuple[Source, ...] = SOURCES,
+    ):
+        self._query = query
+        self._tasks: dict[str, asyncio.Task[list[tuple[Document, float]]]] = {}
+        for source in sources:
+            task = asyncio.create_task(
+                retriever.retrieve_with_scores(query, doc_type=source)
+            )
+            task.add_done_callback(_consume_result)
+            self._tasks[source] = task
+
+    async def aresolve(
+        self,
+        classifications: list[Classification],
+        policy: ReusePolicy,
+        deadline: float | None = None,
+    ) -> list[Classification]:
+        """
+        Attach reusable speculative results and cancel the rest.
+
+        Classifications whose results are not reused (or not ready by the
+        deadline) are returned unchanged, so the retrieval node runs the
+        routed sub-query as usual.
+        """
+        reuse = {
+            c.source
+            for c in classifications
+            if c.source in self._tasks
+            and (
+                policy == "always"
+                or keyword_overlap(c.query, self._query) >= MIN_KEYWORD_OVERLAP
+            )
+        }
+        selected = {c.source for c in classifications}
+        self.cancel(keep=reuse)
+
+        tasks = {s: self._tasks[s] for s in reuse}
+        if tasks:
+            # Ones still running at the deadline are cancelled by the caller
+            await asyncio.wait(tasks.values(), timeout=remaining(deadline))
+        results = {
+            s: task.result()
+            for s, task in tasks.items()
+            if task.done() and not task.cancelled() and task.exception() is None
+        }
+
+        resolved = []
+        for c in classifications:
+            result = results.get(c.source)
+            if isinstance(result, list):
+                metrics.incr(f"{SPECULATION_METRIC}.hit")
+                resolved.append(replace(c, prefetched=result))
+            else:
+                metrics.incr(f"{SPECULATION_METRIC}.miss")
+                resolved.append(c)
+        metrics.incr(
+            f"{SPECULATION_METRIC}.cancelled",
+            len(self._tasks.keys() - selected),
+        )
+
+        await logger.adebug(
+            "speculative_retrieval_resolved",
+            reused=sorted(s for s, r in results.items() if isinstance(r, list)),
+            rerun=sorted(selected - reuse),
+            cancelled=sorted(self._tasks.keys() - selected),
+            hit_rate=metrics.hit_rate(SPECULATION_METRIC),
+        )
+        return resolved
+
+    def cancel(self, keep: Collection[str] = frozenset()) -> None:
+        """Cancel speculative retrievals that are no longer needed."""
+        for source, task in self._tasks.items():
+            if source not in keep:
+                task.cancel()
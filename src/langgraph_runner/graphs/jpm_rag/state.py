@@ -7,25 +7,36 @@ Uses Send API pattern with Classification and RetrievalResult.
 
 import operator
 from dataclasses import dataclass, field
-from typing import Annotated, Literal
+from typing import Annotated, Literal, get_args
 
 from langchain_core.documents import Document
 
+Source = Literal["forecast", "mid_year"]
+SOURCES: tuple[Source, ...] = get_args(Source)
+
 
 @dataclass
 class Classification:
     """A routing decision for a specific source."""
 
-    source: Literal["forecast", "mid_year"]
+    source: Source
     query: str
+    # (document, distance) pairs already retrieved speculatively for this query
+    prefetched: list[tuple[Document, float]] | None = None
+    # time.monotonic() by which retrieval must finish, or the source is skipped
+    deadline: float | None = None
 
 
 @dataclass
 class RetrievalResult:
     """Result from a retrieval node."""
 
-    source: Literal["forecast", "mid_year"]
+    source: Source
     documents: list[Document]
+    # Distance per document (lower = more similar), used to rank context
+    distances: list[float] = field(default_factory=list)
+    # Retrieval missed its deadline, so documents is empty
+    timed_out: bool = False
 
 
 @dataclass
@@ -2,14 +2,39 @@
 Expose JPM RAG graph as a tool for composition.
 """
 
+import asyncio
+import weakref
+
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 
-from langgraph_runner.graphs.jpm_rag.graph import get_graph
+from langgraph_runner.config import settings
+from langgraph_runner.graphs.jpm_rag.config import coalescing_key
+from langgraph_runner.graphs.jpm_rag.graph import awarmup_retriever, get_graph
 from langgraph_runner.graphs.jpm_rag.state import RAGGraphInputState
+from langgraph_runner.singleflight import SingleFlight
+
+COALESCING_METRIC = "rag.tool.coalesced"
+
+# Shared by every agent using the tool: concurrent identical searches (e.g.
+# many users asking the same question) run the RAG graph once. One per event
+# loop, since in-flight searches are tasks bound to the loop that started them.
+_flights: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SingleFlight] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _flight() -> SingleFlight:
+    """Single-flight group of the running loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    flight = _flights.get(loop)
+    if flight is None:
+        flight = _flights[loop] = SingleFlight(COALESCING_METRIC)
+    return flight
 
 
 @tool
-async def search_jpm_documents(query: str) -> str:
+async def search_jpm_documents(query: str, config: RunnableConfig) -> str:
     """Search J.P. Morgan Outlook and Mid-Year documents.
 
     Use this tool to find information about:
@@ -24,5 +49,22 @@ async def search_jpm_documents(query: str) -> str:
     Returns:
         A synthesized answer with citations from the relevant documents.
     """
-    result = await get_graph().ainvoke(RAGGraphInputState(query=query))
-    return result["answer"]
+
+    # The caller's config carries model settings and callbacks, so the RAG
+    # graph uses the agent's model and deadline, and its tokens reach the
+    # agent's stream.
+    # A coalesced call streams only to the caller that started it; the others
+    # get the finished answer.
+    async def run() -> str:
+        result = await get_graph().ainvoke(RAGGraphInputState(query=query), config)
+        return result["answer"]
+
+    if not settings.RAG_SINGLE_FLIGHT:
+        return await run()
+    return await _flight().do(coalescing_key(query, config), run)
+
+
+async def awarmup_search_tool() -> None:
+    """Build the RAG graph behind the tool and warm its retriever."""
+    await asyncio.to_thread(get_graph)
+    await awarmup_retriever()
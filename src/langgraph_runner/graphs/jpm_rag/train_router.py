@@ -0,0 +1,121 @@
+"""
+Offline training and evaluation for the JPM RAG learned router.
+
+Trains a nearest-centroid model on logged LLM routing decisions and reports
+agreement with the LLM router and the latency it would save. Decisions are
+only logged with RAG_LOG_ROUTING_DECISIONS enabled, as the log keeps raw
+queries.
+
+Usage:
+    python -m langgraph_runner.graphs.jpm_rag.train_router train
+    python -m langgraph_runner.graphs.jpm_rag.train_router evaluate
+"""
+
+import argparse
+import random
+from dataclasses import asdict
+
+import structlog
+
+from langgraph_runner.config import settings
+from langgraph_runner.graphs.jpm_rag.learned_router import (
+    ROUTER_MODEL_PATH,
+    create_decision_log,
+)
+from langgraph_runner.logging import configure_logging
+from langgraph_runner.retrieval.vectorstore import create_embeddings
+from langgraph_runner.routing.learned import (
+    CentroidModel,
+    DecisionLog,
+    RoutingExample,
+    evaluate,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+_EMBED_BATCH_SIZE = 256
+
+
+def _load_examples(decision_log: DecisionLog) -> list[RoutingExample]:
+    """Load logged decisions, embedding (and persisting) any without vectors."""
+    examples = decision_log.load()
+    missing = [e for e in examples if e.embedding is None]
+    if missing:
+        logger.info("backfilling_embeddings", count=len(missing))
+        embeddings = create_embeddings()
+        for i in range(0, len(missing), _EMBED_BATCH_SIZE):
+            batch = missing[i : i + _EMBED_BATCH_SIZE]
+            vectors = embeddings.embed_documents([e.query for e in batch])
+            for example, vector in zip(batch, vectors, strict=True):
+                example.embedding = vector
+        decision_log.rewrite(examples)
+    return examples
+
+
+def cmd_train(args: argparse.Namespace) -> None:
+    """Fit on a train split, report holdout agreement, then fit on everything."""
+    decision_log = create_decision_log()
+    examples = _load_examples(decision_log)
+    if len(examples) < args.min_examples:
+        logger.error(
+            "not_enough_examples",
+            examples=len(examples),
+            required=args.min_examples,
+            decision_log=str(decision_log.path),
+        )
+        return
+
+    shuffled = examples[:]
+    random.Random(args.seed).shuffle(shuffled)
+    split = max(int(len(shuffled) * (1 - args.holdout)), 1)
+    train, holdout = shuffled[:split], shuffled[split:]
+
+    if holdout:
+        report = evaluate(CentroidModel.fit(train), holdout, args.threshold)
+        logger.info("router_holdout_evaluation", split="holdout", **asdict(report))
+
+    model = CentroidModel.fit(examples)
+    model.save(ROUTER_MODEL_PATH)
+    logger.info(
+        "router_trained",
+        examples=len(examples),
+        labels=model.labels,
+        model_path=str(ROUTER_MODEL_PATH),
+    )
+
+
+def cmd_evaluate(args: argparse.Namespace) -> None:
+    """Evaluate the saved model against all logged LLM decisions."""
+    if not ROUTER_MODEL_PATH.exists():
+        logger.error("router_model_missing", model_path=str(ROUTER_MODEL_PATH))
+        return
+    examples = _load_examples(create_decision_log())
+    report = evaluate(CentroidModel.load(ROUTER_MODEL_PATH), examples, args.threshold)
+    logger.info("router_evaluation", split="all", **asdict(report))
+
+
+def main() -> None:
+    configure_logging()
+
+    parser = argparse.ArgumentParser(description="Train the JPM RAG learned router")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=settings.RAG_LEARNED_ROUTING_THRESHOLD,
+        help="Confidence needed to route locally",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser("train", help="Train and save the model")
+    train_parser.add_argument("--holdout", type=float, default=0.2)
+    train_parser.add_argument("--seed", type=int, default=0)
+    train_parser.add_argument("--min-examples", type=int, default=20)
+
+    subparsers.add_parser("evaluate", help="Evaluate the saved model")
+
+    args = parser.parse_args()
+    {"train": cmd_train, "evaluate": cmd_evaluate}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,20 @@ JPM React Agent - Composite of react_agent + jpm_rag blocks.
 This is a conversational agent that uses the JPM RAG tool for document search.
 """
 
+from langchain_core.tools import BaseTool
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
-from langgraph_runner.graphs.jpm_rag.tool import search_jpm_documents
-from langgraph_runner.graphs.react_agent import ReactAgentRunner, build_react_agent
+from langgraph_runner.config import settings
+from langgraph_runner.graphs.jpm_rag.tool import (
+    awarmup_search_tool,
+    search_jpm_documents,
+)
+from langgraph_runner.graphs.react_agent import (
+    DIRECT_RETURN_NODE,
+    ReactAgentRunner,
+    build_react_agent,
+    direct_return_tools,
+)
 from langgraph_runner.graphs.registry import register
 from langgraph_runner.memory import create_checkpointer
 
@@ -22,6 +32,21 @@ For greetings, clarifications, or questions about previous responses, respond di
 Always cite sources when providing financial information."""
 
 
+def _create_tools() -> list[BaseTool]:
+    """The agent's tools, with the RAG tool in direct-return mode if enabled."""
+    if not settings.RAG_TOOL_DIRECT_RETURN:
+        return [search_jpm_documents]
+    # The RAG answer is already cited and final: stream its synthesis tokens
+    # as the agent's answer rather than paying for the agent to restate it
+    rag_tool = search_jpm_documents.model_copy(
+        update={
+            "return_direct": True,
+            "metadata": {DIRECT_RETURN_NODE: "synthesize"},
+        }
+    )
+    return [rag_tool]
+
+
 def _create_runner(
     checkpointer: BaseCheckpointSaver | None = None,
 ) -> ReactAgentRunner:
@@ -34,13 +59,16 @@ def _create_runner(
     if checkpointer is None:
         checkpointer = create_checkpointer()
 
-    agent = build_react_agent(
-        tools=[search_jpm_documents],
-        checkpointer=checkpointer,
-    )
+    tools = _create_tools()
+    agent = build_react_agent(tools=tools, checkpointer=checkpointer)
     agent.name = "jpm_react_agent"
 
-    return ReactAgentRunner(agent, system_prompt=SYSTEM_PROMPT)
+    return ReactAgentRunner(
+        agent,
+        system_prompt=SYSTEM_PROMPT,
+        direct_return=direct_return_tools(tools),
+        warmup=awarmup_search_tool,
+    )
 
 
 # Register in catalogue
@@ -1,8 +1,19 @@
 """ReAct agent building blocks."""
 
 from langgraph_runner.graphs.react_agent.config import ReActAgentConfig
-from langgraph_runner.graphs.react_agent.graph import build_react_agent
+from langgraph_runner.graphs.react_agent.graph import (
+    DIRECT_RETURN_NODE,
+    build_react_agent,
+    direct_return_tools,
+)
 from langgraph_runner.graphs.react_agent.runner import ReactAgentRunner
 from langgraph_runner.graphs.react_agent.state import AgentState
 
-__all__ = ["build_react_agent", "ReactAgentRunner", "AgentState", "ReActAgentConfig"]
+__all__ = [
+    "DIRECT_RETURN_NODE",
+    "build_react_agent",
+    "direct_return_tools",
+    "ReactAgentRunner",
+    "AgentState",
+    "ReActAgentConfig",
+]
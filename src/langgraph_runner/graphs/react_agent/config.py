@@ -4,7 +4,9 @@ Configuration for ReAct agent.
 
 from dataclasses import dataclass, field
 
+from langgraph_runner.config import settings
 from langgraph_runner.graphs.base.config import BaseGraphConfig
+from langgraph_runner.tiering import TierSetting
 
 
 @dataclass(kw_only=True)
@@ -22,3 +24,27 @@ class ReActAgentConfig(BaseGraphConfig):
             "Set to tool name to reduce context by only binding that tool."
         },
     )
+    history_token_budget: int | None = field(
+        default=None,
+        metadata={
+            "description": "Max history tokens per model call. "
+            "None uses the model's budget from settings."
+        },
+    )
+    agent_tier: TierSetting = field(
+        default_factory=lambda: settings.AGENT_MODEL_TIER,
+        metadata={
+            "description": "Agent model tier: 'auto' picks the fast model for "
+            "short, simple conversations"
+        },
+    )
+    history_summarization: bool = field(
+        default_factory=lambda: settings.AGENT_HISTORY_SUMMARIZATION,
+        metadata={"description": "Fold trimmed turns into a rolling summary"},
+    )
+    summary_model_id: str = field(
+        default_factory=lambda: (
+            settings.AGENT_HISTORY_SUMMARY_MODEL_ID or settings.ROUTER_MODEL_ID
+        ),
+        metadata={"description": "Model for history summaries"},
+    )
@@ -2,18 +2,83 @@
 ReAct agent graph builder.
 """
 
+import asyncio
+from collections.abc import Collection, Sequence
+from dataclasses import asdict
 from typing import Literal
 
-from langchain_core.messages import AIMessage, SystemMessage
-from langchain_core.runnables import RunnableConfig
+import structlog
+from langchain_core.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_core.tools import BaseTool
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.graph import START, StateGraph
+from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode
 
 from langgraph_runner.graphs.react_agent.config import ReActAgentConfig
+from langgraph_runner.graphs.react_agent.history import (
+    acompact_history,
+    history_budget,
+    message_tokens,
+)
 from langgraph_runner.graphs.react_agent.state import AgentState
-from langgraph_runner.models import load_chat_model
+from langgraph_runner.models import bind_tools, load_chat_model
+from langgraph_runner.tiering import TierSignals, select_model
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Tool metadata key naming the node, inside a return_direct tool's own graph,
+# whose LLM output is the tool result (streamed as the agent's final answer)
+DIRECT_RETURN_NODE = "direct_return_node"
+
+
+def direct_return_tools(tools: Sequence[BaseTool]) -> dict[str, str | None]:
+    """Map return_direct tool names to their DIRECT_RETURN_NODE, if any."""
+    return {
+        t.name: (t.metadata or {}).get(DIRECT_RETURN_NODE)
+        for t in tools
+        if t.return_direct
+    }
+
+
+def ends_after_tools(message: AIMessage, direct_tools: Collection[str]) -> bool:
+    """
+    Whether the tool result for this message is the final answer.
+
+    Only a lone call to a return_direct tool ends the run. Parallel calls
+    still go back to the agent, which has to combine the results.
+    """
+    return (
+        len(message.tool_calls) == 1 and message.tool_calls[0]["name"] in direct_tools
+    )
+
+
+def _tier_signals(messages: Sequence[AnyMessage]) -> TierSignals:
+    """
+    Tiering signals for an agent step.
+
+    The query is the latest user message, the context the whole history, and
+    the sources the tool results since that message the model must combine.
+    """
+    query, sources = "", 0
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            query = message.text
+            break
+        if isinstance(message, ToolMessage):
+            sources += 1
+    return TierSignals.from_query(
+        query,
+        context_tokens=sum(message_tokens(m) for m in messages),
+        sources=max(sources, 1),
+    )
 
 
 def _create_call_model(tools: list[BaseTool]):
@@ -23,20 +88,54 @@ def _create_call_model(tools: list[BaseTool]):
         """Call the LLM powering the agent."""
         cfg = ReActAgentConfig.from_runnable_config(config)
 
-        model = load_chat_model(cfg.model_id, temperature=cfg.temperature)
-
-        # Handle tool binding with optional tool_choice filtering
+        tier = cfg.model_tier or cfg.agent_tier
+        # Counting the thread's tokens is CPU-bound; only "auto" needs it
+        signals = (
+            await asyncio.to_thread(_tier_signals, state.messages)
+            if tier == "auto"
+            else None
+        )
+        decision = select_model(tier, cfg.model_id, cfg.fast_model_id, signals)
+        await logger.ainfo(
+            "model_tier_selected",
+            node="agent",
+            tier=decision.tier,
+            model_id=decision.model_id,
+            reason=decision.reason,
+            **(asdict(signals) if signals else {}),
+        )
+        llm = load_chat_model(decision.model_id, temperature=cfg.temperature)
+        model: Runnable = llm
+
+        # Handle tool binding with optional tool_choice filtering.
+        # Bound runnables are memoized, so tool schemas are serialized once.
         if tools:
             if not state.tool_called and cfg.tool_choice:
                 # First invocation with tool_choice: filter to only the chosen tool
                 # This reduces unnecessary context passed to the model
                 bound_tools = [t for t in tools if t.name == cfg.tool_choice]
-                model = model.bind_tools(bound_tools, tool_choice=cfg.tool_choice)
+                model = bind_tools(llm, bound_tools, tool_choice=cfg.tool_choice)
             else:
                 # No forced tool choice, bind all tools
-                model = model.bind_tools(tools)
-
-        messages = [SystemMessage(content=cfg.system_prompt), *state.messages]
+                model = bind_tools(llm, tools)
+
+        history = await acompact_history(
+            state.messages,
+            history_budget(decision.model_id, cfg.history_token_budget),
+            summary=state.summary,
+            summarizer=(
+                load_chat_model(cfg.summary_model_id, temperature=0.0)
+                if cfg.history_summarization
+                else None
+            ),
+        )
+        system_prompt = cfg.system_prompt
+        if history.summary:
+            system_prompt += (
+                f"\n\nSummary of the earlier conversation:\n{history.summary}"
+            )
+
+        messages = [SystemMessage(content=system_prompt), *history.messages]
         response = await model.ainvoke(messages, config)
 
         # Handle the case when it's the last step and the model still wants to use a tool
@@ -52,10 +151,18 @@ def _create_call_model(tools: list[BaseTool]):
 
         # If the response has tool calls, mark that a tool will be called
         # This prevents future forced tool choices to avoid infinite loops
-        result: dict[str, list[AIMessage] | bool] = {"messages": [response]}
+        result: dict = {"messages": [response]}
         if response.tool_calls:
             result["tool_called"] = True
 
+        # Persist the summary and drop what it replaces, so it's computed once
+        if history.summarized:
+            result["summary"] = history.summary
+            result["messages"] = [
+                *(RemoveMessage(id=m.id) for m in history.summarized if m.id),
+                response,
+            ]
+
         return result
 
     return call_model
@@ -74,6 +181,19 @@ def _route_model_output(state: AgentState) -> Literal["__end__", "tools"]:
     return "tools"
 
 
+def _create_route_tool_output(direct_tools: Collection[str]):
+    """Create the router that skips the agent turn after return_direct tools."""
+
+    def route_tool_output(state: AgentState) -> Literal["__end__", "agent"]:
+        """End if the tool result answers the query, otherwise call the agent."""
+        for message in reversed(state.messages):
+            if isinstance(message, AIMessage):
+                return "__end__" if ends_after_tools(message, direct_tools) else "agent"
+        return "agent"
+
+    return route_tool_output
+
+
 def build_react_agent(
     tools: list[BaseTool],
     checkpointer: BaseCheckpointSaver | None = None,
@@ -81,6 +201,9 @@ def build_react_agent(
     """
     Build a ReAct agent graph.
 
+    A lone call to a return_direct tool ends the run with the tool result
+    as the answer, skipping the agent turn that would restate it.
+
     Args:
         tools: Tools the agent can use
         checkpointer: For conversation memory and HITL support
@@ -92,7 +215,13 @@ def build_react_agent(
 
     builder.add_edge(START, "agent")
     builder.add_conditional_edges("agent", _route_model_output)
-    builder.add_edge("tools", "agent")
+    direct_tools = direct_return_tools(tools)
+    if direct_tools:
+        builder.add_conditional_edges(
+            "tools", _create_route_tool_output(direct_tools), ["agent", END]
+        )
+    else:
+        builder.add_edge("tools", "agent")
 
     graph = builder.compile(checkpointer=checkpointer)
     graph.name = "react_agent"
@@ -0,0 +1,176 @@
+"""
+Token-aware conversation history compaction.
+
+The agent's checkpointed thread grows every turn. Before each model call the
+history is cut to a per-model token budget, newest first, without separating
+an AI tool-call message from its tool results. Optionally, the turns that no
+longer fit are folded into a rolling summary that is written back to state
+(and the folded messages removed), so each turn is summarized only once.
+"""
+
+import asyncio
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import structlog
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    AnyMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from langgraph_runner.config import settings
+from langgraph_runner.tokens import count_tokens
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Approximate per-message framing overhead in chat formats
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PROMPT = """Summarize the conversation below for an assistant that will continue it.
+Keep facts, figures, sources cited, user preferences and open questions. Be concise.
+If a previous summary is given, merge it with the new turns into one summary."""
+
+
+def history_budget(model_id: str, override: int | None = None) -> int:
+    """Token budget for conversation history sent to a model."""
+    if override is not None:
+        return override
+    return settings.AGENT_HISTORY_MODEL_BUDGETS.get(
+        model_id, settings.AGENT_HISTORY_TOKEN_BUDGET
+    )
+
+
+def message_tokens(message: AnyMessage) -> int:
+    """Approximate tokens a message occupies in a prompt."""
+    tokens = _MESSAGE_OVERHEAD_TOKENS + count_tokens(message.text)
+    if isinstance(message, AIMessage) and message.tool_calls:
+        tokens += count_tokens(json.dumps([tc["args"] for tc in message.tool_calls]))
+    return tokens
+
+
+def group_units(messages: Sequence[AnyMessage]) -> list[list[AnyMessage]]:
+    """Split history into units that are kept or dropped as a whole."""
+    units: list[list[AnyMessage]] = []
+    for message in messages:
+        # Tool results belong to the AI message that called them
+        if isinstance(message, ToolMessage) and units:
+            units[-1].append(message)
+        else:
+            units.append([message])
+    return units
+
+
+def _split(
+    messages: Sequence[AnyMessage], budget: int
+) -> tuple[list[AnyMessage], list[AnyMessage], int]:
+    """
+    Split history into (dropped, kept, kept_tokens), keeping the newest units
+    that fit the budget. The current turn (from the last human message) is
+    always kept.
+    """
+    current = len(messages)
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            current = i
+            break
+
+    kept = list(messages[current:])
+    tokens = sum(message_tokens(m) for m in kept)
+    units = group_units(messages[:current])
+    while units:
+        unit_tokens = sum(message_tokens(m) for m in units[-1])
+        if tokens + unit_tokens > budget:
+            break
+        kept[:0] = units.pop()
+        tokens += unit_tokens
+    dropped = [m for unit in units for m in unit]
+    return dropped, kept, tokens
+
+
+@dataclass
+class CompactedHistory:
+    """
+    History to send to the model, and state changes to persist.
+
+    Attributes:
+        messages: Messages to send after the system prompt
+        summary: Rolling summary of earlier turns (empty if none)
+        summarized: Messages folded into the summary this call, to remove
+            from state. Empty unless the summary changed.
+    """
+
+    messages: list[AnyMessage]
+    summary: str
+    summarized: list[AnyMessage] = field(default_factory=list)
+
+
+async def _summarize(
+    model: BaseChatModel, summary: str, messages: Sequence[AnyMessage]
+) -> str:
+    transcript = "\n".join(f"{m.type}: {m.text}" for m in messages if m.text)
+    if summary:
+        transcript = f"Previous summary:\n{summary}\n\nNew turns:\n{transcript}"
+    response = await model.ainvoke(
+        [
+            SystemMessage(content=SUMMARY_PROMPT),
+            HumanMessage(content=transcript),
+        ]
+    )
+    return response.text
+
+
+async def acompact_history(
+    messages: Sequence[AnyMessage],
+    budget: int,
+    summary: str = "",
+    summarizer: BaseChatModel | None = None,
+) -> CompactedHistory:
+    """
+    Fit conversation history into a token budget.
+
+    Args:
+        messages: Full checkpointed history
+        budget: Max tokens for the summary plus kept messages
+        summary: Rolling summary already stored in state
+        summarizer: Model for folding dropped turns into the summary.
+            If None, dropped turns are only left out of the prompt.
+
+    Returns:
+        The messages to send and any summary update to persist
+    """
+    summary_tokens = count_tokens(summary) if summary else 0
+    # Token counting is CPU-bound on long threads; keep it off the event loop
+    dropped, kept, tokens = await asyncio.to_thread(
+        _split, messages, budget - summary_tokens
+    )
+    if not dropped:
+        return CompactedHistory(messages=kept, summary=summary)
+
+    if summarizer is None:
+        await logger.adebug(
+            "history_trimmed",
+            dropped_messages=len(dropped),
+            kept_messages=len(kept),
+            kept_tokens=tokens,
+        )
+        return CompactedHistory(messages=kept, summary=summary)
+
+    # Summarize down to half the budget so the next few turns fit without
+    # another summarization call
+    dropped, kept, tokens = await asyncio.to_thread(
+        _split, messages, budget // 2 - summary_tokens
+    )
+    new_summary = await _summarize(summarizer, summary, dropped)
+    await logger.adebug(
+        "history_summarized",
+        summarized_messages=len(dropped),
+        kept_messages=len(kept),
+        kept_tokens=tokens,
+        summary_tokens=count_tokens(new_summary),
+    )
+    return CompactedHistory(messages=kept, summary=new_summary, summarized=dropped)
@@ -2,31 +2,73 @@
 Runner for ReAct agent.
 """
 
-from collections.abc import AsyncIterator
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from typing import TYPE_CHECKING, Any, cast
 
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    ToolMessage,
+)
 from langchain_core.runnables import RunnableConfig
 
+from langgraph_runner.cancellation import closing_stream
 from langgraph_runner.graphs.base.runner import ChatRequest, ChatResponse, PregelRunner
 from langgraph_runner.graphs.react_agent.config import ReActAgentConfig
+from langgraph_runner.graphs.react_agent.graph import ends_after_tools
 from langgraph_runner.graphs.react_agent.state import AgentState
+from langgraph_runner.models import model_pool
+from langgraph_runner.progress import StreamEvent, StreamTimer
 
 if TYPE_CHECKING:
     from langgraph.graph.state import CompiledStateGraph
 
 
 class ReactAgentRunner(PregelRunner):
-    """Runner for ReAct agent graphs."""
+    """
+    Runner for ReAct agent graphs.
 
-    def __init__(self, graph: "CompiledStateGraph", system_prompt: str):
+    When a turn ends on a return_direct tool, astream yields the tool's answer:
+    tokens from its DIRECT_RETURN_NODE as they are generated, then whatever of
+    the tool result the node did not stream: all of it if no node is named or
+    the tool call was coalesced with another caller's, or a note the node
+    appended (e.g. that the answer was cut short by the request deadline).
+    astream_events interleaves these with the agent's tool calls and progress
+    reported from the tools' graphs.
+    """
+
+    def __init__(
+        self,
+        graph: "CompiledStateGraph",
+        system_prompt: str,
+        direct_return: Mapping[str, str | None] | None = None,
+        warmup: Callable[[], Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            graph: Compiled ReAct agent graph
+            system_prompt: System prompt for the agent
+            direct_return: The graph's return_direct tools and the node whose
+                output to stream for each (see direct_return_tools)
+            warmup: Warms the agent's tools, run alongside model warm-up
+        """
         self._graph = graph
         self._system_prompt = system_prompt
+        self._direct_return = dict(direct_return or {})
+        self._warmup = warmup
 
     @property
     def name(self) -> str:
         return self._graph.name
 
+    async def awarmup(self) -> None:
+        if self._warmup is None:
+            await model_pool.aprewarm()
+            return
+        await asyncio.gather(model_pool.aprewarm(), self._warmup())
+
     def _parse_messages(self, request: ChatRequest) -> list:
         """Parse ChatRequest messages into LangChain message types."""
         messages = []
@@ -44,6 +86,8 @@ class ReactAgentRunner(PregelRunner):
         config = ReActAgentConfig(
             model_id=request.model_id,
             temperature=request.temperature,
+            deadline=request.deadline,
+            model_tier=request.model_tier,
             system_prompt=self._system_prompt,
         )
         configurable = config.to_dict()
@@ -67,15 +111,70 @@ class ReactAgentRunner(PregelRunner):
     async def astream(
         self, request: ChatRequest, thread_id: str = "default"
     ) -> AsyncIterator[str]:
+        async with closing_stream(self.astream_events(request, thread_id)) as events:
+            async for event in events:
+                if event.type == "token":
+                    yield event.data["content"]
+
+    async def astream_events(
+        self, request: ChatRequest, thread_id: str = "default"
+    ) -> AsyncIterator[StreamEvent]:
         messages = self._parse_messages(request)
         config = self._build_runnable_config(request, thread_id)
+        timer = StreamTimer(self.name)
 
-        async for msg, metadata in self._graph.astream(
+        # Set once the agent hands the answer to a return_direct tool
+        direct_tool: str | None = None
+        direct_streamed = ""
+
+        stream = self._graph.astream(
             AgentState(messages=messages),
             config,
-            stream_mode="messages",
-        ):
-            if metadata.get("langgraph_node") == "agent":  # type: ignore[union-attr]
+            stream_mode=["messages", "updates", "custom"],
+            subgraphs=True,
+        )
+        # Closing early (the caller left) cancels the agent and its tools' graphs
+        async with closing_stream(stream):
+            async for namespace, mode, data in stream:
+                if mode == "custom":
+                    # Progress reported by a node, here or in a tool's graph
+                    yield timer.progress(data)
+                    continue
+                if mode == "updates":
+                    if namespace:
+                        continue
+                    updates = cast(dict[str, dict[str, Any]], data)
+                    if "agent" in updates:
+                        response = cast(AIMessage, updates["agent"]["messages"][-1])
+                        if response.tool_calls:
+                            yield timer.event(
+                                "tool_called",
+                                tools=[call["name"] for call in response.tool_calls],
+                            )
+                        if ends_after_tools(response, self._direct_return):
+                            direct_tool = response.tool_calls[0]["name"]
+                    elif "tools" in updates and direct_tool:
+                        for msg in updates["tools"]["messages"]:
+                            text = msg.text if isinstance(msg, ToolMessage) else ""
+                            if text.startswith(direct_streamed) and len(text) > len(
+                                direct_streamed
+                            ):
+                                for event in timer.tokens(text[len(direct_streamed) :]):
+                                    yield event
+                    continue
+
+                msg, metadata = cast(tuple[BaseMessage, dict[str, Any]], data)
+                node = metadata.get("langgraph_node")
+                if namespace:
+                    # Inside a tool's graph: only the direct-return answer node
+                    if not direct_tool or node != self._direct_return[direct_tool]:
+                        continue
+                elif node != "agent":
+                    continue
                 content = getattr(msg, "content", "")
                 if content:
-                    yield content
+                    if namespace:
+                        direct_streamed += content
+                    for event in timer.tokens(content):
+                        yield event
+        yield timer.summary()
@@ -19,3 +19,5 @@ class AgentState:
     )
     is_last_step: bool = field(default=False)
     tool_called: bool = field(default=False)
+    # Rolling summary of turns compacted out of messages
+    summary: str = field(default="")
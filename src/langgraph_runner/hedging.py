@@ -0,0 +1,85 @@
+"""
+Hedged provider requests.
+
+A hedged request that is still waiting for its response after the model's
+recent p95 latency (HEDGE_QUANTILE) gets a duplicate; whichever usable
+response arrives first is returned and the other attempt is cancelled. This
+trades a few percent of extra requests for a much shorter tail, since a
+duplicate rarely hits the same slow replica.
+
+Hedges are capped at HEDGE_MAX_FRACTION of each model's hedged requests, and
+no hedges fire until HEDGE_MIN_SAMPLES latencies have been seen. Models opt
+in per client with load_chat_model(..., hedge=True). Metrics per model:
+"hedge.<model>.latency_ms" summary and ".requests", ".fired", ".won" and
+".skipped" (no free admission slot for the duplicate) counters.
+"""
+
+import threading
+
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import Summary, metrics
+
+
+class ModelHedger:
+    """Rolling latency window and hedge budget for one model."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self._lock = threading.Lock()
+        self._latencies = Summary()
+        self._requests = 0
+        self._hedges = 0
+
+    def start(self) -> float | None:
+        """
+        Count a request; returns seconds to wait before hedging it.
+
+        None while there are too few latency samples to hedge on.
+        """
+        metrics.incr(f"hedge.{self.model}.requests")
+        with self._lock:
+            self._requests += 1
+            if self._latencies.count < settings.HEDGE_MIN_SAMPLES:
+                return None
+            p = self._latencies.percentile(settings.HEDGE_QUANTILE)
+        return None if p is None else p / 1000
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget, if the cap allows one."""
+        with self._lock:
+            if self._hedges + 1 > settings.HEDGE_MAX_FRACTION * self._requests:
+                return False
+            self._hedges += 1
+        metrics.incr(f"hedge.{self.model}.fired")
+        return True
+
+    def observe(self, latency_s: float, hedge_won: bool = False) -> None:
+        """Record how long the returned response took."""
+        with self._lock:
+            self._latencies.observe(latency_s * 1000)
+        metrics.observe(f"hedge.{self.model}.latency_ms", latency_s * 1000)
+        if hedge_won:
+            metrics.incr(f"hedge.{self.model}.won")
+
+
+class Hedging:
+    """Registry of per-model hedgers, shared by every client in the process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: dict[str, ModelHedger] = {}
+
+    def for_model(self, model: str) -> ModelHedger:
+        with self._lock:
+            hedger = self._models.get(model)
+            if hedger is None:
+                hedger = self._models[model] = ModelHedger(model)
+            return hedger
+
+    def reset(self) -> None:
+        """Forget all latency windows and budgets."""
+        with self._lock:
+            self._models.clear()
+
+
+hedging = Hedging()
@@ -5,6 +5,8 @@ Document chunking using LangChain's TextSplitter.
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from langgraph_runner.tokens import TOKEN_COUNT_KEY, count_tokens
+
 
 def create_chunker(chunk_size: int = 1000, chunk_overlap: int = 200):
     """Create a configured text splitter."""
@@ -25,8 +27,10 @@ def chunk_documents(
     splitter = create_chunker(chunk_size, chunk_overlap)
     chunks = splitter.split_documents(documents)
 
-    # Add chunk metadata
+    # Add chunk metadata; token counts let retrieval budget prompts without
+    # re-tokenizing at query time
     for i, chunk in enumerate(chunks):
         chunk.metadata["chunk_id"] = i
+        chunk.metadata[TOKEN_COUNT_KEY] = count_tokens(chunk.page_content)
 
     return chunks
@@ -27,6 +27,7 @@ ALLOWED_METADATA_FIELDS = frozenset({
     "page",
     "start_index",
     "chunk_id",
+    "token_count",
     # Custom catalog metadata
     "doc_type",
     "doc_name",
@@ -0,0 +1,29 @@
+"""
+HTTP-specific logging adapter.
+
+Provides context binding for requests served by the ASGI controller.
+"""
+
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from langgraph_runner.logging.context import logging_context
+
+REQUEST_ID_HEADER = "x-request-id"
+
+
+def new_request_id() -> str:
+    """Generate an ID for a request that didn't send one."""
+    return uuid.uuid4().hex
+
+
+@contextmanager
+def http_request_context(
+    request_id: str, method: str, path: str, **kwargs: str
+) -> Iterator[None]:
+    """Context manager binding request identifiers for one HTTP request."""
+    with logging_context(
+        controller="http", request_id=request_id, method=method, path=path, **kwargs
+    ):
+        yield
@@ -8,7 +8,15 @@ Graph-specific setup (ingestion, etc.) is in each graph module's setup.py.
 # ruff: noqa: T201
 import argparse
 import asyncio
+import json
+import signal
+import statistics
 import sys
+import threading
+import time
+from collections.abc import Coroutine, Iterator
+from pathlib import Path
+from typing import Any
 
 import langgraph_runner.graphs.jpm_rag  # Import to trigger registration
 import langgraph_runner.graphs.jpm_react_agent  # noqa: F401  # Import to trigger registration
@@ -19,24 +27,124 @@ from langgraph_runner.logging.controllers.cli import (
     cli_command_context,
     set_cli_session_context,
 )
-from langgraph_runner.services.chat import ChatService
+from langgraph_runner.metrics import metrics
+from langgraph_runner.models import model_pool
+from langgraph_runner.server import create_app
+from langgraph_runner.services.chat import BatchItem, ChatService
 
 logger = get_logger(__name__)
 
 DEFAULT_GRAPH = settings.DEFAULT_GRAPH
 
 
-async def _stream_response(service: ChatService, message: str) -> None:
-    """Stream a response with immediate feedback."""
-    async for chunk in service.astream_chat(
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    The read runs on a daemon thread (not the default executor) so exiting
+    with a read pending doesn't wait for the user to press Enter.
+    """
+    print(prompt, end="", flush=True)
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def resolve(line: str) -> None:
+        if not future.done():
+            future.set_result(line)
+
+    threading.Thread(
+        target=lambda: loop.call_soon_threadsafe(resolve, sys.stdin.readline()),
+        daemon=True,
+    ).start()
+    line = await future
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+async def _stream_response(
+    service: ChatService, message: str, timings: bool = False
+) -> None:
+    """Stream a response with immediate feedback, optionally timing its stages."""
+    async for event in service.astream_events(
         message,
         model_id=settings.MODEL_ID,
         temperature=settings.DEFAULT_TEMPERATURE,
     ):
-        print(chunk, end="", flush=True)
+        if event.type == "token":
+            print(event.data["content"], end="", flush=True)
+        elif event.type == "timing" and timings:
+            stages = "  ".join(
+                f"{k}={v:.0f}ms" for k, v in event.data["stages"].items()
+            )
+            print(f"\n\n[{stages}  total={event.data['total_ms']:.0f}ms]", end="")
     print("\n")
 
 
+async def _interruptible(coro: Coroutine[Any, Any, None]) -> bool:
+    """
+    Run coro, cancelling it rather than the whole session on Ctrl-C.
+
+    Returns False if it was interrupted. Cancellation reaches everything the
+    turn started, so an interrupted answer stops using the provider at once.
+    """
+    turn = asyncio.ensure_future(coro)
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, turn.cancel)
+    except (NotImplementedError, RuntimeError):
+        # No loop signal handlers (Windows): Ctrl-C ends the session
+        await turn
+        return True
+    try:
+        await turn
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise  # The session itself is being cancelled
+        return False
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+        signal.signal(signal.SIGINT, previous)
+    return True
+
+
+async def _chat_session(service: ChatService) -> None:
+    """
+    Run the chat loop on one event loop for the whole session, so HTTP
+    connection pools, clients and indexes warmed at start are reused by
+    every turn.
+    """
+    try:
+        await service.awarmup()
+        await logger.ainfo("chat_session_ready", graph=service.graph_name)
+        print("Type 'quit' to end the session\n")
+
+        while True:
+            try:
+                user_input = (await _ainput("You: ")).strip()
+            except EOFError:
+                print("\nGoodbye!")
+                break
+            if not user_input:
+                continue
+            if user_input.lower() in ("quit", "exit"):
+                print("Goodbye!")
+                break
+
+            try:
+                print("\nAssistant:\n", end="", flush=True)
+                if not await _interruptible(_stream_response(service, user_input)):
+                    print("\n[interrupted]\n")
+            except Exception as e:
+                await logger.aexception("chat_error", error=str(e))
+                print(f"\nError: {e}\n")
+    finally:
+        # Close connections bound to this loop before it shuts down
+        await model_pool.aclose()
+
+
 def cmd_chat(args: argparse.Namespace) -> None:
     """Start an interactive chat session with streaming."""
     with cli_command_context("chat"):
@@ -46,26 +154,21 @@ def cmd_chat(args: argparse.Namespace) -> None:
 
         logger.info("chat_session_started", graph=args.graph)
         print(f"Chat with {service.graph_name} graph")
-        print("Type 'quit' to end the session\n")
 
-        while True:
-            try:
-                user_input = input("You: ").strip()
-                if not user_input:
-                    continue
-                if user_input.lower() in ("quit", "exit"):
-                    print("Goodbye!")
-                    break
+        try:
+            asyncio.run(_chat_session(service))
+        except KeyboardInterrupt:
+            print("\n\nExiting...")
 
-                print("\nAssistant:\n", end="", flush=True)
-                asyncio.run(_stream_response(service, user_input))
 
-            except KeyboardInterrupt:
-                print("\n\nExiting...")
-                break
-            except Exception as e:
-                logger.exception("chat_error", error=str(e))
-                print(f"\nError: {e}\n")
+async def _ask(service: ChatService, question: str, timings: bool = False) -> None:
+    """Answer one question, then close this loop's connections."""
+    try:
+        if settings.PREWARM_MODELS:
+            await service.awarmup()
+        await _stream_response(service, question, timings)
+    finally:
+        await model_pool.aclose()
 
 
 def cmd_ask(args: argparse.Namespace) -> None:
@@ -78,7 +181,136 @@ def cmd_ask(args: argparse.Namespace) -> None:
         runner = get_runner(args.graph)
         service = ChatService(runner)
         print("Assistant: ", end="", flush=True)
-        asyncio.run(_stream_response(service, args.question))
+        asyncio.run(_ask(service, args.question, args.timings))
+
+
+def _completed_ids(output: Path) -> set[str]:
+    """IDs already answered without error in a previous run's output."""
+    if not output.exists():
+        return set()
+    done = set()
+    with output.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial last line from an interrupted run
+            if record.get("error") is None:
+                done.add(str(record["id"]))
+    return done
+
+
+def _read_batch(
+    path: Path, id_field: str, question_field: str, skip: set[str]
+) -> Iterator[BatchItem]:
+    """Stream BatchItems from JSONL, skipping blank lines and completed IDs."""
+    with path.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            item_id = str(record.get(id_field, line_number))
+            if item_id in skip:
+                continue
+            question = record.get(question_field)
+            if not isinstance(question, str):
+                raise ValueError(
+                    f"{path}:{line_number}: missing string field {question_field!r}"
+                )
+            yield BatchItem(id=item_id, message=question)
+
+
+async def _run_batch(
+    service: ChatService, args: argparse.Namespace, output: Path
+) -> None:
+    """Answer every pending question, appending each result as it completes."""
+    skip = _completed_ids(output)
+    items = _read_batch(args.input, args.id_field, args.question_field, skip)
+    latencies: list[float] = []
+    failed = 0
+
+    start = time.perf_counter()
+    try:
+        with output.open("a", encoding="utf-8") as out:
+            async for result in service.abatch_chat(
+                items,
+                concurrency=args.concurrency,
+                model_id=settings.MODEL_ID,
+                temperature=settings.DEFAULT_TEMPERATURE,
+            ):
+                record = {
+                    "id": result.id,
+                    "answer": result.content,
+                    "error": result.error,
+                    "latency_ms": round(result.latency_s * 1000, 1),
+                }
+                # One flushed line per answer, so a crash loses nothing done
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                latencies.append(result.latency_s)
+                failed += result.error is not None
+                print(
+                    f"[{len(latencies)}] {result.id}: "
+                    f"{'error' if result.error else 'ok'} ({result.latency_s:.1f}s)",
+                    flush=True,
+                )
+    finally:
+        await model_pool.aclose()
+
+    elapsed = time.perf_counter() - start
+    print(f"\nAnswered {len(latencies) - failed}, failed {failed}, skipped {len(skip)}")
+    if latencies:
+        q = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if len(latencies) > 1
+            else latencies * 99
+        )
+        print(
+            f"Throughput: {len(latencies) / elapsed:.2f} q/s over {elapsed:.1f}s "
+            f"(concurrency {args.concurrency})"
+        )
+        print(f"Latency: p50 {q[49]:.2f}s  p95 {q[94]:.2f}s  max {max(latencies):.2f}s")
+    print(f"Results: {output}")
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """Answer questions from a JSONL file with bounded concurrency."""
+    with cli_command_context("batch"):
+        set_cli_session_context(graph_name=args.graph)
+        output = args.output or args.input.with_suffix(".answers.jsonl")
+        logger.info(
+            "batch_command",
+            graph=args.graph,
+            input=str(args.input),
+            output=str(output),
+            concurrency=args.concurrency,
+        )
+        service = ChatService(get_runner(args.graph))
+        try:
+            asyncio.run(_run_batch(service, args, output))
+        except KeyboardInterrupt:
+            print("\nInterrupted. Re-run the same command to resume.")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """Serve all registered graphs over HTTP."""
+    try:
+        import uvicorn
+    except ImportError:
+        print(
+            "The serve command needs uvicorn: uv sync --extra server", file=sys.stderr
+        )
+        sys.exit(1)
+
+    logger.info("server_starting", host=args.host, port=args.port)
+    uvicorn.run(
+        create_app(),
+        host=args.host,
+        port=args.port,
+        # Let in-flight streams finish before lifespan shutdown drains the rest
+        timeout_graceful_shutdown=int(settings.SERVER_DRAIN_TIMEOUT),
+        log_config=None,
+    )
 
 
 def cmd_list(_args: argparse.Namespace) -> None:
@@ -108,11 +340,20 @@ Examples:
   # Ask a single question
   uv run python -m langgraph_runner ask "What stocks were highlighted?"
 
+  # ... and see where the time to first token went
+  uv run python -m langgraph_runner ask --timings "What stocks were highlighted?"
+
   # List available graphs
   uv run python -m langgraph_runner list
 
   # Use specific graph
   uv run python -m langgraph_runner --graph jpm_rag chat
+
+  # Answer a JSONL file of {"id": ..., "question": ...} (resumable)
+  uv run python -m langgraph_runner batch questions.jsonl --concurrency 16
+
+  # Serve all graphs over HTTP (needs the `server` extra)
+  uv run python -m langgraph_runner serve --port 8000
 """,
     )
     parser.add_argument(
@@ -130,10 +371,38 @@ Examples:
     # ask command
     ask_parser = subparsers.add_parser("ask", help="Ask a single question")
     ask_parser.add_argument("question", help="The question to ask")
+    ask_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print when each stage finished and the time to first token",
+    )
 
     # list command
     subparsers.add_parser("list", help="List available graphs")
 
+    # batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Answer questions from a JSONL file"
+    )
+    batch_parser.add_argument("input", type=Path, help="JSONL file of questions")
+    batch_parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        help="JSONL results file, appended to and used to resume "
+        "(default: <input>.answers.jsonl)",
+    )
+    batch_parser.add_argument(
+        "--concurrency", "-c", type=int, default=settings.BATCH_CONCURRENCY
+    )
+    batch_parser.add_argument("--id-field", default="id")
+    batch_parser.add_argument("--question-field", default="question")
+
+    # serve command
+    serve_parser = subparsers.add_parser("serve", help="Serve graphs over HTTP/SSE")
+    serve_parser.add_argument("--host", default=settings.SERVER_HOST)
+    serve_parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+
     args = parser.parse_args()
 
     if args.command is None:
@@ -144,6 +413,8 @@ Examples:
         "chat": cmd_chat,
         "ask": cmd_ask,
         "list": cmd_list,
+        "batch": cmd_batch,
+        "serve": cmd_serve,
     }
 
     try:
@@ -154,6 +425,8 @@ Examples:
     except KeyboardInterrupt:
         print("\nInterrupted.")
         sys.exit(130)
+    finally:
+        logger.debug("metrics_summary", **metrics.snapshot())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+"""
+In-process metrics.
+
+Lightweight counters and rolling summaries for performance features (cache
+hit rates, batch sizes, queue delays). Values are process-local and exposed
+via snapshot() for logging or serving.
+
+Naming convention: hit/miss pairs are recorded as "<name>.hit" and
+"<name>.miss" so hit_rate("<name>") can derive the ratio.
+"""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+
+# Number of recent observations kept per summary for percentiles
+SUMMARY_WINDOW = 1024
+
+
+@dataclass
+class Summary:
+    """Running count/sum plus a window of recent values for percentiles."""
+
+    count: int = 0
+    total: float = 0.0
+    window: deque[float] = field(default_factory=lambda: deque(maxlen=SUMMARY_WINDOW))
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.window.append(value)
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank percentile (0-100) over the recent window."""
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+        return ordered[rank]
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": max(self.window) if self.window else None,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of named counters and summaries."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._summaries: dict[str, Summary] = {}
+
+    def incr(self, name: str, value: float = 1.0) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0.0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a value in a summary (latency, batch size, ...)."""
+        with self._lock:
+            self._summaries.setdefault(name, Summary()).observe(value)
+
+    def counter(self, name: str) -> float:
+        """Current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0.0)
+
+    def percentile(self, name: str, q: float) -> float | None:
+        """Percentile of a summary's recent window, or None if empty."""
+        with self._lock:
+            summary = self._summaries.get(name)
+            return summary.percentile(q) if summary else None
+
+    def hit_rate(self, name: str) -> float | None:
+        """Ratio of "<name>.hit" to hit + miss, or None if nothing recorded."""
+        hits = self.counter(f"{name}.hit")
+        total = hits + self.counter(f"{name}.miss")
+        return hits / total if total else None
+
+    def snapshot(self) -> dict[str, object]:
+        """Point-in-time copy of all counters and summaries."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "summaries": {k: v.to_dict() for k, v in self._summaries.items()},
+            }
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+metrics = Metrics()
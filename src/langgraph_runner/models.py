@@ -2,26 +2,160 @@
 Model loading utilities.
 
 Provides factory functions to load chat models based on model ID.
+Instances are pooled so graph nodes share clients and warm HTTP connections
+instead of building a new client on every call. Derived runnables (structured
+output, bound tools) are memoized per pooled instance.
 """
 
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any
+
+import structlog
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
 
 from langgraph_runner.config import settings
+from langgraph_runner.transport import HttpClientPool, http_clients, running_loop
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ModelKey = tuple[str, float, bool, Hashable]
+
+# Endpoint used to open a keep-alive connection when pre-warming
+_DEFAULT_API_BASE = "https://api.openai.com/v1"
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert kwargs values into a hashable form for use in pool keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ChatModelPool:
+    """
+    Registry of shared chat model instances.
+
+    Instances are keyed by (model_id, temperature, hedge, kwargs) and scoped
+    to the running event loop, since async HTTP connections cannot cross
+    loops. Models created outside a loop share a single sync scope.
+    """
+
+    def __init__(self, http: HttpClientPool):
+        self._http = http
+        self._lock = threading.Lock()
+        self._sync_models: dict[ModelKey, BaseChatModel] = {}
+        self._loop_models: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[ModelKey, BaseChatModel]
+        ] = weakref.WeakKeyDictionary()
+
+    def _scope(self) -> dict[ModelKey, BaseChatModel]:
+        loop = running_loop()
+        if loop is None:
+            return self._sync_models
+        return self._loop_models.setdefault(loop, {})
+
+    def get(
+        self, model_id: str, temperature: float, hedge: bool = False, **kwargs
+    ) -> BaseChatModel:
+        """Get a shared model instance, creating it on first use."""
+        key: ModelKey = (model_id, temperature, hedge, _freeze(kwargs))
+        with self._lock:
+            scope = self._scope()
+            model = scope.get(key)
+            if model is None:
+                model = scope[key] = self._create(
+                    model_id, temperature, hedge, **kwargs
+                )
+        return model
+
+    def _create(
+        self, model_id: str, temperature: float, hedge: bool, **kwargs
+    ) -> BaseChatModel:
+        """Build a model wired to the shared HTTP clients."""
+        kwargs.setdefault("http_client", self._http.sync_client())
+        if settings.RATE_LIMITING:
+            # The transport retries 429s; SDK retries would multiply its attempts
+            kwargs.setdefault("max_retries", 0)
+        async_client = self._http.async_client(hedged=hedge)
+        if async_client is not None:
+            kwargs.setdefault("http_async_client", async_client)
+        return init_chat_model(
+            model_id,
+            temperature=temperature,
+            api_key=settings.OPENAI_API_KEY,
+            **kwargs,
+        )
+
+    async def aprewarm(self, model_ids: Iterable[str] | None = None) -> None:
+        """
+        Create models and open a keep-alive connection ahead of the first call.
+
+        Args:
+            model_ids: Models to warm. Defaults to the primary and router models.
+        """
+        model_ids = set(model_ids or (settings.MODEL_ID, settings.ROUTER_MODEL_ID))
+        models = [
+            self.get(model_id, settings.DEFAULT_TEMPERATURE) for model_id in model_ids
+        ]
+        client = self._http.async_client()
+        if client is None:
+            return
+        api_bases = {
+            getattr(m, "openai_api_base", None) or _DEFAULT_API_BASE for m in models
+        }
+        for api_base in api_bases:
+            try:
+                await client.head(api_base)
+            except Exception as e:
+                await logger.awarning(
+                    "model_prewarm_failed", api_base=api_base, error=str(e)
+                )
+        await logger.adebug("models_prewarmed", model_ids=sorted(model_ids))
+
+    async def aclose(self) -> None:
+        """Drop models and close HTTP connections bound to the running loop."""
+        loop = running_loop()
+        with self._lock:
+            if loop is not None:
+                self._loop_models.pop(loop, None)
+        await self._http.aclose()
+
+
+model_pool = ChatModelPool(http_clients)
 
 
 def load_chat_model(
     model_id: str | None = None,
     temperature: float | None = None,
+    hedge: bool = False,
     **kwargs,
 ) -> BaseChatModel:
     """
     Load a chat model by ID.
 
+    Returns a pooled instance shared by every caller with the same arguments.
+
     Args:
         model_id: Model identifier (e.g., "gpt-5", "gpt-5-mini").
             If None, uses settings.MODEL_ID.
         temperature: Model temperature. If None, uses settings.DEFAULT_TEMPERATURE.
+        hedge: Send a duplicate of async requests that outlast the model's
+            recent p95 latency, taking whichever answers first (hedging.py).
 
     Returns:
         A configured chat model instance.
@@ -31,6 +165,83 @@ def load_chat_model(
         temperature if temperature is not None else settings.DEFAULT_TEMPERATURE
     )
 
-    return init_chat_model(
-        model_id, temperature=temperature, api_key=settings.OPENAI_API_KEY, **kwargs
+    return model_pool.get(model_id, temperature, hedge, **kwargs)
+
+
+class RunnableCache:
+    """
+    Bounded LRU of runnables derived from pooled chat models.
+
+    Building a structured-output or tool-bound runnable converts schemas to
+    JSON on every call. Entries hold a reference to their source objects, so
+    id()-based keys stay valid for as long as the entry lives.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Runnable, tuple[Any, ...]]] = (
+            OrderedDict()
+        )
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Runnable],
+        refs: tuple[Any, ...],
+    ) -> Runnable:
+        """Return the cached runnable for key, building it on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        runnable = factory()
+        with self._lock:
+            self._entries[key] = (runnable, refs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return runnable
+
+    def clear(self) -> None:
+        """Drop all cached runnables."""
+        with self._lock:
+            self._entries.clear()
+
+
+runnable_cache = RunnableCache(settings.RUNNABLE_CACHE_SIZE)
+
+
+def with_structured_output(
+    model: BaseChatModel, schema: type | dict, **kwargs
+) -> Runnable:
+    """Memoized equivalent of model.with_structured_output(schema, **kwargs)."""
+    key = ("structured", id(model), _freeze(schema), _freeze(kwargs))
+    return runnable_cache.get_or_create(
+        key,
+        lambda: model.with_structured_output(schema, **kwargs),
+        refs=(model, schema),
+    )
+
+
+def bind_tools(
+    model: BaseChatModel,
+    tools: Sequence[BaseTool],
+    tool_choice: str | None = None,
+    **kwargs,
+) -> Runnable:
+    """Memoized equivalent of model.bind_tools(tools, tool_choice=..., **kwargs)."""
+    key = (
+        "tools",
+        id(model),
+        tuple(id(t) for t in tools),
+        tool_choice,
+        _freeze(kwargs),
+    )
+    return runnable_cache.get_or_create(
+        key,
+        lambda: model.bind_tools(tools, tool_choice=tool_choice, **kwargs),
+        refs=(model, tuple(tools)),
     )
@@ -0,0 +1,105 @@
+"""
+Progress events for streamed runs.
+
+PregelRunner.astream_events yields StreamEvents: the answer's text as "token"
+events, interleaved with progress as the run reaches each stage, so callers
+can show it and measure time to first token (TTFT) and where it goes. Nodes
+report progress with report_progress, which LangGraph's "custom" stream mode
+carries to the runner, from tool subgraphs as well. The RAG graph reports:
+
+    classified          sources, router
+    retrieved           source, chunks, timed_out (once per source)
+    synthesis_started   model_id, tier
+
+Runners add "tool_called" (tools) for agent tool calls, "first_token" (ttft_ms)
+before the first token, and end with "timing": total_ms, ttft_ms and stages,
+the ms from the start of the run to the last event of each type. Every event
+carries t, the time.monotonic() it was seen. The stage offsets are also
+recorded as "stream.<graph>.<stage>_ms" summaries, so
+"stream.<graph>.first_token_ms" is the graph's TTFT.
+"""
+
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from langgraph.config import get_stream_writer
+
+from langgraph_runner.metrics import metrics
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One event of a streamed run. "token" events carry data["content"]."""
+
+    type: str
+    t: float
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+def report_progress(event: str, **data: Any) -> None:
+    """
+    Report that a node reached a stage, to callers streaming events.
+
+    Call from inside a graph node; a no-op unless the run streams in "custom"
+    mode.
+    """
+    get_stream_writer()({"event": event, **data})
+
+
+class StreamTimer:
+    """Stamps one run's events and sums up its timing at the end."""
+
+    def __init__(self, graph: str):
+        self.graph = graph
+        self.start = time.monotonic()
+        self.first_token: float | None = None
+        # Last time each event type was seen, in first-seen order
+        self._stages: dict[str, float] = {}
+
+    def event(self, type: str, **data: Any) -> StreamEvent:
+        """A progress event, stamped now."""
+        t = time.monotonic()
+        self._stages[type] = t
+        return StreamEvent(type=type, t=t, data=data)
+
+    def progress(self, data: Any) -> StreamEvent:
+        """A progress event from a node's report_progress payload."""
+        data = dict(data)
+        return self.event(data.pop("event"), **data)
+
+    def tokens(self, content: str) -> Iterator[StreamEvent]:
+        """A "token" event, preceded by "first_token" for the first one."""
+        t = time.monotonic()
+        if self.first_token is None:
+            self.first_token = t
+            self._stages["first_token"] = t
+            yield StreamEvent(type="first_token", t=t, data={"ttft_ms": self._ms(t)})
+        yield StreamEvent(type="token", t=t, data={"content": content})
+
+    def summary(self) -> StreamEvent:
+        """The closing "timing" event; also records the stage metrics."""
+        t = time.monotonic()
+        ttft_ms = None if self.first_token is None else self._ms(self.first_token)
+        stages = {name: self._ms(at) for name, at in self._stages.items()}
+        for name, ms in stages.items():
+            metrics.observe(f"stream.{self.graph}.{name}_ms", ms)
+        logger.debug(
+            "stream_timing",
+            graph=self.graph,
+            total_ms=self._ms(t),
+            ttft_ms=ttft_ms,
+            stages=stages,
+        )
+        return StreamEvent(
+            type="timing",
+            t=t,
+            data={"total_ms": self._ms(t), "ttft_ms": ttft_ms, "stages": stages},
+        )
+
+    def _ms(self, t: float) -> float:
+        return round((t - self.start) * 1000, 1)
@@ -0,0 +1,224 @@
+"""
+Process-wide rate limiting of provider requests.
+
+Each model gets a requests bucket and a tokens bucket sized from its RPM/TPM
+quota (RATE_LIMIT_RPM / RATE_LIMIT_TPM, or learned from the provider's
+x-ratelimit-limit-* response headers). Buckets are reserve-ahead: a caller
+takes its share immediately and sleeps until the bucket would have held it,
+so concurrent callers are paced in arrival order instead of bursting into
+429s.
+
+Feedback from responses keeps the local view close to the provider's:
+remaining-quota headers drain the buckets, and a 429 pauses every caller of
+the model until its retry-after and halves the pacing rate, which then
+recovers additively with each success (AIMD). Requests, estimated tokens,
+delays and 429s are recorded as "ratelimit.<model>.*" metrics.
+
+Buckets are guarded by a thread lock, so sync and async clients on any
+event loop share one budget.
+"""
+
+import random
+import re
+import threading
+import time
+from collections.abc import Mapping
+
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import metrics
+
+# Multiplicative decrease on a 429, additive recovery per success
+_DECREASE_FACTOR = 0.5
+_MIN_RATE_FACTOR = 0.1
+_RECOVERY_STEP = 0.02
+
+# Backoff when a 429 carries no retry-after
+_BASE_BACKOFF_S = 0.5
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: str) -> float | None:
+    """Seconds in a provider duration such as "1.5", "20ms" or "6m0s"."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+
+
+def retry_after(headers: Mapping[str, str]) -> float | None:
+    """Seconds a throttled response asks the client to wait, if given."""
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        return parse_duration(headers["retry-after"])
+    return None
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    try:
+        return int(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Reserve-ahead token bucket.
+
+    The level may go negative: each reservation is granted at once and the
+    caller waits until the deficit has refilled. Not thread-safe on its own.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._level = capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount, returning the seconds to wait before using it."""
+        self._refill(now)
+        self._level -= amount
+        return max(0.0, -self._level / self.rate)
+
+    def drain_to(self, level: float, now: float) -> None:
+        """Lower the level, e.g. to the provider's reported remaining quota."""
+        self._refill(now)
+        self._level = min(self._level, level)
+
+    def pause_until(self, until: float, now: float) -> None:
+        """Empty the bucket so the next grant is no earlier than until."""
+        self.drain_to(-(until - now) * self.rate, now)
+
+    def set_rate(self, rate: float, capacity: float, now: float) -> None:
+        self._refill(now)
+        self.rate = rate
+        self.capacity = capacity
+
+
+class ModelRateLimiter:
+    """Request and token budgets for one model."""
+
+    def __init__(self, model: str, rpm: int | None, tpm: int | None):
+        self.model = model
+        self._lock = threading.Lock()
+        self._limits: dict[str, int | None] = {"requests": rpm, "tokens": tpm}
+        self._learn = {kind: limit is None for kind, limit in self._limits.items()}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._factor = 1.0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        now = time.monotonic()
+        for kind in self._limits:
+            self._resize(kind, now)
+
+    def _resize(self, kind: str, now: float) -> None:
+        """Create or resize a bucket for the current limit and rate factor."""
+        limit = self._limits[kind]
+        if limit is None:
+            return
+        rate = limit / 60 * self._factor
+        capacity = max(rate * settings.RATE_LIMIT_BURST_SECONDS, 1.0)
+        bucket = self._buckets.get(kind)
+        if bucket is None:
+            self._buckets[kind] = TokenBucket(rate, capacity, now)
+        else:
+            bucket.set_rate(rate, capacity, now)
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and its estimated tokens; returns seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, 0.0)
+            if "requests" in self._buckets:
+                delay = max(delay, self._buckets["requests"].reserve(1, now))
+            if "tokens" in self._buckets:
+                delay = max(delay, self._buckets["tokens"].reserve(tokens, now))
+        metrics.incr(f"ratelimit.{self.model}.tokens", tokens)
+        metrics.observe(f"ratelimit.{self.model}.delay_ms", delay * 1000)
+        return delay
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Sync budgets from a successful response's rate-limit headers."""
+        with self._lock:
+            now = time.monotonic()
+            for kind in self._limits:
+                limit = _header_int(headers, f"x-ratelimit-limit-{kind}")
+                if self._learn[kind] and limit and limit != self._limits[kind]:
+                    self._limits[kind] = limit
+                    self._resize(kind, now)
+                remaining = _header_int(headers, f"x-ratelimit-remaining-{kind}")
+                if remaining is not None and kind in self._buckets:
+                    self._buckets[kind].drain_to(remaining, now)
+            if self._factor < 1.0:
+                self._factor = min(self._factor + _RECOVERY_STEP, 1.0)
+                for kind in self._buckets:
+                    self._resize(kind, now)
+
+    def throttled(self, headers: Mapping[str, str], attempt: int) -> float:
+        """
+        Back off every caller of the model after a 429.
+
+        Returns:
+            Seconds until requests resume
+        """
+        wait = retry_after(headers)
+        if wait is None:
+            # Jittered exponential backoff so retries don't arrive in lockstep
+            wait = _BASE_BACKOFF_S * 2**attempt * random.uniform(0.5, 1.0)
+        wait = min(wait, settings.RATE_LIMIT_MAX_BACKOFF)
+        metrics.incr(f"ratelimit.{self.model}.throttled")
+        with self._lock:
+            now = time.monotonic()
+            until = now + wait
+            self._paused_until = max(self._paused_until, until)
+            # Concurrent 429s from one overload only slow the rate once
+            if now - self._last_decrease >= wait:
+                self._last_decrease = now
+                self._factor = max(self._factor * _DECREASE_FACTOR, _MIN_RATE_FACTOR)
+            for kind, bucket in self._buckets.items():
+                self._resize(kind, now)
+                bucket.pause_until(until, now)
+        return wait
+
+
+class RateLimiter:
+    """Registry of per-model limiters, shared by every client in the process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: dict[str, ModelRateLimiter] = {}
+
+    def for_model(self, model: str) -> ModelRateLimiter:
+        with self._lock:
+            limiter = self._models.get(model)
+            if limiter is None:
+                limiter = self._models[model] = ModelRateLimiter(
+                    model,
+                    rpm=settings.RATE_LIMIT_RPM.get(model),
+                    tpm=settings.RATE_LIMIT_TPM.get(model),
+                )
+            return limiter
+
+    def reset(self) -> None:
+        """Forget all budgets and learned limits."""
+        with self._lock:
+            self._models.clear()
+
+
+rate_limiter = RateLimiter()
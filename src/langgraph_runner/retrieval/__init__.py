@@ -1,9 +1,33 @@
 """Retrieval components for vector search."""
 
+from langgraph_runner.retrieval.adaptive import AdaptiveK
+from langgraph_runner.retrieval.embeddings import (
+    AdmittedEmbeddings,
+    CachedEmbeddings,
+    EmbeddingStore,
+    MicroBatchingEmbeddings,
+)
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.packing import ScoredChunk, pack_context
+from langgraph_runner.retrieval.partitioned import PartitionedVectorStore
 from langgraph_runner.retrieval.retriever import FilteredRetriever
-from langgraph_runner.retrieval.vectorstore import create_vectorstore, index_documents
+from langgraph_runner.retrieval.vectorstore import (
+    create_embeddings,
+    create_vectorstore,
+    index_documents,
+)
 
 __all__ = [
+    "AdaptiveK",
+    "AdmittedEmbeddings",
+    "CachedEmbeddings",
+    "EmbeddingStore",
+    "MicroBatchingEmbeddings",
+    "NumpyVectorStore",
+    "PartitionedVectorStore",
+    "ScoredChunk",
+    "pack_context",
+    "create_embeddings",
     "create_vectorstore",
     "index_documents",
     "FilteredRetriever",
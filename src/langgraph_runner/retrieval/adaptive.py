@@ -0,0 +1,68 @@
+"""
+Adaptive-k truncation of ranked retrieval results.
+
+Instead of always returning a fixed k, a larger candidate set is fetched and
+cut where results stop being useful: past an absolute distance threshold, past
+a relative gap to the best hit, or once a cumulative token budget is filled.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from langchain_core.documents import Document
+
+from langgraph_runner.tokens import document_tokens
+
+CutReason = Literal["max_distance", "relative_gap", "token_budget", "exhausted"]
+
+
+@dataclass(frozen=True)
+class AdaptiveK:
+    """
+    Truncation policy for a candidate set sorted by distance.
+
+    Attributes:
+        candidate_k: Number of candidates fetched before truncation
+        max_relative_gap: Drop hits whose distance exceeds the best hit's by
+            more than this fraction (e.g. 0.25 = within 25% of the best)
+        token_budget: Stop once the kept chunks' token counts reach this total
+        min_k: Hits always kept by the gap and budget rules (the absolute
+            max_distance threshold is never relaxed)
+    """
+
+    candidate_k: int = 20
+    max_relative_gap: float | None = None
+    token_budget: int | None = None
+    min_k: int = 1
+
+
+def select(
+    results: list[tuple[Document, float]],
+    max_distance: float | None = None,
+    policy: AdaptiveK | None = None,
+) -> tuple[list[tuple[Document, float]], CutReason]:
+    """
+    Truncate ranked (document, distance) results.
+
+    Returns:
+        The kept results and the rule that ended the list
+    """
+    best = results[0][1] if results else 0.0
+    tokens = 0
+    for i, (doc, distance) in enumerate(results):
+        if max_distance is not None and distance > max_distance:
+            return results[:i], "max_distance"
+        if policy is None:
+            continue
+        if policy.token_budget is not None:
+            tokens += document_tokens(doc)
+        if i < policy.min_k:
+            continue
+        if (
+            policy.max_relative_gap is not None
+            and distance - best > policy.max_relative_gap * best
+        ):
+            return results[:i], "relative_gap"
+        if policy.token_budget is not None and tokens > policy.token_budget:
+            return results[:i], "token_budget"
+    return results, "exhausted"
@@ -0,0 +1,407 @@
+"""
+Embedding function wrappers.
+
+CachedEmbeddings puts an in-memory LRU in front of a persistent SQLite store so
+repeated queries and re-ingested chunks are not embedded again over the network.
+Entries are keyed by (model, content hash).
+
+MicroBatchingEmbeddings coalesces concurrent async embedding calls into one
+provider request per short window.
+
+AdmittedEmbeddings passes async provider requests through an admission gate.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.admission import admission
+from langgraph_runner.metrics import metrics
+
+CACHE_METRIC = "embeddings.cache"
+BATCH_SIZE_METRIC = "embeddings.batch.size"
+BATCH_DELAY_METRIC = "embeddings.batch.queue_delay_ms"
+
+# SQLite's default limit on host parameters per statement is 999
+_SQL_BATCH_SIZE = 500
+
+
+def _batched(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class EmbeddingStore:
+    """
+    Persistent embedding store backed by SQLite.
+
+    Vectors are stored as float32 blobs. When the store grows past max_entries
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 200_000):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings(accessed)"
+            )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        """Return stored vectors for the keys that are present."""
+        found: dict[str, list[float]] = {}
+        with self._lock, self._conn:
+            for batch in _batched(keys, _SQL_BATCH_SIZE):
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET accessed = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """Store vectors, evicting least recently used entries over the limit."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed) "
+                "VALUES (?, ?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+                    for key, vector in items.items()
+                ],
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            if count > self._max_entries:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    "SELECT key FROM embeddings ORDER BY accessed LIMIT ?)",
+                    (count - self._max_entries,),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Two-level caching wrapper around another Embeddings implementation.
+
+    Lookups check the in-memory LRU first, then the persistent store; only the
+    remaining texts are sent to the underlying model, in one batch. Hits and
+    misses are recorded per level as "embeddings.cache.memory.*" and
+    "embeddings.cache.disk.*".
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        model: str,
+        store: EmbeddingStore | None = None,
+        memory_size: int = 10_000,
+    ):
+        self._underlying = underlying
+        self._model = model
+        self._store = store
+        self._memory_size = memory_size
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def underlying(self) -> Embeddings:
+        return self._underlying
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self._model}:{digest}"
+
+    def _memory_get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+        metrics.incr(f"{CACHE_METRIC}.memory.hit", len(found))
+        metrics.incr(f"{CACHE_METRIC}.memory.miss", len(keys) - len(found))
+        return found
+
+    def _memory_put_many(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    def _disk_get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        if self._store is None or not keys:
+            return {}
+        found = self._store.get_many(keys)
+        metrics.incr(f"{CACHE_METRIC}.disk.hit", len(found))
+        metrics.incr(f"{CACHE_METRIC}.disk.miss", len(keys) - len(found))
+        self._memory_put_many(found)
+        return found
+
+    def _missing(
+        self, texts: Sequence[str], found: dict[str, list[float]]
+    ) -> dict[str, str]:
+        """Unique texts (by key) that are not cached yet."""
+        return {key: text for text in texts if (key := self._key(text)) not in found}
+
+    def _assemble(
+        self, texts: Sequence[str], found: dict[str, list[float]]
+    ) -> list[list[float]]:
+        return [found[self._key(text)] for text in texts]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = list(dict.fromkeys(self._key(text) for text in texts))
+        found = self._memory_get_many(keys)
+        found |= self._disk_get_many([k for k in keys if k not in found])
+
+        missing = self._missing(texts, found)
+        if missing:
+            vectors = self._underlying.embed_documents(list(missing.values()))
+            new = dict(zip(missing, vectors, strict=True))
+            self._memory_put_many(new)
+            if self._store is not None:
+                self._store.put_many(new)
+            found |= new
+        return self._assemble(texts, found)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key(text)
+        found = self._memory_get_many([key]) or self._disk_get_many([key])
+        if found:
+            return found[key]
+
+        vector = self._underlying.embed_query(text)
+        self._memory_put_many({key: vector})
+        if self._store is not None:
+            self._store.put_many({key: vector})
+        return vector
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = list(dict.fromkeys(self._key(text) for text in texts))
+        found = self._memory_get_many(keys)
+        remaining = [k for k in keys if k not in found]
+        if remaining and self._store is not None:
+            found |= await asyncio.to_thread(self._disk_get_many, remaining)
+
+        missing = self._missing(texts, found)
+        if missing:
+            vectors = await self._underlying.aembed_documents(list(missing.values()))
+            new = dict(zip(missing, vectors, strict=True))
+            self._memory_put_many(new)
+            if self._store is not None:
+                await asyncio.to_thread(self._store.put_many, new)
+            found |= new
+        return self._assemble(texts, found)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._key(text)
+        found = self._memory_get_many([key])
+        if not found and self._store is not None:
+            found = await asyncio.to_thread(self._disk_get_many, [key])
+        if found:
+            return found[key]
+
+        vector = await self._underlying.aembed_query(text)
+        self._memory_put_many({key: vector})
+        if self._store is not None:
+            await asyncio.to_thread(self._store.put_many, {key: vector})
+        return vector
+
+
+@dataclass
+class _PendingBatch:
+    """Texts collected on one event loop, waiting to be flushed."""
+
+    texts: list[str] = field(default_factory=list)
+    futures: list[asyncio.Future[list[float]]] = field(default_factory=list)
+    enqueued_at: list[float] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatchingEmbeddings(Embeddings):
+    """
+    Coalesces concurrent async embedding calls into batched requests.
+
+    aembed_query and small aembed_documents calls are queued per event loop
+    and flushed as a single aembed_documents request after window_ms, or as
+    soon as max_batch_size texts are waiting. Sync calls pass straight
+    through. Batch sizes and queueing delays are recorded as
+    "embeddings.batch.size" and "embeddings.batch.queue_delay_ms".
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        window_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        self._underlying = underlying
+        self._window = window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PendingBatch
+        ] = weakref.WeakKeyDictionary()
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def underlying(self) -> Embeddings:
+        return self._underlying
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._underlying.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if len(texts) >= self._max_batch_size:
+            return await self._underlying.aembed_documents(texts)
+        return await self._submit(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        (vector,) = await self._submit([text])
+        return vector
+
+    async def _submit(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in texts]
+
+        with self._lock:
+            batch = self._pending.get(loop)
+            if batch and len(batch.texts) + len(texts) > self._max_batch_size:
+                self._flush_locked(loop)
+                batch = None
+            if batch is None:
+                batch = _PendingBatch()
+                batch.timer = loop.call_later(self._window, self._flush, loop)
+                self._pending[loop] = batch
+
+            now = time.perf_counter()
+            batch.texts.extend(texts)
+            batch.futures.extend(futures)
+            batch.enqueued_at.extend([now] * len(texts))
+            if len(batch.texts) >= self._max_batch_size:
+                self._flush_locked(loop)
+
+        return list(await asyncio.gather(*futures))
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            self._flush_locked(loop)
+
+    def _flush_locked(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._pending.pop(loop, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = loop.create_task(self._run(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        now = time.perf_counter()
+        for enqueued_at in batch.enqueued_at:
+            metrics.observe(BATCH_DELAY_METRIC, (now - enqueued_at) * 1000)
+
+        # Callers that were cancelled while queued don't need embedding
+        live = [
+            (text, future)
+            for text, future in zip(batch.texts, batch.futures, strict=True)
+            if not future.done()
+        ]
+        unique = list(dict.fromkeys(text for text, _ in live))
+        if not unique:
+            return
+        metrics.observe(BATCH_SIZE_METRIC, len(unique))
+
+        try:
+            vectors = dict(
+                zip(
+                    unique,
+                    await self._underlying.aembed_documents(unique),
+                    strict=True,
+                )
+            )
+        except Exception as e:
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in live:
+            if not future.done():
+                future.set_result(vectors[text])
+
+
+class AdmittedEmbeddings(Embeddings):
+    """
+    Holds a slot of an admission gate for each async provider request.
+
+    Wrap the provider client directly, so cache hits never queue and each
+    micro-batch takes one slot. Sync calls pass straight through.
+    """
+
+    def __init__(self, underlying: Embeddings, gate: str = "backend:embeddings"):
+        self._underlying = underlying
+        self._gate = gate
+
+    @property
+    def underlying(self) -> Embeddings:
+        return self._underlying
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._underlying.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._underlying.embed_query(text)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        async with admission.admit(self._gate):
+            return await self._underlying.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        async with admission.admit(self._gate):
+            return await self._underlying.aembed_query(text)
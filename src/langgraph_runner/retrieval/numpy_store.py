@@ -0,0 +1,300 @@
+"""
+In-process exact-search vector store backed by NumPy.
+
+For small corpora (a few thousand chunks) brute-force search over a contiguous
+float32 matrix is faster than HNSW plus metadata filtering, and avoids the
+executor hop of Chroma's async API. Vectors are pre-partitioned by a metadata
+key (doc_type) so filtered searches only scan their partition.
+
+Distances are squared L2, matching Chroma's default collection space, so
+max_distance thresholds carry over unchanged.
+"""
+
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Self
+
+import numpy as np
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+
+@dataclass(frozen=True)
+class _Partition:
+    """Contiguous slice of the corpus searched with one matmul."""
+
+    indices: np.ndarray  # Positions into the store's document list
+    matrix: np.ndarray  # (n, dim) float32
+    sq_norms: np.ndarray  # (n,) float32
+
+
+def _partition(vectors: np.ndarray, indices: np.ndarray) -> _Partition:
+    matrix = np.ascontiguousarray(vectors[indices])
+    return _Partition(
+        indices=indices,
+        matrix=matrix,
+        sq_norms=np.einsum("ij,ij->i", matrix, matrix),
+    )
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    Exact nearest-neighbour search over in-memory NumPy arrays.
+
+    Can be loaded from (and write through to) a Chroma collection, which stays
+    the persistent source of truth. Supports equality metadata filters; filters
+    on the partition key alone use the pre-built partition.
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        source: Chroma | None = None,
+        partition_key: str = "doc_type",
+    ):
+        self._embedding = embedding
+        self._source = source
+        self._partition_key = partition_key
+        self._lock = threading.Lock()
+        self._documents: list[Document] = []
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._partitions: dict[Any, _Partition] = {}
+
+    @classmethod
+    def from_chroma(cls, chroma: Chroma, partition_key: str = "doc_type") -> Self:
+        """Load every vector, document and metadata from a Chroma collection."""
+        if chroma.embeddings is None:
+            raise ValueError("Chroma store has no embedding function")
+        store = cls(chroma.embeddings, source=chroma, partition_key=partition_key)
+        store._load(chroma.get(include=["embeddings", "documents", "metadatas"]))
+        return store
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        store = cls(embedding, **kwargs)
+        store.add_texts(texts, metadatas, ids=ids)
+        return store
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _load(self, records: dict[str, Any]) -> None:
+        vectors = records["embeddings"]
+        if vectors is None or len(vectors) == 0:
+            return
+        self._append(
+            ids=records["ids"],
+            texts=records["documents"],
+            metadatas=records["metadatas"],
+            vectors=np.asarray(vectors, dtype=np.float32),
+        )
+
+    def _append(
+        self,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        metadatas: Sequence[dict | None],
+        vectors: np.ndarray,
+    ) -> None:
+        new_docs = [
+            Document(id=doc_id, page_content=text, metadata=dict(metadata or {}))
+            for doc_id, text, metadata in zip(ids, texts, metadatas, strict=True)
+        ]
+        with self._lock:
+            documents = self._documents + new_docs
+            all_vectors = (
+                np.concatenate([self._vectors, vectors]) if self._documents else vectors
+            )
+
+            groups: dict[Any, list[int]] = {}
+            for i, doc in enumerate(documents):
+                groups.setdefault(doc.metadata.get(self._partition_key), []).append(i)
+            partitions = {
+                value: _partition(all_vectors, np.array(positions))
+                for value, positions in groups.items()
+            }
+            partitions[None] = _partition(all_vectors, np.arange(len(documents)))
+
+            self._documents, self._vectors, self._partitions = (
+                documents,
+                all_vectors,
+                partitions,
+            )
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        metadatas = metadatas or [{} for _ in texts]
+        if self._source is not None:
+            # Write through; read back the vectors Chroma computed and stored
+            ids = self._source.add_texts(texts, metadatas, ids=ids, **kwargs)
+            self._load(
+                self._source.get(
+                    ids=ids, include=["embeddings", "documents", "metadatas"]
+                )
+            )
+            return ids
+
+        ids = ids or [str(uuid.uuid4()) for _ in texts]
+        vectors = np.asarray(self._embedding.embed_documents(texts), dtype=np.float32)
+        self._append(ids, texts, metadatas, vectors)
+        return ids
+
+    def _resolve_filter(
+        self,
+        documents: list[Document],
+        vectors: np.ndarray,
+        partitions: dict[Any, _Partition],
+        filter: dict[str, Any] | None,
+    ) -> _Partition | None:
+        """Partition to scan for a filter (None if nothing can match)."""
+        if not filter:
+            return partitions.get(None)
+        if filter.keys() == {self._partition_key}:
+            return partitions.get(filter[self._partition_key])
+
+        matches = np.array(
+            [
+                i
+                for i, doc in enumerate(documents)
+                if all(doc.metadata.get(k) == v for k, v in filter.items())
+            ],
+            dtype=np.int64,
+        )
+        return _partition(vectors, matches) if len(matches) else None
+
+    def search_many(
+        self,
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+        k: int = 4,
+        filters: Sequence[dict[str, Any] | None] | None = None,
+    ) -> list[list[tuple[Document, float]]]:
+        """
+        Exact k-NN for a batch of query vectors.
+
+        Queries sharing a filter are answered with one matmul plus
+        argpartition over that filter's partition.
+
+        Returns:
+            One list of (document, squared L2 distance) per query, nearest first
+        """
+        queries = np.asarray(embeddings, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        filters = list(filters) if filters is not None else [None] * len(queries)
+        results: list[list[tuple[Document, float]]] = [[] for _ in range(len(queries))]
+
+        with self._lock:
+            documents, vectors, partitions = (
+                self._documents,
+                self._vectors,
+                self._partitions,
+            )
+
+        groups: dict[str, tuple[dict[str, Any] | None, list[int]]] = {}
+        for i, f in enumerate(filters):
+            groups.setdefault(repr(sorted((f or {}).items())), (f, []))[1].append(i)
+
+        for f, rows in groups.values():
+            partition = self._resolve_filter(documents, vectors, partitions, f)
+            if partition is None or len(partition.indices) == 0 or k <= 0:
+                continue
+
+            q = queries[rows]
+            distances = (
+                np.einsum("ij,ij->i", q, q)[:, None]
+                + partition.sq_norms[None, :]
+                - 2.0 * (q @ partition.matrix.T)
+            )
+            np.maximum(distances, 0.0, out=distances)
+
+            top = min(k, distances.shape[1])
+            candidates = np.argpartition(distances, top - 1, axis=1)[:, :top]
+            candidate_distances = np.take_along_axis(distances, candidates, axis=1)
+            order = np.argsort(candidate_distances, axis=1)
+            nearest = np.take_along_axis(candidates, order, axis=1)
+            nearest_distances = np.take_along_axis(candidate_distances, order, axis=1)
+
+            for row, positions, dists in zip(
+                rows, nearest, nearest_distances, strict=True
+            ):
+                results[row] = [
+                    (documents[partition.indices[p]], float(d))
+                    for p, d in zip(positions, dists, strict=True)
+                ]
+        return results
+
+    def similarity_search_by_vector_with_relevance_scores(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        """Chroma-compatible search by vector returning distances."""
+        return self.search_many([embedding], k, [filter])[0]
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        return self.similarity_search_by_vector_with_relevance_scores(
+            self._embedding.embed_query(query), k, filter
+        )
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
+
+    async def asimilarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        # Search is fast enough to run inline; only embedding is awaited
+        embedding = await self._embedding.aembed_query(query)
+        return self.similarity_search_by_vector_with_relevance_scores(
+            embedding, k, filter
+        )
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        results = await self.asimilarity_search_with_score(query, k, filter)
+        return [doc for doc, _ in results]
@@ -0,0 +1,175 @@
+"""
+Token-budgeted context packing for retrieved chunks.
+
+Overlapping chunks (CHUNK_OVERLAP) and neighbouring chunks from the same page
+repeat text in the prompt. Packing merges adjacent/overlapping chunks, drops
+near-duplicates, and fills a token budget in score order.
+"""
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+from langgraph_runner.tokens import TOKEN_COUNT_KEY, count_tokens, document_tokens
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Shingle size for near-duplicate detection
+_SHINGLE_WORDS = 5
+
+
+@dataclass(frozen=True)
+class ScoredChunk:
+    """A retrieved chunk with its distance (lower = better) and source label."""
+
+    document: Document
+    distance: float
+    source: str
+
+
+@dataclass(frozen=True)
+class PackingReport:
+    """What packing did to a request's context."""
+
+    input_chunks: int
+    output_chunks: int
+    merged: int
+    duplicates: int
+    over_budget: int
+    input_tokens: int
+    output_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.input_tokens - self.output_tokens
+
+
+def _parent_key(chunk: ScoredChunk) -> tuple | None:
+    """Chunks split from the same parent element share offsets."""
+    meta = chunk.document.metadata
+    if meta.get("start_index") is None:
+        return None
+    return (
+        chunk.source,
+        meta.get("source", meta.get("filename")),
+        meta.get("page_number", meta.get("page")),
+        meta.get("element_id"),
+    )
+
+
+def _merge_adjacent(chunks: list[ScoredChunk]) -> tuple[list[ScoredChunk], int]:
+    """Merge overlapping or touching chunks from the same parent element."""
+    groups: dict[tuple, list[ScoredChunk]] = {}
+    merged: list[ScoredChunk] = []
+    for chunk in chunks:
+        key = _parent_key(chunk)
+        if key is None:
+            merged.append(chunk)
+        else:
+            groups.setdefault(key, []).append(chunk)
+
+    merges = 0
+    for group in groups.values():
+        group.sort(key=lambda c: c.document.metadata["start_index"])
+        current = group[0]
+        current_end = current.document.metadata["start_index"] + len(
+            current.document.page_content
+        )
+        for chunk in group[1:]:
+            start = chunk.document.metadata["start_index"]
+            text = chunk.document.page_content
+            # +1 allows for the separator the splitter dropped between chunks
+            if start > current_end + 1:
+                merged.append(current)
+                current, current_end = chunk, start + len(text)
+                continue
+
+            tail = text[max(current_end - start, 0) :]
+            content = current.document.page_content + tail
+            current = ScoredChunk(
+                document=Document(
+                    id=current.document.id,
+                    page_content=content,
+                    metadata={
+                        **current.document.metadata,
+                        TOKEN_COUNT_KEY: count_tokens(content),
+                    },
+                ),
+                distance=min(current.distance, chunk.distance),
+                source=current.source,
+            )
+            current_end = max(current_end, start + len(text))
+            merges += 1
+        merged.append(current)
+    return merged, merges
+
+
+def _shingles(text: str) -> set[tuple[str, ...]]:
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) <= _SHINGLE_WORDS:
+        return {tuple(words)}
+    return {
+        tuple(words[i : i + _SHINGLE_WORDS])
+        for i in range(len(words) - _SHINGLE_WORDS + 1)
+    }
+
+
+def _drop_near_duplicates(
+    chunks: list[ScoredChunk], threshold: float
+) -> tuple[list[ScoredChunk], int]:
+    """Keep the best-scored of any chunks whose shingle sets mostly overlap."""
+    kept: list[tuple[ScoredChunk, set]] = []
+    for chunk in sorted(chunks, key=lambda c: c.distance):
+        shingles = _shingles(chunk.document.page_content)
+        duplicate = any(
+            len(shingles & other) / max(min(len(shingles), len(other)), 1) >= threshold
+            for _, other in kept
+        )
+        if not duplicate:
+            kept.append((chunk, shingles))
+    return [chunk for chunk, _ in kept], len(chunks) - len(kept)
+
+
+def pack_context(
+    chunks: Sequence[ScoredChunk],
+    token_budget: int | None = None,
+    duplicate_threshold: float = 0.9,
+) -> tuple[list[ScoredChunk], PackingReport]:
+    """
+    Pack retrieved chunks into a token budget.
+
+    Args:
+        chunks: Retrieved chunks from all sources
+        token_budget: Max total chunk tokens, None for no limit
+        duplicate_threshold: Share of the smaller chunk's 5-word shingles that
+            must also appear in a better-scored chunk for it to be dropped
+
+    Returns:
+        Packed chunks in score order, and a report of what was removed
+    """
+    input_tokens = sum(document_tokens(c.document) for c in chunks)
+
+    merged, merges = _merge_adjacent(list(chunks))
+    unique, duplicates = _drop_near_duplicates(merged, duplicate_threshold)
+
+    packed: list[ScoredChunk] = []
+    used = over_budget = 0
+    for chunk in unique:  # Already in score order
+        tokens = document_tokens(chunk.document)
+        if token_budget is not None and used + tokens > token_budget:
+            over_budget += 1
+            continue
+        packed.append(chunk)
+        used += tokens
+
+    return packed, PackingReport(
+        input_chunks=len(chunks),
+        output_chunks=len(packed),
+        merged=merges,
+        duplicates=duplicates,
+        over_budget=over_budget,
+        input_tokens=input_tokens,
+        output_tokens=used,
+    )
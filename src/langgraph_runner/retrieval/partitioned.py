@@ -0,0 +1,154 @@
+"""
+Vector store partitioned into one collection per metadata value.
+
+Filtered HNSW search slows down and loses recall as a shared collection grows.
+Writing each doc_type into its own collection lets filtered queries search
+only their partition, and unfiltered queries fan out across partitions.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Self
+
+from langchain_chroma import Chroma
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+
+PartitionStore = Chroma | NumpyVectorStore
+
+
+def merge_by_score(
+    results: Iterable[list[tuple[Document, float]]], k: int
+) -> list[tuple[Document, float]]:
+    """Merge per-partition (document, distance) lists into the k nearest."""
+    merged = [item for partition in results for item in partition]
+    merged.sort(key=lambda item: item[1])
+    return merged[:k]
+
+
+class PartitionedVectorStore(VectorStore):
+    """
+    One vector store per value of a partition key (doc_type by default).
+
+    Documents are routed to the partition named by their metadata value.
+    Searches filtered on the partition key go straight to that partition;
+    other searches run on every partition and are merged by distance.
+    """
+
+    def __init__(
+        self,
+        partitions: Mapping[str, PartitionStore],
+        embedding: Embeddings,
+        partition_key: str = "doc_type",
+        default_partition: str | None = None,
+    ):
+        if not partitions:
+            raise ValueError("PartitionedVectorStore needs at least one partition")
+        self._partitions = dict(partitions)
+        self._embedding = embedding
+        self._partition_key = partition_key
+        self._default_partition = default_partition
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        raise NotImplementedError(
+            "Create partitions explicitly, e.g. with create_vectorstore(partitions=...)"
+        )
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self._embedding
+
+    @property
+    def partitions(self) -> dict[str, PartitionStore]:
+        return dict(self._partitions)
+
+    def targets(
+        self, filter: dict[str, Any] | None
+    ) -> list[tuple[PartitionStore, dict[str, Any] | None]]:
+        """Partitions to search for a filter, with the remaining filter."""
+        filter = dict(filter or {})
+        value = filter.pop(self._partition_key, None)
+        remaining = filter or None
+        if value is None:
+            return [(store, remaining) for store in self._partitions.values()]
+        store = self._partitions.get(value)
+        return [(store, remaining)] if store is not None else []
+
+    def _partition_for(self, doc: Document) -> str:
+        value = doc.metadata.get(self._partition_key, self._default_partition)
+        if value not in self._partitions:
+            raise ValueError(
+                f"No partition for {self._partition_key}={value!r}; "
+                f"expected one of {sorted(self._partitions)}"
+            )
+        return value
+
+    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
+        """Add documents to their partitions, returning ids in input order."""
+        groups: dict[str, list[int]] = {}
+        for i, doc in enumerate(documents):
+            groups.setdefault(self._partition_for(doc), []).append(i)
+
+        ids: list[str] = [""] * len(documents)
+        for name, positions in groups.items():
+            added = self._partitions[name].add_documents(
+                [documents[i] for i in positions], **kwargs
+            )
+            for i, doc_id in zip(positions, added, strict=True):
+                ids[i] = doc_id
+        return ids
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: list[dict] | None = None,
+        *,
+        ids: list[str] | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        metadatas = metadatas or [{} for _ in texts]
+        doc_ids: list[str | None] = list(ids) if ids else [None] * len(texts)
+        documents = [
+            Document(id=doc_id, page_content=text, metadata=metadata)
+            for text, metadata, doc_id in zip(texts, metadatas, doc_ids, strict=True)
+        ]
+        return self.add_documents(documents, **kwargs)
+
+    def similarity_search_with_score(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[Document, float]]:
+        embedding = self._embedding.embed_query(query)
+        return merge_by_score(
+            (
+                store.similarity_search_by_vector_with_relevance_scores(
+                    embedding, k=k, filter=remaining
+                )
+                for store, remaining in self.targets(filter)
+            ),
+            k,
+        )
+
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 4,
+        filter: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, filter)]
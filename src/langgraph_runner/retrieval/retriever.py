@@ -1,25 +1,79 @@
 """
 Filtered retriever for document type filtering.
 
-This is a thin wrapper that adds doc_type filtering on top of Chroma.
+This is a thin wrapper that adds doc_type filtering on top of Chroma, the
+in-process NumPy store, or a store partitioned by doc_type.
 """
 
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.admission import admission
+from langgraph_runner.cancellation import to_thread
+from langgraph_runner.deadline import gather_until, remaining
+from langgraph_runner.retrieval.adaptive import AdaptiveK, select
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.partitioned import (
+    PartitionedVectorStore,
+    PartitionStore,
+    merge_by_score,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Admission gate for vector store queries served by Chroma
+CHROMA_GATE = "backend:chroma"
+
+Filter = dict[str, Any] | None
 
 
 class FilteredRetriever:
-    """Retriever with document type filtering and score thresholding."""
+    """
+    Retriever with document type filtering and score thresholding.
+
+    With an AdaptiveK policy, candidate_k results are fetched and truncated by
+    relative distance gap and token budget instead of always returning k.
+    """
 
     def __init__(
         self,
-        vectorstore: Chroma,
+        vectorstore: Chroma | NumpyVectorStore | PartitionedVectorStore,
         k: int = 5,
         max_distance: float | None = None,
+        adaptive: AdaptiveK | None = None,
     ):
         self._vectorstore = vectorstore
         self._k = k
         self._max_distance = max_distance  # Lower distance = more similar
+        self._adaptive = adaptive
+
+    @property
+    def embeddings(self) -> Embeddings | None:
+        """Embedding function of the underlying vector store."""
+        return self._vectorstore.embeddings
+
+    async def awarmup(self) -> None:
+        """
+        Run one search so the embedding client is created and connected and
+        search indexes are loaded before the first real query.
+        """
+        start = time.perf_counter()
+        try:
+            await self._search_many([("warmup", None)], 1)
+        except Exception as e:
+            # Best effort: the first query pays the cost instead
+            await logger.awarning("retriever_warmup_failed", error=str(e))
+            return
+        await logger.adebug(
+            "retriever_warmed", latency_ms=(time.perf_counter() - start) * 1000
+        )
 
     async def retrieve(self, query: str, doc_type: str | None = None) -> list[Document]:
         """
@@ -32,31 +86,14 @@ class FilteredRetriever:
         Returns:
             List of matching documents
         """
-        filter_dict = None
-        if doc_type and doc_type != "both":
-            filter_dict = {"doc_type": doc_type}
-
-        # Use score-based retrieval if threshold is set
-        if self._max_distance is not None:
-            results = await self._vectorstore.asimilarity_search_with_score(
-                query=query,
-                k=self._k,
-                filter=filter_dict,
-            )
-            # Filter by distance threshold (lower = more similar)
-            return [doc for doc, distance in results if distance <= self._max_distance]
-
-        return await self._vectorstore.asimilarity_search(
-            query=query,
-            k=self._k,
-            filter=filter_dict,
-        )
+        return [doc for doc, _ in await self.retrieve_with_scores(query, doc_type)]
 
     async def retrieve_with_scores(
         self, query: str, doc_type: str | None = None
     ) -> list[tuple[Document, float]]:
         """
-        Retrieve documents with similarity scores.
+        Retrieve documents with similarity scores, truncated by max_distance
+        and the adaptive-k policy.
 
         Args:
             query: The search query
@@ -65,12 +102,164 @@ class FilteredRetriever:
         Returns:
             List of (document, score) tuples
         """
-        filter_dict = None
-        if doc_type and doc_type != "both":
-            filter_dict = {"doc_type": doc_type}
+        (results,) = await self.retrieve_many([(query, doc_type)])
+        return results or []
+
+    async def retrieve_many(
+        self,
+        requests: Sequence[tuple[str, str | None]],
+        deadline: float | None = None,
+    ) -> list[list[tuple[Document, float]] | None]:
+        """
+        Retrieve for several (query, doc_type) pairs at once.
+
+        All distinct queries are embedded in a single batched call, then the
+        searches run concurrently. With a partitioned store, each doc_type
+        searches only its partition and "both" fans out across partitions,
+        merged by score. Each result list is then truncated by max_distance
+        and the adaptive-k policy.
+
+        Args:
+            requests: (query, doc_type) pairs
+            deadline: time.monotonic() after which unfinished searches are
+                abandoned. None to wait for all.
+
+        Returns:
+            List of (document, score) lists, in the same order as requests.
+            None for requests whose search missed the deadline.
+        """
+        if not requests:
+            return []
 
-        return await self._vectorstore.asimilarity_search_with_score(
-            query=query,
-            k=self._k,
-            filter=filter_dict,
+        fetch_k = self._adaptive.candidate_k if self._adaptive else self._k
+        candidates = await self._search_many(requests, fetch_k, deadline)
+
+        selected: list[list[tuple[Document, float]] | None] = []
+        for (query, doc_type), results in zip(requests, candidates, strict=True):
+            if results is None:
+                selected.append(None)
+                continue
+            kept, cut = select(results, self._max_distance, self._adaptive)
+            selected.append(kept)
+            await logger.adebug(
+                "retrieval_k_selected",
+                doc_type=doc_type,
+                query=query,
+                candidates=len(results),
+                k=len(kept),
+                cut=cut,
+            )
+        return selected
+
+    async def _search_many(
+        self,
+        requests: Sequence[tuple[str, str | None]],
+        k: int,
+        deadline: float | None = None,
+    ) -> list[list[tuple[Document, float]] | None]:
+        """
+        Top-k (document, distance) lists for each request, nearest first, or
+        None where the search missed the deadline.
+        """
+        embeddings = self.embeddings
+        if embeddings is None:
+            return await gather_until(
+                (self._search_text(query, doc_type, k) for query, doc_type in requests),
+                deadline,
+            )
+
+        queries = list(dict.fromkeys(query for query, _ in requests))
+        try:
+            async with asyncio.timeout(remaining(deadline)):
+                embedded = await embeddings.aembed_documents(queries)
+        except TimeoutError:
+            return [None] * len(requests)
+        vectors = dict(zip(queries, embedded, strict=True))
+
+        partials: list[list[list[tuple[Document, float]]]] = [[] for _ in requests]
+        numpy_searches: dict[int, list[tuple[int, Filter, list[float]]]] = {}
+        numpy_stores: dict[int, NumpyVectorStore] = {}
+        chroma_searches = []
+        for i, (query, doc_type) in enumerate(requests):
+            for store, filter_dict in self._targets(doc_type):
+                if isinstance(store, NumpyVectorStore):
+                    numpy_stores[id(store)] = store
+                    numpy_searches.setdefault(id(store), []).append(
+                        (i, filter_dict, vectors[query])
+                    )
+                else:
+                    chroma_searches.append((i, store, filter_dict, vectors[query]))
+
+        # One vectorized pass per NumPy store, no executor hop
+        for store_id, searches in numpy_searches.items():
+            results = numpy_stores[store_id].search_many(
+                [vector for _, _, vector in searches],
+                k=k,
+                filters=[filter_dict for _, filter_dict, _ in searches],
+            )
+            for (i, _, _), result in zip(searches, results, strict=True):
+                partials[i].append(result)
+
+        chroma_results = await gather_until(
+            (
+                self._search_chroma(store, vector, k, filter_dict)
+                for _, store, filter_dict, vector in chroma_searches
+            ),
+            deadline,
         )
+        missed: set[int] = set()
+        for (i, _, _, _), found in zip(chroma_searches, chroma_results, strict=True):
+            if found is None:
+                missed.add(i)
+            else:
+                partials[i].append(found)
+
+        return [
+            None if i in missed else merge_by_score(parts, k)
+            for i, parts in enumerate(partials)
+        ]
+
+    @staticmethod
+    async def _search_chroma(
+        store: PartitionStore, vector: list[float], k: int, filter_dict: Filter
+    ) -> list[tuple[Document, float]]:
+        async with admission.admit(CHROMA_GATE):
+            return await to_thread(
+                "chroma",
+                store.similarity_search_by_vector_with_relevance_scores,
+                vector,
+                k=k,
+                filter=filter_dict,
+            )
+
+    async def _search_text(
+        self, query: str, doc_type: str | None, k: int
+    ) -> list[tuple[Document, float]]:
+        """Search by query text, for stores without an embedding function."""
+
+        async def search(store: PartitionStore, filter_dict: Filter):
+            async with admission.admit(CHROMA_GATE):
+                return await store.asimilarity_search_with_score(
+                    query=query, k=k, filter=filter_dict
+                )
+
+        results = await asyncio.gather(
+            *(
+                search(store, filter_dict)
+                for store, filter_dict in self._targets(doc_type)
+            )
+        )
+        return merge_by_score(results, k)
+
+    def _targets(self, doc_type: str | None) -> list[tuple[PartitionStore, Filter]]:
+        """Stores to search for a doc_type, with the filter each one needs."""
+        filter_dict = self._filter(doc_type)
+        if isinstance(self._vectorstore, PartitionedVectorStore):
+            return self._vectorstore.targets(filter_dict)
+        return [(self._vectorstore, filter_dict)]
+
+    @staticmethod
+    def _filter(doc_type: str | None) -> dict[str, str] | None:
+        if doc_type and doc_type != "both":
+            return {"doc_type": doc_type}
+        return None
@@ -1,38 +1,126 @@
 """
-ChromaDB vector store setup.
+Vector store setup.
 
-Uses LangChain's Chroma directly - no wrapper needed.
+Uses LangChain's Chroma directly - no wrapper needed. Chroma is always the
+persistent store; the "numpy" backend loads it into memory for exact search.
 """
 
+from collections.abc import Sequence
+from functools import cache
 from pathlib import Path
+from typing import Literal
 
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
 from langchain_openai import OpenAIEmbeddings
 
 from langgraph_runner.config import settings
+from langgraph_runner.retrieval.embeddings import (
+    AdmittedEmbeddings,
+    CachedEmbeddings,
+    EmbeddingStore,
+    MicroBatchingEmbeddings,
+)
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.partitioned import (
+    PartitionedVectorStore,
+    PartitionStore,
+)
+from langgraph_runner.transport import http_clients
+
+
+@cache
+def _get_embedding_store(path: Path) -> EmbeddingStore:
+    """One store (and SQLite connection) per cache file per process."""
+    return EmbeddingStore(path, max_entries=settings.EMBEDDING_CACHE_DISK_MAX_ENTRIES)
+
+
+def create_embeddings(embedding_model: str | None = None) -> Embeddings:
+    """Create the embedding client used for indexing and queries."""
+    model = embedding_model or settings.EMBEDDING_MODEL
+    embeddings: Embeddings = AdmittedEmbeddings(
+        OpenAIEmbeddings(
+            model=model,
+            api_key=settings.OPENAI_API_KEY,
+            # Shared rate-limited pools; the client outlives any one event loop
+            http_client=http_clients.sync_client(),
+            http_async_client=http_clients.loop_agnostic_client(),
+            # The transport retries 429s; SDK retries would multiply its attempts
+            max_retries=0 if settings.RATE_LIMITING else 2,
+        )
+    )
+    if settings.EMBEDDING_BATCH_WINDOW_MS > 0:
+        embeddings = MicroBatchingEmbeddings(
+            embeddings,
+            window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+            max_batch_size=settings.EMBEDDING_BATCH_MAX_SIZE,
+        )
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return embeddings
+
+    return CachedEmbeddings(
+        embeddings,
+        model=model,
+        store=_get_embedding_store(settings.EMBEDDING_CACHE_PATH),
+        memory_size=settings.EMBEDDING_CACHE_MEMORY_SIZE,
+    )
+
+
+def _open_store(
+    persist_directory: Path,
+    collection_name: str,
+    embeddings: Embeddings,
+    backend: Literal["chroma", "numpy"],
+) -> PartitionStore:
+    chroma = Chroma(
+        collection_name=collection_name,
+        embedding_function=embeddings,
+        persist_directory=str(persist_directory),
+    )
+    if backend == "numpy":
+        return NumpyVectorStore.from_chroma(chroma)
+    return chroma
 
 
 def create_vectorstore(
     persist_directory: Path,
     collection_name: str = "jpmorgan_rag",
     embedding_model: str | None = None,
-) -> Chroma:
-    """Create or load a ChromaDB vector store."""
+    backend: Literal["chroma", "numpy"] | None = None,
+    partitions: Sequence[str] | None = None,
+) -> PartitionStore | PartitionedVectorStore:
+    """
+    Create or load a vector store.
+
+    Args:
+        persist_directory: ChromaDB directory
+        collection_name: ChromaDB collection (prefix when partitioned)
+        embedding_model: Embedding model (defaults to settings)
+        backend: "chroma" or "numpy" (defaults to settings.VECTORSTORE_BACKEND)
+        partitions: doc_type values to store in separate collections named
+            "<collection_name>_<doc_type>". None for a single collection.
+    """
     persist_directory.mkdir(parents=True, exist_ok=True)
+    embeddings = create_embeddings(embedding_model)
+    backend = backend or settings.VECTORSTORE_BACKEND
 
-    embeddings = OpenAIEmbeddings(
-        model=embedding_model or settings.EMBEDDING_MODEL,
-        api_key=settings.OPENAI_API_KEY,
-    )
+    if not partitions:
+        return _open_store(persist_directory, collection_name, embeddings, backend)
 
-    return Chroma(
-        collection_name=collection_name,
-        embedding_function=embeddings,
-        persist_directory=str(persist_directory),
+    return PartitionedVectorStore(
+        {
+            doc_type: _open_store(
+                persist_directory, f"{collection_name}_{doc_type}", embeddings, backend
+            )
+            for doc_type in partitions
+        },
+        embedding=embeddings,
+        partition_key="doc_type",
     )
 
 
-def index_documents(vectorstore: Chroma, documents: list[Document]) -> list[str]:
+def index_documents(vectorstore: VectorStore, documents: list[Document]) -> list[str]:
     """Add documents to the vector store."""
     return vectorstore.add_documents(documents)
@@ -0,0 +1,22 @@
+"""Local query routers that can stand in for an LLM classifier."""
+
+from langgraph_runner.routing.base import QueryRouter, RoutingDecision
+from langgraph_runner.routing.learned import (
+    CentroidModel,
+    DecisionLog,
+    LearnedRouter,
+    RoutingExample,
+)
+from langgraph_runner.routing.rules import RoutingRule, RuleRouter, keyword_query
+
+__all__ = [
+    "CentroidModel",
+    "DecisionLog",
+    "LearnedRouter",
+    "QueryRouter",
+    "RoutingDecision",
+    "RoutingExample",
+    "RoutingRule",
+    "RuleRouter",
+    "keyword_query",
+]
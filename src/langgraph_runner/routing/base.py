@@ -0,0 +1,35 @@
+"""
+Routing contracts shared by local (non-LLM) query routers.
+"""
+
+from dataclasses import dataclass, field
+from typing import Protocol, runtime_checkable
+
+
+@dataclass
+class RoutingDecision:
+    """Sources to search, each with its retrieval sub-query."""
+
+    routes: dict[str, str]
+    router: str
+    confidence: float = 1.0
+    matched: list[str] = field(default_factory=list)
+
+
+@runtime_checkable
+class QueryRouter(Protocol):
+    """
+    Protocol for routers that can resolve a query without an LLM call.
+
+    Routers return None when the query is ambiguous, so the caller can fall
+    back to a slower, more capable router.
+    """
+
+    @property
+    def name(self) -> str:
+        """Router name for logs and metrics."""
+        ...
+
+    async def aroute(self, query: str) -> RoutingDecision | None:
+        """Route the query, or return None to defer."""
+        ...
@@ -0,0 +1,298 @@
+"""
+Embedding-based learned router.
+
+Distils the LLM classifier into a nearest-centroid model over query
+embeddings. LLM routing decisions are logged as training data; once a model
+has been trained offline, confident predictions are served locally and only
+low-confidence queries go to the LLM.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import structlog
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.routing.base import RoutingDecision
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Recent query embeddings kept so LLM fallbacks can be logged without re-embedding
+_EMBEDDING_MEMO_SIZE = 256
+
+
+def _label(sources: Sequence[str]) -> str:
+    """Canonical class label for a set of sources."""
+    return "+".join(sorted(set(sources)))
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+@dataclass
+class RoutingExample:
+    """A logged routing decision made by the LLM classifier."""
+
+    query: str
+    sources: list[str]
+    embedding: list[float] | None = None
+    llm_latency_ms: float | None = None
+    embed_latency_ms: float | None = None
+
+
+class DecisionLog:
+    """Append-only JSONL log of routing decisions."""
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def append(self, example: RoutingExample) -> None:
+        line = json.dumps(asdict(example))
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def rewrite(self, examples: Sequence[RoutingExample]) -> None:
+        """Atomically replace the log contents (e.g. after backfilling)."""
+        tmp_path = self._path.with_suffix(".tmp")
+        with self._lock:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.writelines(json.dumps(asdict(e)) + "\n" for e in examples)
+            tmp_path.replace(self._path)
+
+    def load(self) -> list[RoutingExample]:
+        if not self._path.exists():
+            return []
+        with self._path.open(encoding="utf-8") as f:
+            return [RoutingExample(**json.loads(line)) for line in f if line.strip()]
+
+
+@dataclass
+class CentroidModel:
+    """
+    Nearest-centroid classifier over L2-normalized embeddings.
+
+    Confidence is the softmax probability of the best class over scaled cosine
+    similarities to every class centroid.
+    """
+
+    labels: list[str]
+    centroids: np.ndarray
+    scale: float = 20.0
+
+    @classmethod
+    def fit(cls, examples: Sequence[RoutingExample], scale: float = 20.0) -> Self:
+        """Fit centroids from examples that have embeddings."""
+        usable = [e for e in examples if e.embedding is not None]
+        if not usable:
+            raise ValueError("No routing examples with embeddings to train on")
+
+        labels = sorted({_label(e.sources) for e in usable})
+        vectors = _normalize(np.array([e.embedding for e in usable], np.float32))
+        targets = np.array([labels.index(_label(e.sources)) for e in usable])
+        centroids = np.stack(
+            [vectors[targets == i].mean(axis=0) for i in range(len(labels))]
+        )
+        return cls(labels=labels, centroids=_normalize(centroids), scale=scale)
+
+    def predict(self, embedding: Sequence[float]) -> tuple[list[str], float]:
+        """Return (sources, confidence) for one embedding."""
+        query = _normalize(np.asarray(embedding, dtype=np.float32))
+        logits = self.centroids @ query * self.scale
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        best = int(probs.argmax())
+        return self.labels[best].split("+"), float(probs[best])
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            np.savez(
+                f,
+                labels=np.array(self.labels),
+                centroids=self.centroids,
+                scale=self.scale,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        with np.load(path) as data:
+            return cls(
+                labels=[str(label) for label in data["labels"]],
+                centroids=data["centroids"],
+                scale=float(data["scale"]),
+            )
+
+
+@dataclass
+class EvaluationReport:
+    """Agreement of a learned model with logged LLM decisions."""
+
+    examples: int
+    threshold: float
+    coverage: float  # Share of queries answered locally
+    agreement_covered: float | None  # Agreement with LLM where served locally
+    agreement_overall: float | None  # Agreement if every query were served locally
+    predict_ms: float  # Mean local prediction time (excluding embedding)
+    llm_latency_ms: float | None  # Mean logged LLM routing latency
+    embed_latency_ms: float | None  # Mean logged query embedding latency
+    saved_ms_per_query: float | None
+
+
+def evaluate(
+    model: CentroidModel,
+    examples: Sequence[RoutingExample],
+    threshold: float,
+) -> EvaluationReport:
+    """Score the model against LLM decisions at a confidence threshold."""
+    usable = [e for e in examples if e.embedding is not None]
+    if not usable:
+        raise ValueError("No routing examples with embeddings to evaluate")
+
+    covered = agreed_covered = agreed_overall = 0
+    start = time.perf_counter()
+    for example in usable:
+        sources, confidence = model.predict(example.embedding or [])
+        agrees = _label(sources) == _label(example.sources)
+        agreed_overall += agrees
+        if confidence >= threshold:
+            covered += 1
+            agreed_covered += agrees
+    predict_ms = (time.perf_counter() - start) * 1000 / len(usable)
+
+    def _mean(values: list[float | None]) -> float | None:
+        present = [v for v in values if v is not None]
+        return sum(present) / len(present) if present else None
+
+    llm_ms = _mean([e.llm_latency_ms for e in usable])
+    embed_ms = _mean([e.embed_latency_ms for e in usable])
+    coverage = covered / len(usable)
+
+    # Every query now pays the embedding; covered queries skip the LLM call
+    saved = None
+    if llm_ms is not None:
+        saved = coverage * llm_ms - (embed_ms or 0.0) - predict_ms
+
+    return EvaluationReport(
+        examples=len(usable),
+        threshold=threshold,
+        coverage=coverage,
+        agreement_covered=agreed_covered / covered if covered else None,
+        agreement_overall=agreed_overall / len(usable),
+        predict_ms=predict_ms,
+        llm_latency_ms=llm_ms,
+        embed_latency_ms=embed_ms,
+        saved_ms_per_query=saved,
+    )
+
+
+class LearnedRouter:
+    """
+    QueryRouter backed by a trained CentroidModel.
+
+    Defers (returns None) until a model file exists or when the prediction is
+    below the confidence threshold. The model is reloaded when the file
+    changes, so retraining takes effect without a restart. Also records LLM
+    fallback decisions to the decision log, reusing the embedding computed
+    while routing.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        model_path: Path,
+        decision_log: DecisionLog | None = None,
+        threshold: float = 0.85,
+        sub_query: Callable[[str], str] = str.strip,
+        name: str = "learned",
+    ):
+        self._embeddings = embeddings
+        self._model_path = model_path
+        self._decision_log = decision_log
+        self._threshold = threshold
+        self._sub_query = sub_query
+        self._name = name
+        self._model: CentroidModel | None = None
+        self._model_mtime: float | None = None
+        self._lock = threading.Lock()
+        self._recent: OrderedDict[str, tuple[list[float], float]] = OrderedDict()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def _current_model(self) -> CentroidModel | None:
+        """Load the model, reloading it when the file is retrained."""
+        try:
+            mtime = self._model_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            if self._model is None or mtime != self._model_mtime:
+                self._model = CentroidModel.load(self._model_path)
+                self._model_mtime = mtime
+            return self._model
+
+    def _remember(self, query: str, embedding: list[float], latency_ms: float) -> None:
+        with self._lock:
+            self._recent[query] = (embedding, latency_ms)
+            self._recent.move_to_end(query)
+            while len(self._recent) > _EMBEDDING_MEMO_SIZE:
+                self._recent.popitem(last=False)
+
+    async def aroute(self, query: str) -> RoutingDecision | None:
+        """Route locally if a model exists and is confident enough."""
+        model = self._current_model()
+        if model is None:
+            return None
+
+        start = time.perf_counter()
+        embedding = await self._embeddings.aembed_query(query)
+        self._remember(query, embedding, (time.perf_counter() - start) * 1000)
+
+        sources, confidence = model.predict(embedding)
+        if confidence < self._threshold:
+            return None
+
+        sub_query = self._sub_query(query)
+        return RoutingDecision(
+            routes=dict.fromkeys(sources, sub_query),
+            router=self._name,
+            confidence=confidence,
+        )
+
+    async def arecord(
+        self, query: str, sources: Sequence[str], llm_latency_ms: float
+    ) -> None:
+        """Log an LLM routing decision as a training example."""
+        if self._decision_log is None:
+            return
+        with self._lock:
+            embedding, embed_ms = self._recent.pop(query, (None, None))
+        example = RoutingExample(
+            query=query,
+            sources=sorted(set(sources)),
+            embedding=embedding,
+            llm_latency_ms=round(llm_latency_ms, 1),
+            embed_latency_ms=round(embed_ms, 1) if embed_ms is not None else None,
+        )
+        try:
+            await asyncio.to_thread(self._decision_log.append, example)
+        except OSError as e:
+            await logger.awarning("routing_decision_log_failed", error=str(e))
@@ -0,0 +1,129 @@
+"""
+Deterministic rule-engine router.
+
+Resolves lexically unambiguous queries (explicit document references, clear
+intent keywords) locally and builds the keyword sub-query itself. Anything
+ambiguous is deferred to the caller's fallback router.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from itertools import groupby
+
+from langgraph_runner.routing.base import RoutingDecision
+
+# Words that carry no retrieval signal in a keyword sub-query
+DEFAULT_STOPWORDS = frozenset({
+    "a", "about", "according", "all", "an", "and", "any", "are", "as", "at",
+    "be", "by", "can", "compare", "could", "did", "do", "does", "for", "from",
+    "give", "has", "have", "how", "i", "in", "is", "it", "its", "list", "me",
+    "of", "on", "or", "please", "say", "says", "show", "tell", "that", "the",
+    "their", "there", "these", "this", "to", "versus", "vs", "was", "were",
+    "what", "when", "where", "which", "who", "why", "with", "would", "you",
+})  # fmt: skip
+
+_TOKEN_PATTERN = re.compile(r"[\w$%&.+-]+")
+
+
+@dataclass(frozen=True)
+class RoutingRule:
+    """
+    A lexical routing rule.
+
+    Rules are evaluated in ascending priority tiers. Within the first tier
+    that has any match, all matching rules must agree on the same sources,
+    otherwise the query is treated as ambiguous.
+    """
+
+    name: str
+    sources: frozenset[str]
+    patterns: tuple[str, ...]
+    priority: int = 0
+    strip_from_query: bool = False  # Drop matched text (e.g. document names)
+
+    def compiled(self) -> list[re.Pattern[str]]:
+        return [re.compile(p, re.IGNORECASE) for p in self.patterns]
+
+
+def keyword_query(
+    query: str,
+    strip_patterns: Iterable[re.Pattern[str]] = (),
+    stopwords: frozenset[str] = DEFAULT_STOPWORDS,
+) -> str:
+    """
+    Build a retrieval-optimized keyword query.
+
+    Removes document references and stopwords, keeping entity and topic terms
+    in their original order. Falls back to the original query if nothing is left.
+    """
+    text = query
+    for pattern in strip_patterns:
+        text = pattern.sub(" ", text)
+
+    seen: set[str] = set()
+    keywords = []
+    for raw_token in _TOKEN_PATTERN.findall(text):
+        token = raw_token.strip(".-+")
+        lowered = token.lower()
+        if not token or lowered in stopwords or lowered in seen:
+            continue
+        seen.add(lowered)
+        keywords.append(token)
+
+    return " ".join(keywords) or query.strip()
+
+
+class RuleRouter:
+    """Rule-engine pre-classifier implementing the QueryRouter protocol."""
+
+    def __init__(
+        self,
+        rules: Sequence[RoutingRule],
+        stopwords: frozenset[str] = DEFAULT_STOPWORDS,
+        name: str = "rules",
+    ):
+        self._name = name
+        self._stopwords = stopwords
+        ordered = sorted(rules, key=lambda r: r.priority)
+        self._tiers = [
+            [(rule, rule.compiled()) for rule in tier]
+            for _, tier in groupby(ordered, key=lambda r: r.priority)
+        ]
+        self._strip_patterns = [
+            pattern
+            for rule in ordered
+            if rule.strip_from_query
+            for pattern in rule.compiled()
+        ]
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def sub_query(self, query: str) -> str:
+        """Keyword sub-query with this router's document references removed."""
+        return keyword_query(query, self._strip_patterns, self._stopwords)
+
+    def route(self, query: str) -> RoutingDecision | None:
+        """Resolve the query locally, or return None if it is ambiguous."""
+        for tier in self._tiers:
+            matched = [
+                rule
+                for rule, patterns in tier
+                if any(p.search(query) for p in patterns)
+            ]
+            if not matched:
+                continue
+            if len({rule.sources for rule in matched}) > 1:
+                return None
+
+            return RoutingDecision(
+                routes=dict.fromkeys(sorted(matched[0].sources), self.sub_query(query)),
+                router=self._name,
+                matched=[rule.name for rule in matched],
+            )
+        return None
+
+    async def aroute(self, query: str) -> RoutingDecision | None:
+        return self.route(query)
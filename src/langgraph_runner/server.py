@@ -0,0 +1,398 @@
+"""
+ASGI entry point for chat over HTTP.
+
+Generic controller that serves any registered graph, like the CLI in main.py.
+Written against the bare ASGI interface so any ASGI server can host it; the
+`serve` command runs it under uvicorn (`server` extra).
+
+Endpoints:
+    GET  /health                  200 while serving, 503 while draining
+    GET  /graphs                  Registered graph names
+    POST /graphs/{graph}/chat     JSON body -> {"content", "thread_id"}
+    POST /graphs/{graph}/stream   JSON body -> text/event-stream of tokens
+
+Request body: {"message": str, "thread_id"?: str, "model_id"?: str,
+"temperature"?: float, "timeout_s"?: float, "model_tier"?: "auto" | "fast" |
+"default", "events"?: bool}. Without a thread_id each request gets a new
+thread; without timeout_s the deadline is REQUEST_TIMEOUT; without model_tier
+the graph's tier setting applies. With "events": true, /stream also sends
+progress events (classified, retrieved, synthesis_started, first_token, ...)
+and a closing "timing" event before "done" (see progress.py).
+Responses carry an X-Request-ID header (echoed from the request if sent).
+Requests shed by admission control get a 503 (or an "error" event mid-stream).
+"""
+
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, MutableMapping
+from typing import Any, get_args
+
+import langgraph_runner.graphs.jpm_rag  # Import to trigger registration
+import langgraph_runner.graphs.jpm_react_agent  # noqa: F401  # Import to trigger registration
+from langgraph_runner.admission import AdmissionRejected
+from langgraph_runner.cancellation import closing_stream
+from langgraph_runner.config import settings
+from langgraph_runner.deadline import deadline_after
+from langgraph_runner.graphs.registry import REGISTRY, get_runner, list_graphs
+from langgraph_runner.logging import get_logger, logging_context
+from langgraph_runner.logging.controllers.http import (
+    REQUEST_ID_HEADER,
+    http_request_context,
+    new_request_id,
+)
+from langgraph_runner.metrics import metrics
+from langgraph_runner.models import model_pool
+from langgraph_runner.services.chat import ChatService
+from langgraph_runner.tiering import TierSetting
+
+logger = get_logger(__name__)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+_MAX_BODY_BYTES = 1 << 20
+
+
+class HTTPError(Exception):
+    """Error returned to the client as a JSON body with a status code."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _sse_event(event: str, data: dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class ChatServer:
+    """
+    ASGI application serving ChatService for every registered graph.
+
+    One ChatService (and runner) is created per graph on first use and shared
+    by all requests, so checkpointed threads and warm clients persist across
+    requests. On shutdown the server stops accepting chat requests and waits
+    up to drain_timeout for in-flight ones before closing connections.
+    """
+
+    def __init__(
+        self,
+        warmup_graphs: tuple[str, ...] = (settings.DEFAULT_GRAPH,),
+        drain_timeout: float = settings.SERVER_DRAIN_TIMEOUT,
+    ):
+        self._warmup_graphs = warmup_graphs
+        self._drain_timeout = drain_timeout
+        self._services: dict[str, ChatService] = {}
+        self._services_lock = asyncio.Lock()
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._draining = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    # -- Lifespan ----------------------------------------------------------
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.astartup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.ashutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def astartup(self) -> None:
+        """Create and warm services for the configured graphs."""
+        for graph in self._warmup_graphs:
+            service = await self._service(graph)
+            await service.awarmup()
+        await logger.ainfo("server_started", graphs=list_graphs())
+
+    async def ashutdown(self) -> None:
+        """Drain in-flight requests, then close this loop's connections."""
+        self._draining = True
+        await logger.ainfo("server_draining", inflight=self._inflight)
+        try:
+            await asyncio.wait_for(self._idle.wait(), self._drain_timeout)
+        except TimeoutError:
+            await logger.awarning(
+                "server_drain_timeout",
+                inflight=self._inflight,
+                timeout_s=self._drain_timeout,
+            )
+        await model_pool.aclose()
+        await logger.ainfo("server_stopped", **metrics.snapshot())
+
+    # -- Requests ----------------------------------------------------------
+
+    async def _service(self, graph: str) -> ChatService:
+        """Shared service for a graph, created on first use."""
+        if graph not in REGISTRY:
+            raise HTTPError(404, f"Unknown graph: {graph}")
+        async with self._services_lock:
+            service = self._services.get(graph)
+            if service is None:
+                # Building a runner opens vector stores, which blocks
+                runner = await asyncio.to_thread(get_runner, graph)
+                service = self._services[graph] = ChatService(runner)
+        return service
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+        request_id = headers.get(REQUEST_ID_HEADER) or new_request_id()
+        method, path = scope["method"], scope["path"]
+
+        with http_request_context(request_id, method, path):
+            try:
+                await self._route(method, path, request_id, receive, send)
+            except HTTPError as e:
+                await self._send_json(send, e.status, {"error": e.detail}, request_id)
+            except AdmissionRejected as e:
+                await logger.awarning("http_request_shed", gate=e.gate, reason=e.reason)
+                await self._send_json(
+                    send, 503, {"error": "Server overloaded, retry later"}, request_id
+                )
+            except Exception as e:
+                await logger.aexception("http_request_failed", error=str(e))
+                await self._send_json(
+                    send, 500, {"error": "Internal server error"}, request_id
+                )
+
+    async def _route(
+        self, method: str, path: str, request_id: str, receive: Receive, send: Send
+    ) -> None:
+        parts = [p for p in path.split("/") if p]
+        match parts:
+            case ["health"]:
+                if method != "GET":
+                    raise HTTPError(405, "Method not allowed")
+                status = 503 if self._draining else 200
+                body = {"status": "draining" if self._draining else "ok"}
+                await self._send_json(send, status, body, request_id)
+            case ["graphs"]:
+                if method != "GET":
+                    raise HTTPError(405, "Method not allowed")
+                await self._send_json(send, 200, {"graphs": list_graphs()}, request_id)
+            case ["graphs", graph, ("chat" | "stream") as action]:
+                if method != "POST":
+                    raise HTTPError(405, "Method not allowed")
+                if self._draining:
+                    raise HTTPError(503, "Server is shutting down")
+                body = await self._read_json(receive)
+                await self._track(
+                    self._chat(graph, action, body, request_id, receive, send)
+                )
+            case _:
+                raise HTTPError(404, "Not found")
+
+    async def _track(self, request: Awaitable[None]) -> None:
+        """Count a chat request as in flight for shutdown draining."""
+        self._inflight += 1
+        self._idle.clear()
+        try:
+            await request
+        finally:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._idle.set()
+
+    async def _chat(
+        self,
+        graph: str,
+        action: str,
+        body: dict[str, Any],
+        request_id: str,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        message = body.get("message")
+        if not isinstance(message, str) or not message.strip():
+            raise HTTPError(400, "'message' must be a non-empty string")
+        try:
+            temperature = float(body.get("temperature", settings.DEFAULT_TEMPERATURE))
+        except (TypeError, ValueError) as e:
+            raise HTTPError(400, "'temperature' must be a number") from e
+        thread_id = str(body.get("thread_id") or uuid.uuid4())
+        kwargs = {
+            "model_id": body.get("model_id") or settings.MODEL_ID,
+            "temperature": temperature,
+        }
+        if "timeout_s" in body:
+            try:
+                timeout_s = float(body["timeout_s"])
+            except (TypeError, ValueError) as e:
+                raise HTTPError(400, "'timeout_s' must be a number") from e
+            if not timeout_s > 0:
+                raise HTTPError(400, "'timeout_s' must be positive")
+            kwargs["deadline"] = deadline_after(timeout_s)
+        if "model_tier" in body:
+            if body["model_tier"] not in get_args(TierSetting):
+                raise HTTPError(
+                    400, f"'model_tier' must be one of {list(get_args(TierSetting))}"
+                )
+            kwargs["model_tier"] = body["model_tier"]
+        events = body.get("events", False)
+        if not isinstance(events, bool):
+            raise HTTPError(400, "'events' must be a boolean")
+        service = await self._service(graph)
+
+        with logging_context(graph_name=graph, thread_id=thread_id):
+            await logger.ainfo("http_chat_request", action=action)
+            if action == "chat":
+                content = await service.achat(message, thread_id=thread_id, **kwargs)
+                await self._send_json(
+                    send, 200, {"content": content, "thread_id": thread_id}, request_id
+                )
+            else:
+                await self._stream(
+                    service,
+                    message,
+                    thread_id,
+                    kwargs,
+                    request_id,
+                    receive,
+                    send,
+                    events,
+                )
+
+    async def _stream(
+        self,
+        service: ChatService,
+        message: str,
+        thread_id: str,
+        kwargs: dict[str, Any],
+        request_id: str,
+        receive: Receive,
+        send: Send,
+        events: bool = False,
+    ) -> None:
+        """
+        Stream tokens as Server-Sent Events, stopping if the client leaves.
+
+        With events, progress events are sent between the tokens, named by
+        type with their t and data (progress.py).
+        """
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode()),
+                ],
+            }
+        )
+
+        async def sse() -> AsyncIterator[bytes]:
+            if events:
+                async with closing_stream(
+                    service.astream_events(message, thread_id=thread_id, **kwargs)
+                ) as stream:
+                    async for event in stream:
+                        yield _sse_event(event.type, {"t": event.t, **event.data})
+            else:
+                async with closing_stream(
+                    service.astream_chat(message, thread_id=thread_id, **kwargs)
+                ) as chunks:
+                    async for chunk in chunks:
+                        yield _sse_event("token", {"content": chunk})
+
+        async def pump() -> None:
+            try:
+                # Closed even if sending fails, so the graph stops with it
+                async with closing_stream(sse()) as bodies:
+                    async for body in bodies:
+                        await send(
+                            {
+                                "type": "http.response.body",
+                                "body": body,
+                                "more_body": True,
+                            }
+                        )
+                final = _sse_event("done", {"thread_id": thread_id})
+            except AdmissionRejected as e:
+                await logger.awarning("http_request_shed", gate=e.gate, reason=e.reason)
+                final = _sse_event("error", {"error": "Server overloaded, retry later"})
+            except Exception as e:
+                # Headers are sent; report the failure in-stream
+                await logger.aexception("http_stream_failed", error=str(e))
+                final = _sse_event("error", {"error": "Internal server error"})
+            await send({"type": "http.response.body", "body": final})
+
+        async def wait_for_disconnect() -> None:
+            while (await receive())["type"] != "http.disconnect":
+                pass
+
+        streaming = asyncio.create_task(pump())
+        disconnected = asyncio.create_task(wait_for_disconnect())
+        done, _ = await asyncio.wait(
+            {streaming, disconnected}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if streaming not in done:
+            # Stop generating for a client that is gone
+            streaming.cancel()
+            await logger.ainfo("http_client_disconnected")
+        disconnected.cancel()
+        await asyncio.gather(streaming, disconnected, return_exceptions=True)
+
+    # -- Helpers -----------------------------------------------------------
+
+    @staticmethod
+    async def _read_json(receive: Receive) -> dict[str, Any]:
+        body = b""
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "Client disconnected")
+            body += message.get("body", b"")
+            if len(body) > _MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large")
+            if not message.get("more_body"):
+                break
+        try:
+            data = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        return data
+
+    @staticmethod
+    async def _send_json(
+        send: Send, status: int, body: dict[str, Any], request_id: str
+    ) -> None:
+        payload = json.dumps(body).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode()),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def create_app() -> ChatServer:
+    """ASGI app factory, e.g. `uvicorn --factory langgraph_runner.server:create_app`."""
+    return ChatServer()
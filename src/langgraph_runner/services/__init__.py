@@ -1,7 +1,9 @@
 """Application services."""
 
-from langgraph_runner.services.chat import ChatService
+from langgraph_runner.services.chat import BatchItem, BatchResult, ChatService
 
 __all__ = [
+    "BatchItem",
+    "BatchResult",
     "ChatService",
 ]
@@ -4,9 +4,54 @@ Chat service for orchestrating graph execution.
 Works with any graph that implements the PregelRunner protocol.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from dataclasses import dataclass
 
+import structlog
+
+from langgraph_runner.admission import admission_priority
+from langgraph_runner.cancellation import closing_stream, record_abandoned
+from langgraph_runner.config import settings
+from langgraph_runner.deadline import deadline_after
 from langgraph_runner.graphs.base.runner import ChatRequest, PregelRunner
+from langgraph_runner.metrics import metrics
+from langgraph_runner.progress import StreamEvent
+
+logger = structlog.stdlib.get_logger(__name__)
+
+BATCH_LATENCY_METRIC = "chat.batch.latency_ms"
+# Chunks streamed to callers who then left, i.e. output generated for nobody
+CANCELLED_CHUNKS_METRIC = "cancelled.chat.chunks"
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One question in a batch. Without a thread_id each item gets its own thread."""
+
+    id: str
+    message: str
+    thread_id: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Answer (or error) for a BatchItem."""
+
+    id: str
+    content: str | None
+    error: str | None
+    latency_s: float
+
+
+async def _aiter(items: Iterable[BatchItem] | AsyncIterable[BatchItem]):
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
 
 
 class ChatService:
@@ -21,14 +66,21 @@ class ChatService:
         """Return the name of the underlying graph."""
         return self._runner.name
 
+    async def awarmup(self) -> None:
+        """Warm the runner's clients and indexes on the current event loop."""
+        await self._runner.awarmup()
+
+    @staticmethod
+    def _request(message: str, **kwargs) -> ChatRequest:
+        """Build a request, due REQUEST_TIMEOUT from now unless a deadline is given."""
+        kwargs.setdefault("deadline", deadline_after(settings.REQUEST_TIMEOUT))
+        return ChatRequest(messages=[{"role": "user", "content": message}], **kwargs)
+
     def chat(
         self, message: str, thread_id: str = "default", **kwargs
     ) -> str:
         """Send a message and get a response."""
-        request = ChatRequest(
-            messages=[{"role": "user", "content": message}],
-            **kwargs,
-        )
+        request = self._request(message, **kwargs)
         response = self._runner.invoke(request, thread_id=thread_id)
         return response.content
 
@@ -36,20 +88,141 @@ class ChatService:
         self, message: str, thread_id: str = "default", **kwargs
     ) -> str:
         """Async version of chat."""
-        request = ChatRequest(
-            messages=[{"role": "user", "content": message}],
-            **kwargs,
-        )
-        response = await self._runner.ainvoke(request, thread_id=thread_id)
+        request = self._request(message, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = await self._runner.ainvoke(request, thread_id=thread_id)
+        except asyncio.CancelledError:
+            self._record_cancelled(start)
+            raise
         return response.content
 
     async def astream_chat(
         self, message: str, thread_id: str = "default", **kwargs
     ) -> AsyncIterator[str]:
-        """Stream the response."""
-        request = ChatRequest(
-            messages=[{"role": "user", "content": message}],
-            **kwargs,
+        """
+        Stream the response.
+
+        Cancelling the consuming task, or closing this stream before the end,
+        cancels the graph run beneath it (see cancellation.py).
+        """
+        request = self._request(message, **kwargs)
+        # Closed with this stream, so the run stops as soon as the caller leaves
+        async with closing_stream(
+            self._guard(self._runner.astream(request, thread_id=thread_id))
+        ) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def astream_events(
+        self, message: str, thread_id: str = "default", **kwargs
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream the response as "token" events among progress events."""
+        request = self._request(message, **kwargs)
+        async with closing_stream(
+            self._guard(self._runner.astream_events(request, thread_id=thread_id))
+        ) as events:
+            async for event in events:
+                yield event
+
+    async def _guard[T](self, stream: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Close stream when the caller leaves, recording what was wasted."""
+        start = time.perf_counter()
+        chunks = 0
+        try:
+            async with closing_stream(stream):
+                async for chunk in stream:
+                    chunks += 1
+                    yield chunk
+        except (asyncio.CancelledError, GeneratorExit):
+            self._record_cancelled(start, chunks)
+            raise
+
+    def _record_cancelled(self, start: float, chunks: int | None = None) -> None:
+        """Record a request its caller abandoned before it finished."""
+        elapsed_s = time.perf_counter() - start
+        record_abandoned("chat", elapsed_s)
+        if chunks is not None:
+            metrics.observe(CANCELLED_CHUNKS_METRIC, chunks)
+        # Sync logging: the task is being cancelled
+        logger.info(
+            "chat_cancelled",
+            graph=self.graph_name,
+            elapsed_ms=round(elapsed_s * 1000, 1),
+            chunks=chunks,
+        )
+
+    async def abatch_chat(
+        self,
+        items: Iterable[BatchItem] | AsyncIterable[BatchItem],
+        concurrency: int = 8,
+        **kwargs,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Answer many questions over the shared runner with bounded concurrency.
+
+        Items are pulled lazily, so large inputs are never fully loaded, and
+        results are yielded in completion order as soon as each finishes. A
+        failed item yields a result with error set instead of stopping the
+        batch. Provider calls are admitted with batch priority, behind
+        interactive requests.
+
+        Args:
+            items: Questions to answer
+            concurrency: Max questions in flight
+            **kwargs: ChatRequest fields (model_id, temperature). Each item
+                gets its own REQUEST_TIMEOUT deadline when it starts.
+        """
+        pending: asyncio.Queue[BatchItem | None] = asyncio.Queue(concurrency)
+        results: asyncio.Queue[BatchResult | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for item in _aiter(items):
+                    await pending.put(item)
+            finally:
+                for _ in range(concurrency):
+                    await pending.put(None)
+
+        async def work() -> None:
+            try:
+                with admission_priority("batch"):
+                    while (item := await pending.get()) is not None:
+                        results.put_nowait(await self._answer(item, **kwargs))
+            finally:
+                results.put_nowait(None)
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(concurrency)]
+        try:
+            remaining = concurrency
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                else:
+                    yield result
+            # Surface producer errors (e.g. unreadable input)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _answer(self, item: BatchItem, **kwargs) -> BatchResult:
+        start = time.perf_counter()
+        content: str | None
+        error: str | None
+        try:
+            content = await self.achat(
+                item.message, thread_id=item.thread_id or f"batch-{item.id}", **kwargs
+            )
+        except Exception as e:
+            await logger.awarning("batch_item_failed", item_id=item.id, error=str(e))
+            content, error = None, f"{type(e).__name__}: {e}"
+        else:
+            error = None
+        latency_s = time.perf_counter() - start
+        metrics.observe(BATCH_LATENCY_METRIC, latency_s * 1000)
+        return BatchResult(
+            id=item.id, content=content, error=error, latency_s=latency_s
         )
-        async for chunk in self._runner.astream(request, thread_id=thread_id):
-            yield chunk
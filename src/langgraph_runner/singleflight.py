@@ -0,0 +1,158 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same thing at once (the same normalized query
+and config against a stateless graph), only the first runs it; the others wait
+on the same execution and get the same result. Streams are broadcast: every
+subscriber receives the full token stream, with tokens emitted before it
+joined replayed first.
+
+Nothing is cached: a key is forgotten as soon as its execution finishes, so a
+later identical request runs again. The shared execution is cancelled only
+once every waiter has gone. Each call records "<name>.hit" (joined an
+execution) or "<name>.miss" (started one), so metrics.hit_rate(name) is the
+coalescing rate.
+"""
+
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from langgraph_runner.cancellation import closing_stream
+from langgraph_runner.metrics import metrics
+
+T = TypeVar("T")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, for coalescing keys."""
+    return _WHITESPACE.sub(" ", query).strip().casefold()
+
+
+class _Broadcast:
+    """Chunks of one stream, kept for replay until the stream ends."""
+
+    def __init__(self) -> None:
+        self.chunks: list[Any] = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+        self.task: asyncio.Task[None] | None = None
+
+    def _notify(self) -> None:
+        # Wake current waiters; later waiters wait on a fresh event
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def publish(self, chunk: Any) -> None:
+        self.chunks.append(chunk)
+        self._notify()
+
+    def close(self, error: BaseException | None = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    Use one instance per kind of request; keys only need to be unique within
+    an instance. Not thread-safe: all callers must share one event loop.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Metric prefix for the hit/miss counters
+        """
+        self.name = name
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self._streams: dict[Hashable, _Broadcast] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn(), or the in-flight call already running for key."""
+        task = self._calls.get(key)
+        if task is None:
+            metrics.incr(f"{self.name}.miss")
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._forget_call(key, t))
+        else:
+            metrics.incr(f"{self.name}.hit")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # Shielded so one waiter leaving does not cancel the others' result
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not task.done():
+                    task.cancel()
+
+    def _forget_call(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Waiters that left early never retrieve the result
+        if not task.cancelled():
+            task.exception()
+
+    async def stream(
+        self, key: Hashable, fn: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        """Iterate fn(), or the in-flight stream already running for key."""
+        broadcast = self._streams.get(key)
+        if broadcast is None:
+            metrics.incr(f"{self.name}.miss")
+            broadcast = self._streams[key] = _Broadcast()
+            broadcast.task = asyncio.create_task(self._pump(key, broadcast, fn))
+        else:
+            metrics.incr(f"{self.name}.hit")
+
+        broadcast.subscribers += 1
+        try:
+            sent = 0
+            while True:
+                changed = broadcast.changed
+                while sent < len(broadcast.chunks):
+                    yield broadcast.chunks[sent]
+                    sent += 1
+                if broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    return
+                await changed.wait()
+        finally:
+            broadcast.subscribers -= 1
+            if not broadcast.subscribers and not broadcast.done:
+                broadcast.task.cancel()  # type: ignore[union-attr]
+
+    async def _pump(
+        self,
+        key: Hashable,
+        broadcast: _Broadcast,
+        fn: Callable[[], AsyncIterator[Any]],
+    ) -> None:
+        """Run the shared stream, publishing chunks to all subscribers."""
+        try:
+            stream = fn()
+            async with closing_stream(stream):
+                async for chunk in stream:
+                    broadcast.publish(chunk)
+        except Exception as e:
+            broadcast.close(e)
+        except asyncio.CancelledError:
+            broadcast.close(asyncio.CancelledError())
+            raise
+        else:
+            broadcast.close()
+        finally:
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
@@ -0,0 +1,106 @@
+"""
+Complexity-aware model tiering.
+
+Picks the model for a synthesis or agent step from cheap local signals, so
+simple lookups and greetings run on FAST_MODEL_ID while comparisons,
+multi-source questions and large contexts keep the configured model.
+
+Graphs set their tier ("auto", "fast" or "default") in their config, and a
+request can override it with ChatRequest.model_tier. "default" is the
+request's model_id, so tiering is off unless a graph or request opts in.
+Decisions are counted as "model_tier.<tier>" metrics and logged by the
+calling node.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Literal
+
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import metrics
+from langgraph_runner.tokens import count_tokens
+
+ModelTier = Literal["fast", "default"]
+TierSetting = Literal["auto", "fast", "default"]
+
+_COMPARISON = re.compile(
+    r"\b(compar\w*|versus|vs|contrast\w*|differences?)\b",
+    re.IGNORECASE,
+)
+
+
+def is_comparison(query: str) -> bool:
+    """Whether the query asks to compare things."""
+    return _COMPARISON.search(query) is not None
+
+
+@dataclass(frozen=True)
+class TierSignals:
+    """Cheap signals of how hard a step is."""
+
+    query_tokens: int
+    context_tokens: int
+    sources: int = 1
+    comparison: bool = False
+
+    @classmethod
+    def from_query(
+        cls, query: str, context_tokens: int, sources: int = 1
+    ) -> "TierSignals":
+        return cls(
+            query_tokens=count_tokens(query),
+            context_tokens=context_tokens,
+            sources=sources,
+            comparison=is_comparison(query),
+        )
+
+
+@dataclass(frozen=True)
+class TierDecision:
+    """The model chosen for a step and why."""
+
+    tier: ModelTier
+    model_id: str
+    reason: str
+
+
+def choose_tier(signals: TierSignals) -> tuple[ModelTier, str]:
+    """The tier the signals call for, with the deciding reason."""
+    if signals.comparison:
+        return "default", "comparison"
+    if signals.sources > settings.TIERING_MAX_SOURCES:
+        return "default", "multiple_sources"
+    if signals.context_tokens > settings.TIERING_MAX_CONTEXT_TOKENS:
+        return "default", "large_context"
+    if signals.query_tokens > settings.TIERING_MAX_QUERY_TOKENS:
+        return "default", "long_query"
+    return "fast", "simple"
+
+
+def select_model(
+    setting: TierSetting,
+    model_id: str,
+    fast_model_id: str,
+    signals: TierSignals | None = None,
+) -> TierDecision:
+    """
+    Model for a step under a tier setting.
+
+    Args:
+        setting: "auto" to choose from signals, or a fixed tier
+        model_id: Model of the "default" tier
+        fast_model_id: Model of the "fast" tier
+        signals: Required for "auto"
+    """
+    if setting == "auto":
+        if signals is None:
+            raise ValueError("Tier 'auto' needs signals")
+        tier, reason = choose_tier(signals)
+    else:
+        tier, reason = setting, "configured"
+    metrics.incr(f"model_tier.{tier}")
+    return TierDecision(
+        tier=tier,
+        model_id=fast_model_id if tier == "fast" else model_id,
+        reason=reason,
+    )
@@ -0,0 +1,49 @@
+"""
+Token counting for prompt budgeting.
+
+Uses tiktoken's o200k_base encoding (GPT-4o / GPT-5 family). If the encoding
+cannot be loaded (e.g. offline without a cached BPE file), falls back to a
+~4 characters per token estimate so budgeting degrades instead of failing.
+"""
+
+from functools import cache
+
+import structlog
+import tiktoken
+from langchain_core.documents import Document
+
+logger = structlog.stdlib.get_logger(__name__)
+
+TOKEN_ENCODING = "o200k_base"
+
+# Metadata key holding a chunk's token count, written at ingest
+TOKEN_COUNT_KEY = "token_count"
+
+_CHARS_PER_TOKEN = 4
+
+
+@cache
+def _encoding() -> tiktoken.Encoding | None:
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception as e:
+        logger.warning(
+            "token_encoding_unavailable", encoding=TOKEN_ENCODING, error=str(e)
+        )
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text (estimated if the encoding is unavailable)."""
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def document_tokens(doc: Document) -> int:
+    """Token count stored on a chunk at ingest, counting it if missing."""
+    stored = doc.metadata.get(TOKEN_COUNT_KEY)
+    if isinstance(stored, int):
+        return stored
+    return count_tokens(doc.page_content)
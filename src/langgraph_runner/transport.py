@@ -0,0 +1,483 @@
+"""
+Shared HTTP clients for provider SDKs.
+
+Keeps one keep-alive connection pool per process for sync calls and one per
+event loop for async calls, so model and embedding clients reuse warm TLS
+connections instead of opening a new pool per instance.
+
+Requests that name a model are paced by the process-wide rate limiter, which
+also retries 429s after backing off every caller of the model. Async chat
+model requests additionally pass through the model's admission gate, are
+recorded as wasted work if cancelled mid-flight (cancellation.py), and
+clients from async_client(hedged=True) hedge slow requests (hedging.py)
+once the rate limiter has dispatched them.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+import httpx
+
+from langgraph_runner.admission import admission
+from langgraph_runner.cancellation import record_abandoned
+from langgraph_runner.config import settings
+from langgraph_runner.hedging import ModelHedger, hedging
+from langgraph_runner.metrics import metrics
+from langgraph_runner.ratelimit import rate_limiter
+
+_BYTES_PER_TOKEN = 4
+
+
+def _create_limits() -> httpx.Limits:
+    """Build connection pool limits from settings."""
+    return httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None when called from sync code."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@dataclass(frozen=True)
+class ProviderRequest:
+    """What rate limiting and admission need to know about a provider call."""
+
+    model: str
+    tokens: int
+
+
+# Request extension caching the parsed ProviderRequest across transports
+_PROVIDER_REQUEST_KEY = "langgraph_runner.provider_request"
+
+# Request extension holding an event set once the request leaves the rate
+# limiter, so hedging times the provider rather than the wait for budget
+_DISPATCHED_KEY = "langgraph_runner.dispatched"
+
+
+def _mark_dispatched(request: httpx.Request) -> None:
+    dispatched = request.extensions.get(_DISPATCHED_KEY)
+    if dispatched is not None:
+        dispatched.set()
+
+
+def provider_request(request: httpx.Request) -> ProviderRequest | None:
+    """
+    Model and estimated tokens of a provider request, from its JSON body.
+
+    Tokens are estimated as the body size at ~4 bytes per token plus the
+    requested max output tokens, roughly how providers count TPM up front.
+    """
+    if _PROVIDER_REQUEST_KEY in request.extensions:
+        return request.extensions[_PROVIDER_REQUEST_KEY]
+    info = None
+    if request.method == "POST":
+        try:
+            body = json.loads(request.content)
+        except (httpx.RequestNotRead, ValueError):
+            body = None
+        if isinstance(body, dict) and isinstance(body.get("model"), str):
+            max_output = body.get("max_completion_tokens") or body.get("max_tokens")
+            info = ProviderRequest(
+                model=body["model"],
+                tokens=len(request.content) // _BYTES_PER_TOKEN
+                + (max_output if isinstance(max_output, int) else 0),
+            )
+    request.extensions[_PROVIDER_REQUEST_KEY] = info
+    return info
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """
+    Response body that frees its admission slot once closed, and reports the
+    call abandoned if it is closed because its caller was cancelled.
+    """
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        release: Callable[[], None] | None,
+        abandoned: Callable[[], None] | None = None,
+    ):
+        self._stream = stream
+        self._release = release
+        self._abandoned = abandoned
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+            abandoned, self._abandoned = self._abandoned, None
+            task = asyncio.current_task()
+            if abandoned is not None and task is not None and task.cancelling():
+                abandoned()
+
+
+class AdmissionTransport(httpx.AsyncBaseTransport):
+    """
+    Admits requests through the gate of the model they name.
+
+    The slot is held until the response body is closed, so a streamed
+    completion occupies its slot until the last token. Calls cancelled
+    before their response ends are recorded as wasted work (cancellation.py),
+    with the tokens they were estimated to cost.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        info = provider_request(request)
+        if info is None:
+            return await self._transport.handle_async_request(request)
+
+        release = None
+        if settings.ADMISSION_CONTROL:
+            gate = admission.gate(f"model:{info.model}")
+            await gate.acquire()
+            release = gate.release
+        start = time.monotonic()
+
+        def abandoned() -> None:
+            record_abandoned(f"model.{info.model}", time.monotonic() - start)
+            metrics.incr(f"cancelled.model.{info.model}.tokens", info.tokens)
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            if release is not None:
+                release()
+            if isinstance(e, asyncio.CancelledError):
+                abandoned()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, release, abandoned)
+        return response
+
+
+def _usable(attempt: asyncio.Task[httpx.Response]) -> bool:
+    """Whether a finished attempt got a response worth returning."""
+    if attempt.cancelled() or attempt.exception() is not None:
+        return False
+    status = attempt.result().status_code
+    return status != 429 and status < 500
+
+
+def _close_response(attempt: asyncio.Task[httpx.Response]) -> None:
+    if not attempt.cancelled() and attempt.exception() is None:
+        asyncio.ensure_future(attempt.result().aclose())
+
+
+class HedgingTransport(httpx.AsyncBaseTransport):
+    """
+    Sends a duplicate of requests that outlast their model's recent p95.
+
+    The hedge delay and the latency it is learned from start once the
+    transport below dispatches the request (RateLimitTransport signals it),
+    so time spent waiting for rate limit budget never triggers a hedge. The
+    duplicate goes through the rate limiter too, and only fires if the
+    model's admission gate has a free slot, which it holds until its
+    response is closed.
+
+    The first usable response (not a 429 or 5xx) wins and the other attempt
+    is cancelled, or closed if it already has a response. If neither is
+    usable, the original attempt's outcome is returned. For streamed
+    completions the race is to the response headers, i.e. the first token.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def _send_duplicate(
+        self, request: httpx.Request, release: Callable[[], None] | None
+    ) -> httpx.Response:
+        extensions = dict(request.extensions)
+        extensions.pop(_DISPATCHED_KEY, None)
+        duplicate = httpx.Request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            content=request.content,
+            extensions=extensions,
+        )
+        try:
+            response = await self._transport.handle_async_request(duplicate)
+        except BaseException:
+            if release is not None:
+                release()
+            raise
+        if release is not None:
+            assert isinstance(response.stream, httpx.AsyncByteStream)
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    @staticmethod
+    def _try_hedge(hedger: ModelHedger) -> tuple[bool, Callable[[], None] | None]:
+        """Take a free admission slot and a hedge from the budget, or neither."""
+        release = None
+        if settings.ADMISSION_CONTROL:
+            gate = admission.gate(f"model:{hedger.model}")
+            if not gate.try_acquire():
+                metrics.incr(f"hedge.{hedger.model}.skipped")
+                return False, None
+            release = gate.release
+        if not hedger.try_hedge():
+            if release is not None:
+                release()
+            return False, None
+        return True, release
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        info = provider_request(request)
+        if info is None:
+            return await self._transport.handle_async_request(request)
+
+        hedger = hedging.for_model(info.model)
+        delay = hedger.start()
+        dispatched = request.extensions[_DISPATCHED_KEY] = asyncio.Event()
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._transport.handle_async_request(request))
+        attempts = [primary]
+        winner = None
+        try:
+            signal = asyncio.ensure_future(dispatched.wait())
+            try:
+                await asyncio.wait(
+                    [primary, signal], return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                signal.cancel()
+            if dispatched.is_set():
+                start = time.perf_counter()
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                hedge, release = self._try_hedge(hedger)
+                if hedge:
+                    attempts.append(
+                        asyncio.ensure_future(self._send_duplicate(request, release))
+                    )
+            pending = set(attempts)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = next((a for a in attempts if a in done and _usable(a)), None)
+            if winner is None:
+                # Neither attempt is usable: surface the original's error or response
+                winner = primary
+        finally:
+            for attempt in attempts:
+                if attempt is not winner:
+                    attempt.cancel()
+                    attempt.add_done_callback(_close_response)
+
+        if _usable(winner):
+            hedger.observe(time.perf_counter() - start, hedge_won=winner is not primary)
+        return winner.result()
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """
+    Paces requests that name a model through its shared rate limiter.
+
+    A 429 backs off every caller of the model (see ratelimit.py) and is
+    retried up to RATE_LIMIT_MAX_RETRIES times, so callers are slowed rather
+    than failed. Exhausted quota (insufficient_quota) is returned at once.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        info = provider_request(request) if settings.RATE_LIMITING else None
+        if info is None:
+            _mark_dispatched(request)
+            return await self._transport.handle_async_request(request)
+
+        limiter = rate_limiter.for_model(info.model)
+        attempt = 0
+        while True:
+            delay = limiter.reserve(info.tokens)
+            if delay:
+                await asyncio.sleep(delay)
+            _mark_dispatched(request)
+            response = await self._transport.handle_async_request(request)
+            if response.status_code != 429:
+                limiter.update(response.headers)
+                return response
+            await response.aread()
+            if b"insufficient_quota" in response.content:
+                return response
+            limiter.throttled(response.headers, attempt)
+            if attempt >= settings.RATE_LIMIT_MAX_RETRIES:
+                return response
+            await response.aclose()
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class SyncRateLimitTransport(httpx.BaseTransport):
+    """Sync counterpart of RateLimitTransport, sharing the same budgets."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        info = provider_request(request) if settings.RATE_LIMITING else None
+        if info is None:
+            return self._transport.handle_request(request)
+
+        limiter = rate_limiter.for_model(info.model)
+        attempt = 0
+        while True:
+            delay = limiter.reserve(info.tokens)
+            if delay:
+                time.sleep(delay)
+            response = self._transport.handle_request(request)
+            if response.status_code != 429:
+                limiter.update(response.headers)
+                return response
+            response.read()
+            if b"insufficient_quota" in response.content:
+                return response
+            limiter.throttled(response.headers, attempt)
+            if attempt >= settings.RATE_LIMIT_MAX_RETRIES:
+                return response
+            response.close()
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _RunningLoopTransport(httpx.AsyncBaseTransport):
+    """Sends each request through the running loop's pooled transport."""
+
+    def __init__(self, pool: "HttpClientPool"):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.async_transport().handle_async_request(request)
+
+
+class HttpClientPool:
+    """
+    Process-wide sync client plus one async transport and client per event loop.
+
+    Async connections are bound to the loop that opened them, so async
+    transports are scoped to the running loop and dropped when the loop is
+    collected. Clients that outlive a loop (e.g. an embedding client built at
+    startup) use loop_agnostic_client(), which routes each request through
+    the running loop's transport.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sync_client: httpx.Client | None = None
+        self._async_transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncBaseTransport
+        ] = weakref.WeakKeyDictionary()
+        # Plain and hedged async client per loop, keyed by hedged
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[bool, httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._loop_agnostic_client: httpx.AsyncClient | None = None
+
+    def sync_client(self) -> httpx.Client:
+        """Get the shared sync client, creating it on first use."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    transport=SyncRateLimitTransport(
+                        httpx.HTTPTransport(limits=_create_limits())
+                    ),
+                    follow_redirects=True,
+                )
+            return self._sync_client
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        """Rate-limited connection pool of the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._async_transports.get(loop)
+            if transport is None:
+                transport = self._async_transports[loop] = RateLimitTransport(
+                    httpx.AsyncHTTPTransport(limits=_create_limits())
+                )
+            return transport
+
+    def async_client(self, hedged: bool = False) -> httpx.AsyncClient | None:
+        """
+        Get the async client for the running loop (None outside a loop).
+
+        Args:
+            hedged: Hedge requests that outlast their model's recent p95
+        """
+        loop = running_loop()
+        if loop is None:
+            return None
+        with self._lock:
+            client = self._async_clients.get(loop, {}).get(hedged)
+            if client is not None and not client.is_closed:
+                return client
+        transport = self.async_transport()
+        if hedged:
+            transport = HedgingTransport(transport)
+        client = httpx.AsyncClient(
+            transport=AdmissionTransport(transport), follow_redirects=True
+        )
+        with self._lock:
+            self._async_clients.setdefault(loop, {})[hedged] = client
+        return client
+
+    def loop_agnostic_client(self) -> httpx.AsyncClient:
+        """Async client usable from any event loop, sharing its pooled transport."""
+        with self._lock:
+            if self._loop_agnostic_client is None:
+                self._loop_agnostic_client = httpx.AsyncClient(
+                    transport=_RunningLoopTransport(self), follow_redirects=True
+                )
+            return self._loop_agnostic_client
+
+    async def aclose(self) -> None:
+        """Close the async clients and connections bound to the running loop."""
+        loop = running_loop()
+        if loop is None:
+            return
+        with self._lock:
+            clients = self._async_clients.pop(loop, {})
+            transport = self._async_transports.pop(loop, None)
+        for client in clients.values():
+            await client.aclose()
+        if transport is not None:
+            await transport.aclose()
+
+    def close(self) -> None:
+        """Close the shared sync client."""
+        with self._lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
+
+http_clients = HttpClientPool()
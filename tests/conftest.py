@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+# Settings require an API key at import; unit tests never call the provider
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+os.environ.setdefault("ANONYMIZED_TELEMETRY", "False")
+
+from langgraph_runner.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """Each test starts from empty process-wide metrics."""
+    metrics.reset()
+    yield
+    metrics.reset()
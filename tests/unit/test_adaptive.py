@@ -0,0 +1,62 @@
+import pytest
+from langchain_core.documents import Document
+
+from langgraph_runner.retrieval.adaptive import AdaptiveK, select
+from langgraph_runner.tokens import TOKEN_COUNT_KEY
+
+
+def ranked(*distances: float, tokens: int = 100) -> list[tuple[Document, float]]:
+    return [
+        (Document(page_content=f"chunk {i}", metadata={TOKEN_COUNT_KEY: tokens}), d)
+        for i, d in enumerate(distances)
+    ]
+
+
+def test_no_policy_keeps_everything():
+    results = ranked(0.1, 0.5, 0.9)
+
+    assert select(results) == (results, "exhausted")
+
+
+def test_empty_results():
+    assert select([], 0.5, AdaptiveK(max_relative_gap=0.1)) == ([], "exhausted")
+
+
+def test_max_distance_cut():
+    results = ranked(0.1, 0.2, 0.6, 0.7)
+
+    assert select(results, max_distance=0.5) == (results[:2], "max_distance")
+
+
+def test_max_distance_is_not_relaxed_by_min_k():
+    results = ranked(0.6, 0.7)
+
+    assert select(results, 0.5, AdaptiveK(min_k=2)) == ([], "max_distance")
+
+
+def test_relative_gap_cut():
+    results = ranked(0.4, 0.45, 0.5, 0.8)
+
+    kept, reason = select(results, policy=AdaptiveK(max_relative_gap=0.25))
+
+    assert (kept, reason) == (results[:3], "relative_gap")
+
+
+def test_token_budget_cut():
+    results = ranked(0.1, 0.2, 0.3, 0.4, tokens=100)
+
+    kept, reason = select(results, policy=AdaptiveK(token_budget=250))
+
+    assert (kept, reason) == (results[:2], "token_budget")
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [AdaptiveK(max_relative_gap=0.0, min_k=3), AdaptiveK(token_budget=1, min_k=3)],
+)
+def test_min_k_protects_leading_hits(policy):
+    results = ranked(0.1, 0.5, 0.9, 1.3)
+
+    kept, _ = select(results, policy=policy)
+
+    assert kept == results[:3]
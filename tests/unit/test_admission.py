@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from langgraph_runner.admission import (
+    AdmissionGate,
+    AdmissionRejected,
+    admission_priority,
+    current_priority,
+)
+from langgraph_runner.metrics import metrics
+
+
+def gate(limit=1, max_queue=4, queue_timeout=None) -> AdmissionGate:
+    return AdmissionGate("test", limit, max_queue, queue_timeout)
+
+
+async def settle():
+    """Let queued tasks reach their next await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_admission_priority_scope():
+    assert current_priority() == "interactive"
+    with admission_priority("batch"):
+        assert current_priority() == "batch"
+    assert current_priority() == "interactive"
+
+
+async def test_admits_up_to_limit_without_queueing():
+    g = gate(limit=2)
+
+    await g.acquire()
+    await g.acquire()
+
+    assert g.active == 2
+    assert g.queue_depth == 0
+
+
+async def test_try_acquire_takes_only_a_free_slot():
+    g = gate(limit=1)
+
+    assert g.try_acquire()
+    assert not g.try_acquire()
+    g.release()
+    assert g.try_acquire()
+    assert g.active == 1
+
+
+async def test_release_hands_slot_to_interactive_before_batch():
+    g = gate(limit=1)
+    await g.acquire()
+    order = []
+
+    async def request(name, priority):
+        await g.acquire(priority)
+        order.append(name)
+
+    waiters = [
+        asyncio.create_task(request("batch", "batch")),
+        asyncio.create_task(request("interactive", "interactive")),
+    ]
+    await settle()
+    assert g.queue_depth == 2
+
+    g.release()
+    await settle()
+    g.release()
+    await asyncio.gather(*waiters)
+
+    assert order == ["interactive", "batch"]
+    assert g.active == 1
+
+
+async def test_new_arrivals_do_not_overtake_the_queue():
+    g = gate(limit=1)
+    await g.acquire()
+    queued = asyncio.create_task(g.acquire())
+    await settle()
+
+    g.release()
+    late = asyncio.create_task(g.acquire())
+    await settle()
+
+    assert queued.done()
+    assert not late.done()
+    late.cancel()
+
+
+async def test_sheds_when_queue_is_full():
+    g = gate(limit=1, max_queue=1)
+    await g.acquire()
+    queued = asyncio.create_task(g.acquire())
+    await settle()
+
+    with pytest.raises(AdmissionRejected, match="interactive queue is full"):
+        await g.acquire()
+
+    assert metrics.counter("admission.test.shed") == 1
+    queued.cancel()
+
+
+async def test_sheds_interactive_request_past_its_deadline():
+    g = gate(limit=1, queue_timeout=0.01)
+    await g.acquire()
+
+    with pytest.raises(AdmissionRejected, match="no slot within"):
+        await g.acquire()
+
+    assert g.queue_depth == 0
+
+
+async def test_batch_requests_wait_without_deadline():
+    g = gate(limit=1, queue_timeout=0.01)
+    await g.acquire()
+    queued = asyncio.create_task(g.acquire("batch"))
+
+    await asyncio.sleep(0.05)
+    assert not queued.done()
+
+    g.release()
+    await queued
+
+
+async def test_cancelled_waiter_passes_slot_on():
+    g = gate(limit=1)
+    await g.acquire()
+    first = asyncio.create_task(g.acquire())
+    second = asyncio.create_task(g.acquire())
+    await settle()
+
+    first.cancel()
+    await settle()
+    g.release()
+    await second
+
+    assert g.active == 1
+
+
+async def test_slot_releases_on_exit():
+    g = gate(limit=1)
+
+    async with g.slot():
+        assert g.active == 1
+
+    assert g.active == 0
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from langgraph_runner.main import _completed_ids, _read_batch
+
+
+def write_jsonl(path, lines: list[str]):
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_completed_ids_without_output(tmp_path):
+    assert _completed_ids(tmp_path / "answers.jsonl") == set()
+
+
+def test_completed_ids_skip_errors_and_partial_last_line(tmp_path):
+    output = write_jsonl(
+        tmp_path / "answers.jsonl",
+        [
+            json.dumps({"id": "a", "answer": "ok", "error": None}),
+            json.dumps({"id": 2, "answer": "ok", "error": None}),
+            json.dumps({"id": "b", "answer": None, "error": "timeout"}),
+            '{"id": "c", "answ',
+        ],
+    )
+
+    assert _completed_ids(output) == {"a", "2"}
+
+
+def test_read_batch_skips_blank_lines_and_completed_ids(tmp_path):
+    path = write_jsonl(
+        tmp_path / "questions.jsonl",
+        [
+            json.dumps({"id": "a", "question": "first"}),
+            "",
+            json.dumps({"id": "b", "question": "second"}),
+            json.dumps({"question": "third"}),
+        ],
+    )
+
+    items = list(_read_batch(path, "id", "question", skip={"a"}))
+
+    assert [(item.id, item.message) for item in items] == [
+        ("b", "second"),
+        ("4", "third"),
+    ]
+
+
+def test_resume_answers_only_failed_and_missing(tmp_path):
+    questions = write_jsonl(
+        tmp_path / "questions.jsonl",
+        [json.dumps({"id": i, "q": f"question {i}"}) for i in range(3)],
+    )
+    output = write_jsonl(
+        tmp_path / "answers.jsonl",
+        [
+            json.dumps({"id": "0", "error": None}),
+            json.dumps({"id": "1", "error": "rate limited"}),
+        ],
+    )
+
+    items = _read_batch(questions, "id", "q", _completed_ids(output))
+
+    assert [item.id for item in items] == ["1", "2"]
+
+
+def test_read_batch_requires_question_field(tmp_path):
+    path = write_jsonl(tmp_path / "questions.jsonl", [json.dumps({"id": "a"})])
+
+    with pytest.raises(ValueError, match="questions.jsonl:1"):
+        list(_read_batch(path, "id", "question", skip=set()))
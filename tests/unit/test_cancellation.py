@@ -0,0 +1,209 @@
+import asyncio
+import io
+import os
+import signal
+import sys
+from typing import TypedDict
+
+import httpx
+import pytest
+from langgraph.config import get_stream_writer
+from langgraph.graph import END, START, StateGraph
+
+from langgraph_runner.admission import admission
+from langgraph_runner.cancellation import closing_stream
+from langgraph_runner.config import settings
+from langgraph_runner.main import _ainput, _interruptible
+from langgraph_runner.metrics import metrics
+from langgraph_runner.services.chat import CANCELLED_CHUNKS_METRIC, ChatService
+from langgraph_runner.transport import AdmissionTransport
+
+
+class State(TypedDict, total=False):
+    steps: list[str]
+
+
+def two_step_graph(slow_cancelled: asyncio.Event):
+    """A fast node, then a slow one that records being cancelled."""
+
+    async def fast(state: State) -> State:
+        return {"steps": ["fast"]}
+
+    async def slow(state: State) -> State:
+        get_stream_writer()("slow started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow_cancelled.set()
+            raise
+        return {"steps": ["slow"]}
+
+    builder = StateGraph(State)
+    builder.add_node("fast", fast)
+    builder.add_node("slow", slow)
+    builder.add_edge(START, "fast")
+    builder.add_edge("fast", "slow")
+    builder.add_edge("slow", END)
+    return builder.compile()
+
+
+async def test_closing_stream_cancels_the_graph():
+    cancelled = asyncio.Event()
+    stream = two_step_graph(cancelled).astream({}, stream_mode="custom")
+
+    async with closing_stream(stream) as progress:
+        async for event in progress:
+            assert event == "slow started"
+            break
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_closing_stream_tolerates_plain_iterators():
+    class Plain:
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            raise StopAsyncIteration
+
+    async with closing_stream(Plain()) as stream:
+        assert [x async for x in stream] == []
+
+
+class HangingRunner:
+    """Runner that streams two tokens, then waits until closed."""
+
+    name = "hanging"
+
+    def __init__(self):
+        self.closed = asyncio.Event()
+
+    async def astream(self, request, thread_id="default"):
+        try:
+            yield "a"
+            yield "b"
+            await asyncio.Event().wait()
+        finally:
+            self.closed.set()
+
+
+async def test_guard_records_stream_closed_early():
+    runner = HangingRunner()
+    service = ChatService(runner)
+    stream = service.astream_chat("hi", model_id="m")
+
+    assert await anext(stream) == "a"
+    await stream.aclose()
+
+    assert runner.closed.is_set()
+    assert metrics.counter("cancelled.chat") == 1
+    assert metrics.percentile(CANCELLED_CHUNKS_METRIC, 50) == 1
+
+
+async def test_guard_records_cancelled_consumer():
+    runner = HangingRunner()
+    service = ChatService(runner)
+    received = []
+
+    async def consume():
+        async for chunk in service.astream_chat("hi", model_id="m"):
+            received.append(chunk)
+
+    task = asyncio.create_task(consume())
+    while len(received) < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert runner.closed.is_set()
+    assert metrics.counter("cancelled.chat") == 1
+    assert metrics.percentile(CANCELLED_CHUNKS_METRIC, 50) == 2
+
+
+@pytest.fixture
+async def admission_gate(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_CONTROL", True)
+    return admission.gate("model:m")
+
+
+def body_transport(chunks: int) -> httpx.MockTransport:
+    async def body():
+        for _ in range(chunks):
+            yield b"data: {}\n\n"
+
+    return httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+
+
+def stream_completion(client: httpx.AsyncClient):
+    return client.stream(
+        "POST", "https://api.test/v1/chat/completions", json={"model": "m"}
+    )
+
+
+async def test_releasing_stream_frees_slot_when_closed_early(admission_gate):
+    transport = AdmissionTransport(body_transport(5))
+
+    client = httpx.AsyncClient(transport=transport)
+    async with client, stream_completion(client) as response:
+        assert admission_gate.active == 1
+        async for _ in response.aiter_bytes():
+            break
+
+    assert admission_gate.active == 0
+    assert metrics.counter("cancelled.model.m") == 0
+
+
+async def test_releasing_stream_records_cancelled_call(admission_gate):
+    transport = AdmissionTransport(body_transport(1000))
+    started = asyncio.Event()
+
+    async def call():
+        client = httpx.AsyncClient(transport=transport)
+        async with client, stream_completion(client) as response:
+            async for _ in response.aiter_bytes():
+                started.set()
+                await asyncio.sleep(10)
+
+    task = asyncio.create_task(call())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert admission_gate.active == 0
+    assert metrics.counter("cancelled.model.m") == 1
+    assert metrics.counter("cancelled.model.m.tokens") > 0
+
+
+async def test_interruptible_returns_false_on_ctrl_c():
+    previous = signal.getsignal(signal.SIGINT)
+
+    async def turn():
+        os.kill(os.getpid(), signal.SIGINT)
+        await asyncio.sleep(10)
+
+    assert await asyncio.wait_for(_interruptible(turn()), 1) is False
+    assert signal.getsignal(signal.SIGINT) is previous
+
+
+async def test_interruptible_returns_true_when_finished():
+    async def turn():
+        await asyncio.sleep(0)
+
+    assert await _interruptible(turn()) is True
+
+
+async def test_ainput_reads_a_line(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("hello\n"))
+
+    assert await _ainput("You: ") == "hello"
+    assert capsys.readouterr().out == "You: "
+
+
+async def test_ainput_raises_eof_at_end_of_input(monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+
+    with pytest.raises(EOFError):
+        await _ainput("You: ")
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langgraph_runner.deadline import (
+    deadline_after,
+    earliest,
+    expired,
+    gather_until,
+    remaining,
+)
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.retriever import FilteredRetriever
+
+
+class SlowEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings whose async batch call takes delay seconds."""
+
+    delay: float = 0.0
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        await asyncio.sleep(self.delay)
+        return self.embed_documents(texts)
+
+
+async def after(delay: float, value):
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_deadline_helpers():
+    assert deadline_after(None) is None
+    assert remaining(None) is None
+    assert not expired(None)
+    assert earliest(None, 5.0, 3.0) == 3.0
+    assert earliest(None, None) is None
+
+    past = time.monotonic() - 1
+    assert expired(past)
+    assert remaining(past) == 0.0
+    assert remaining(deadline_after(10)) == pytest.approx(10, abs=0.5)
+
+
+async def test_gather_until_without_deadline_waits_for_all():
+    assert await gather_until([after(0.01, "a"), after(0, "b")], None) == ["a", "b"]
+
+
+async def test_gather_until_empty():
+    assert await gather_until([], deadline_after(1)) == []
+
+
+async def test_gather_until_cancels_late_awaitables():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    results = await gather_until([after(0, "fast"), slow()], deadline_after(0.05))
+
+    assert results == ["fast", None]
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_gather_until_propagates_errors():
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await gather_until([fail(), after(0, "ok")], deadline_after(1))
+
+
+async def test_gather_until_raises_in_argument_order():
+    async def fail(delay, message):
+        await asyncio.sleep(delay)
+        raise RuntimeError(message)
+
+    with pytest.raises(RuntimeError, match="second"):
+        await gather_until([fail(0.02, "second"), fail(0, "first")], None)
+
+
+async def test_gather_until_past_deadline_returns_nothing():
+    results = await gather_until([after(0.01, "late")], time.monotonic() - 1)
+
+    assert results == [None]
+
+
+@pytest.fixture
+def retriever() -> FilteredRetriever:
+    store = NumpyVectorStore.from_texts(
+        ["gold rallied", "oil fell"],
+        SlowEmbeddings(size=8, delay=0.1),
+        [{"doc_type": "forecast"}, {"doc_type": "mid_year"}],
+    )
+    return FilteredRetriever(store, k=2)
+
+
+async def test_retrieval_degrades_when_embedding_misses_deadline(retriever):
+    results = await retriever.retrieve_many(
+        [("gold", "forecast"), ("oil", "both")], deadline=deadline_after(0.01)
+    )
+
+    assert results == [None, None]
+
+
+async def test_retrieval_within_deadline(retriever):
+    forecast, both = await retriever.retrieve_many(
+        [("gold", "forecast"), ("oil", "both")], deadline=deadline_after(5)
+    )
+
+    assert [doc.page_content for doc, _ in forecast] == ["gold rallied"]
+    assert len(both) == 2
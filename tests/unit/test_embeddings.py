@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.metrics import metrics
+from langgraph_runner.retrieval.embeddings import (
+    BATCH_SIZE_METRIC,
+    CACHE_METRIC,
+    CachedEmbeddings,
+    EmbeddingStore,
+    MicroBatchingEmbeddings,
+)
+
+
+def vector(text: str) -> list[float]:
+    # Small integers survive the store's float32 round trip exactly
+    return [float(len(text)), float(ord(text[0]))]
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic embeddings that record every upstream call."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.error: Exception | None = None
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        if self.error is not None:
+            raise self.error
+        return self.embed_documents(texts)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return self.embed_query(text)
+
+
+@pytest.fixture
+def upstream() -> CountingEmbeddings:
+    return CountingEmbeddings()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EmbeddingStore(tmp_path / "embeddings.sqlite")
+    yield store
+    store.close()
+
+
+def test_memory_hit_skips_upstream(upstream):
+    embeddings = CachedEmbeddings(upstream, "m")
+
+    first = embeddings.embed_documents(["alpha", "beta"])
+    second = embeddings.embed_documents(["beta", "alpha"])
+
+    assert first == [vector("alpha"), vector("beta")]
+    assert second == [vector("beta"), vector("alpha")]
+    assert upstream.calls == [["alpha", "beta"]]
+    assert metrics.counter(f"{CACHE_METRIC}.memory.hit") == 2
+
+
+def test_duplicate_texts_are_embedded_once(upstream):
+    embeddings = CachedEmbeddings(upstream, "m")
+
+    vectors = embeddings.embed_documents(["alpha", "beta", "alpha"])
+
+    assert vectors == [vector("alpha"), vector("beta"), vector("alpha")]
+    assert upstream.calls == [["alpha", "beta"]]
+
+
+def test_store_hit_after_restart_skips_upstream(upstream, store, tmp_path):
+    CachedEmbeddings(upstream, "m", store).embed_documents(["alpha", "beta"])
+    store.close()
+    reopened = EmbeddingStore(tmp_path / "embeddings.sqlite")
+
+    embeddings = CachedEmbeddings(upstream, "m", reopened)
+    vectors = embeddings.embed_documents(["alpha", "beta"])
+    query = embeddings.embed_query("alpha")
+    reopened.close()
+
+    assert vectors == [vector("alpha"), vector("beta")]
+    assert query == vector("alpha")
+    assert upstream.calls == [["alpha", "beta"]]
+    assert metrics.counter(f"{CACHE_METRIC}.disk.hit") == 2
+    assert metrics.counter(f"{CACHE_METRIC}.memory.hit") == 1
+
+
+async def test_async_lookups_use_both_levels(upstream, store):
+    await CachedEmbeddings(upstream, "m", store).aembed_query("alpha")
+
+    embeddings = CachedEmbeddings(upstream, "m", store)
+    from_disk = await embeddings.aembed_documents(["alpha"])
+    from_memory = await embeddings.aembed_query("alpha")
+
+    assert from_disk == [vector("alpha")]
+    assert from_memory == vector("alpha")
+    assert upstream.calls == [["alpha"]]
+
+
+def test_entries_are_keyed_by_model(upstream, store):
+    CachedEmbeddings(upstream, "small", store).embed_query("alpha")
+    CachedEmbeddings(upstream, "large", store).embed_query("alpha")
+
+    assert upstream.calls == [["alpha"], ["alpha"]]
+
+
+def test_memory_evicts_least_recently_used(upstream):
+    embeddings = CachedEmbeddings(upstream, "m", memory_size=2)
+
+    for text in ("alpha", "beta", "alpha", "gamma", "beta"):
+        embeddings.embed_query(text)
+
+    assert upstream.calls == [["alpha"], ["beta"], ["gamma"], ["beta"]]
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = EmbeddingStore(tmp_path / "embeddings.sqlite", max_entries=2)
+    store.put_many({"a": [1.0], "b": [2.0]})
+    store.get_many(["a"])
+    store.put_many({"c": [3.0]})
+
+    assert store.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+    store.close()
+
+
+async def test_concurrent_queries_share_one_batch(upstream):
+    embeddings = MicroBatchingEmbeddings(upstream, window_ms=10)
+
+    vectors = await asyncio.gather(
+        embeddings.aembed_query("alpha"),
+        embeddings.aembed_documents(["beta", "alpha"]),
+        embeddings.aembed_query("gamma"),
+    )
+
+    assert vectors == [
+        vector("alpha"),
+        [vector("beta"), vector("alpha")],
+        vector("gamma"),
+    ]
+    assert upstream.calls == [["alpha", "beta", "gamma"]]
+    assert metrics.percentile(BATCH_SIZE_METRIC, 50) == 3
+
+
+async def test_full_batch_is_flushed_without_waiting(upstream):
+    embeddings = MicroBatchingEmbeddings(upstream, window_ms=10_000, max_batch_size=2)
+
+    vectors = await asyncio.wait_for(
+        asyncio.gather(
+            embeddings.aembed_query("alpha"), embeddings.aembed_query("beta")
+        ),
+        1,
+    )
+
+    assert vectors == [vector("alpha"), vector("beta")]
+    assert upstream.calls == [["alpha", "beta"]]
+
+
+async def test_large_documents_call_bypasses_the_queue(upstream):
+    embeddings = MicroBatchingEmbeddings(upstream, window_ms=10_000, max_batch_size=2)
+
+    await embeddings.aembed_documents(["alpha", "beta", "gamma"])
+
+    assert upstream.calls == [["alpha", "beta", "gamma"]]
+
+
+async def test_upstream_error_reaches_every_waiter(upstream):
+    upstream.error = RuntimeError("provider down")
+    embeddings = MicroBatchingEmbeddings(upstream, window_ms=10)
+
+    results = await asyncio.gather(
+        embeddings.aembed_query("alpha"),
+        embeddings.aembed_query("beta"),
+        return_exceptions=True,
+    )
+
+    assert results == [upstream.error, upstream.error]
+
+
+async def test_cancelled_caller_is_left_out_of_the_batch(upstream):
+    embeddings = MicroBatchingEmbeddings(upstream, window_ms=10)
+    cancelled = asyncio.create_task(embeddings.aembed_query("alpha"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await embeddings.aembed_query("beta") == vector("beta")
+    assert upstream.calls == [["beta"]]
@@ -0,0 +1,246 @@
+import asyncio
+
+import httpx
+import pytest
+
+from langgraph_runner.admission import admission
+from langgraph_runner.config import settings
+from langgraph_runner.hedging import ModelHedger, hedging
+from langgraph_runner.metrics import metrics
+from langgraph_runner.ratelimit import rate_limiter
+from langgraph_runner.transport import (
+    AdmissionTransport,
+    HedgingTransport,
+    RateLimitTransport,
+)
+
+# Warm-up latency; hedges fire once an attempt outlasts it
+P95_S = 0.02
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    def __init__(self):
+        self.closed = False
+
+    async def __aiter__(self):
+        yield b"{}"
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class StubTransport(httpx.AsyncBaseTransport):
+    """Answers the nth request with the nth (latency, status) of a script."""
+
+    def __init__(self, *script: tuple[float, int]):
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled: list[int] = []
+        self.streams: list[TrackedStream] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        call = self.calls
+        self.calls += 1
+        latency, status = self.script[call]
+        try:
+            await asyncio.sleep(latency)
+        except asyncio.CancelledError:
+            self.cancelled.append(call)
+            raise
+        stream = TrackedStream()
+        self.streams.append(stream)
+        return httpx.Response(status, stream=stream, extensions={"call": call})
+
+
+@pytest.fixture(autouse=True)
+def hedge_settings(monkeypatch):
+    monkeypatch.setattr(settings, "HEDGE_MIN_SAMPLES", 3)
+    monkeypatch.setattr(settings, "HEDGE_QUANTILE", 95.0)
+    monkeypatch.setattr(settings, "HEDGE_MAX_FRACTION", 1.0)
+    monkeypatch.setattr(settings, "RATE_LIMITING", False)
+    hedging.reset()
+    yield
+    hedging.reset()
+
+
+def warm_up(samples: int = 3) -> None:
+    for _ in range(samples):
+        hedging.for_model("m").observe(P95_S)
+
+
+def hedged(stub: StubTransport) -> HedgingTransport:
+    """Hedging over the rate limiter, as in HttpClientPool.async_client."""
+    return HedgingTransport(RateLimitTransport(stub))
+
+
+async def send(transport: httpx.AsyncBaseTransport) -> httpx.Response:
+    request = httpx.Request(
+        "POST", "https://api.test/v1/chat/completions", json={"model": "m"}
+    )
+    return await transport.handle_async_request(request)
+
+
+async def settle():
+    """Let cancelled attempts and scheduled closes run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_no_hedge_before_min_samples():
+    warm_up(samples=2)
+    stub = StubTransport((0.1, 200))
+
+    response = await send(hedged(stub))
+
+    assert response.status_code == 200
+    assert stub.calls == 1
+
+
+async def test_hedge_wins_and_slow_primary_is_cancelled():
+    warm_up()
+    stub = StubTransport((1.0, 200), (0.0, 200))
+
+    response = await send(hedged(stub))
+    await settle()
+
+    assert response.extensions["call"] == 1
+    assert stub.cancelled == [0]
+    assert metrics.counter("hedge.m.fired") == 1
+    assert metrics.counter("hedge.m.won") == 1
+
+
+async def test_fast_primary_is_not_hedged():
+    warm_up()
+    stub = StubTransport((0.0, 200))
+
+    response = await send(hedged(stub))
+
+    assert response.extensions["call"] == 0
+    assert stub.calls == 1
+
+
+async def test_failed_primary_falls_back_to_duplicate_and_is_closed():
+    warm_up()
+    stub = StubTransport((0.05, 503), (0.1, 200))
+
+    response = await send(hedged(stub))
+    await settle()
+
+    assert response.status_code == 200
+    assert response.extensions["call"] == 1
+    assert stub.streams[0].closed
+    assert not stub.streams[1].closed
+
+
+async def test_neither_usable_returns_primary_outcome():
+    warm_up()
+    stub = StubTransport((0.05, 503), (0.04, 429))
+
+    response = await send(hedged(stub))
+    await settle()
+
+    assert response.status_code == 503
+    assert stub.streams[1].closed
+    assert metrics.counter("hedge.m.won") == 0
+
+
+async def test_no_duplicate_when_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(settings, "HEDGE_MAX_FRACTION", 0.0)
+    warm_up()
+    stub = StubTransport((0.1, 200))
+
+    response = await send(hedged(stub))
+
+    assert response.extensions["call"] == 0
+    assert stub.calls == 1
+
+
+class SlowLimiter:
+    """Makes the first request wait for rate limit budget."""
+
+    def __init__(self, wait: float):
+        self.waits = [wait]
+
+    def reserve(self, tokens: int) -> float:
+        return self.waits.pop() if self.waits else 0.0
+
+    def update(self, headers) -> None:
+        pass
+
+
+async def test_rate_limit_wait_does_not_trigger_hedge(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMITING", True)
+    monkeypatch.setattr(rate_limiter, "for_model", lambda model: SlowLimiter(0.1))
+    warm_up()
+    stub = StubTransport((0.0, 200))
+
+    response = await send(hedged(stub))
+
+    assert response.extensions["call"] == 0
+    assert stub.calls == 1
+    assert metrics.counter("hedge.m.fired") == 0
+
+
+async def test_no_duplicate_without_free_admission_slot(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_LIMITS", {"model:m": 1})
+    warm_up()
+    stub = StubTransport((0.1, 200))
+
+    response = await send(AdmissionTransport(hedged(stub)))
+    await response.aclose()
+
+    assert stub.calls == 1
+    assert metrics.counter("hedge.m.skipped") == 1
+    assert metrics.counter("hedge.m.fired") == 0
+
+
+async def test_duplicate_holds_its_own_admission_slot(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_LIMITS", {"model:m": 2})
+    warm_up()
+    stub = StubTransport((1.0, 200), (0.0, 200))
+    gate = admission.gate("model:m")
+
+    response = await send(AdmissionTransport(hedged(stub)))
+    await settle()
+
+    assert response.extensions["call"] == 1
+    assert gate.active == 2
+    await response.aclose()
+    assert gate.active == 0
+
+
+async def test_losing_duplicate_frees_its_admission_slot(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_LIMITS", {"model:m": 2})
+    warm_up()
+    stub = StubTransport((0.05, 200), (1.0, 200))
+    gate = admission.gate("model:m")
+
+    response = await send(AdmissionTransport(hedged(stub)))
+    await settle()
+
+    assert response.extensions["call"] == 0
+    assert stub.cancelled == [1]
+    assert gate.active == 1
+    await response.aclose()
+    assert gate.active == 0
+
+
+def test_hedges_capped_at_max_fraction(monkeypatch):
+    monkeypatch.setattr(settings, "HEDGE_MAX_FRACTION", 0.25)
+    hedger = ModelHedger("m")
+
+    fired = 0
+    for _ in range(20):
+        hedger.start()
+        fired += hedger.try_hedge()
+
+    assert fired == 5
+
+
+def test_hedge_delay_tracks_quantile(monkeypatch):
+    monkeypatch.setattr(settings, "HEDGE_QUANTILE", 50.0)
+    hedger = ModelHedger("m")
+    for latency_s in (0.1, 0.2, 0.3, 0.4):
+        hedger.observe(latency_s)
+
+    assert hedger.start() == pytest.approx(0.2)
@@ -0,0 +1,90 @@
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from langgraph_runner.graphs.react_agent.history import (
+    _split,
+    acompact_history,
+    group_units,
+    message_tokens,
+)
+
+
+def tool_turn(n: int) -> list:
+    """A human question answered through one tool call."""
+    return [
+        HumanMessage(content=f"question {n}"),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "search", "args": {"q": f"q{n}"}, "id": f"call{n}"}],
+        ),
+        ToolMessage(content=f"result {n}", tool_call_id=f"call{n}"),
+        AIMessage(content=f"answer {n}"),
+    ]
+
+
+def tokens(messages) -> int:
+    return sum(message_tokens(m) for m in messages)
+
+
+HISTORY = tool_turn(1) + tool_turn(2) + [HumanMessage(content="question 3")]
+
+
+def test_group_units_keeps_tool_results_with_their_call():
+    units = group_units(tool_turn(1))
+
+    assert [len(unit) for unit in units] == [1, 2, 1]
+    assert isinstance(units[1][1], ToolMessage)
+
+
+def test_everything_fits():
+    dropped, kept, kept_tokens = _split(HISTORY, budget=10_000)
+
+    assert dropped == []
+    assert kept == HISTORY
+    assert kept_tokens == tokens(HISTORY)
+
+
+def test_current_turn_is_kept_over_budget():
+    dropped, kept, _ = _split(HISTORY, budget=0)
+
+    assert kept == HISTORY[-1:]
+    assert dropped == HISTORY[:-1]
+
+
+def test_tool_call_is_never_separated_from_its_result():
+    # Room for the last answer and the tool result, but not the call with it
+    budget = tokens(HISTORY[-1:]) + tokens(HISTORY[-3:-1]) + 1
+
+    dropped, kept, _ = _split(HISTORY, budget)
+
+    assert kept == HISTORY[-2:]
+    assert isinstance(dropped[-1], ToolMessage)
+    assert isinstance(dropped[-2], AIMessage) and dropped[-2].tool_calls
+
+
+def test_tool_pair_kept_whole_when_it_fits():
+    budget = tokens(HISTORY[-4:])
+
+    dropped, kept, kept_tokens = _split(HISTORY, budget)
+
+    assert kept == HISTORY[-4:]
+    assert dropped == HISTORY[:-4]
+    assert kept_tokens == budget
+
+
+async def test_compaction_without_summarizer_only_trims():
+    history = await acompact_history(HISTORY, budget=tokens(HISTORY[-2:]))
+
+    assert history.messages == HISTORY[-2:]
+    assert history.summarized == []
+
+
+async def test_compaction_folds_dropped_turns_into_summary():
+    summarizer = FakeListChatModel(responses=["new summary"])
+
+    history = await acompact_history(
+        HISTORY, budget=tokens(HISTORY[-2:]), summary="old", summarizer=summarizer
+    )
+
+    assert history.summary == "new summary"
+    assert history.summarized + history.messages == HISTORY
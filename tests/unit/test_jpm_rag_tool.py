@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+
+from langgraph_runner.config import settings
+from langgraph_runner.deadline import deadline_after
+from langgraph_runner.graphs.jpm_rag import tool as rag_tool
+from langgraph_runner.graphs.jpm_rag.config import RAGGraphConfig, coalescing_key
+from langgraph_runner.metrics import metrics
+
+
+class CountingGraph:
+    """Answers after a short delay, counting how often it ran."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, state, config):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"answer": f"answer to {state.query}"}
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    monkeypatch.setattr(settings, "RAG_SINGLE_FLIGHT", True)
+    graph = CountingGraph()
+    monkeypatch.setattr(rag_tool, "get_graph", lambda: graph)
+    return graph
+
+
+def config(deadline: float | None = None) -> RunnableConfig:
+    return RunnableConfig(
+        configurable=RAGGraphConfig(model_id="m", deadline=deadline).to_dict()
+    )
+
+
+def search(query: str, deadline: float | None = None):
+    return rag_tool.search_jpm_documents.ainvoke(
+        {"query": query}, config=config(deadline)
+    )
+
+
+async def test_concurrent_identical_searches_run_graph_once(graph):
+    answers = await asyncio.gather(
+        search("US equities 2025"), search("  us EQUITIES 2025 ")
+    )
+
+    assert answers == ["answer to US equities 2025"] * 2
+    assert graph.calls == 1
+    assert metrics.counter(f"{rag_tool.COALESCING_METRIC}.hit") == 1
+
+
+async def test_searches_with_distant_deadlines_do_not_share_a_run(graph):
+    await asyncio.gather(
+        search("US equities 2025", deadline_after(60)),
+        search("US equities 2025", deadline_after(2)),
+    )
+
+    assert graph.calls == 2
+
+
+async def test_flight_is_shared_within_a_loop():
+    assert rag_tool._flight() is rag_tool._flight()
+
+
+def test_each_loop_gets_its_own_flight():
+    async def flight():
+        return rag_tool._flight()
+
+    first, second = asyncio.run(flight()), asyncio.run(flight())
+
+    assert first is not second
+
+
+def test_coalescing_key_buckets_deadlines():
+    key = coalescing_key("q", config(deadline_after(32)))
+
+    assert coalescing_key("Q", config(deadline_after(31))) == key
+    assert coalescing_key("q", config(deadline_after(3))) != key
+    assert coalescing_key("q", config()) != key
+    assert coalescing_key("q", config()) == coalescing_key("q", config())
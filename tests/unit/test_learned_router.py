@@ -0,0 +1,140 @@
+import os
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from langgraph_runner.routing.learned import (
+    CentroidModel,
+    DecisionLog,
+    LearnedRouter,
+    RoutingExample,
+    evaluate,
+)
+
+VECTORS = {
+    "forecast query": [1.0, 0.0, 0.0],
+    "mid-year query": [0.0, 1.0, 0.0],
+    "both query": [0.0, 0.0, 1.0],
+    "ambiguous query": [1.0, 1.0, 1.0],
+}
+
+
+class StubEmbeddings(Embeddings):
+    """Embeds known queries to fixed vectors and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return VECTORS[text]
+
+
+EXAMPLES = [
+    RoutingExample("a", ["forecast"], VECTORS["forecast query"]),
+    RoutingExample("b", ["mid_year"], VECTORS["mid-year query"]),
+    RoutingExample("c", ["mid_year", "forecast"], VECTORS["both query"]),
+    RoutingExample("no embedding", ["forecast"]),
+]
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "router.npz"
+    CentroidModel.fit(EXAMPLES).save(path)
+    return path
+
+
+def test_fit_and_predict():
+    model = CentroidModel.fit(EXAMPLES)
+
+    assert model.labels == ["forecast", "forecast+mid_year", "mid_year"]
+    sources, confidence = model.predict(VECTORS["both query"])
+    assert sources == ["forecast", "mid_year"]
+    assert confidence > 0.99
+
+
+def test_fit_without_embeddings_raises():
+    with pytest.raises(ValueError):
+        CentroidModel.fit([RoutingExample("q", ["forecast"])])
+
+
+def test_save_load_round_trip(model_path):
+    model = CentroidModel.load(model_path)
+
+    assert model.predict(VECTORS["forecast query"])[0] == ["forecast"]
+
+
+def test_evaluate_coverage_and_agreement():
+    report = evaluate(CentroidModel.fit(EXAMPLES), EXAMPLES, threshold=0.9)
+
+    assert report.examples == 3
+    assert report.coverage == 1.0
+    assert report.agreement_overall == 1.0
+
+
+async def test_defers_without_a_model(tmp_path):
+    router = LearnedRouter(StubEmbeddings(), tmp_path / "missing.npz")
+
+    assert await router.aroute("forecast query") is None
+
+
+async def test_routes_confident_queries(model_path):
+    router = LearnedRouter(StubEmbeddings(), model_path, sub_query=str.upper)
+
+    decision = await router.aroute("mid-year query")
+
+    assert decision is not None
+    assert decision.routes == {"mid_year": "MID-YEAR QUERY"}
+    assert decision.router == "learned"
+    assert decision.confidence > 0.85
+
+
+async def test_defers_below_threshold(model_path):
+    router = LearnedRouter(StubEmbeddings(), model_path, threshold=0.85)
+
+    assert await router.aroute("ambiguous query") is None
+
+
+async def test_reloads_retrained_model(model_path):
+    router = LearnedRouter(StubEmbeddings(), model_path)
+    assert (await router.aroute("forecast query")).routes == {
+        "forecast": "forecast query"
+    }
+
+    CentroidModel.fit(
+        [
+            RoutingExample("a", ["mid_year"], VECTORS["forecast query"]),
+            RoutingExample("b", ["forecast"], VECTORS["mid-year query"]),
+        ]
+    ).save(model_path)
+    stat = model_path.stat()
+    os.utime(model_path, (stat.st_atime, stat.st_mtime + 1))
+
+    assert set((await router.aroute("forecast query")).routes) == {"mid_year"}
+
+
+async def test_records_fallback_with_routing_embedding(model_path, tmp_path):
+    embeddings = StubEmbeddings()
+    log = DecisionLog(tmp_path / "decisions.jsonl")
+    router = LearnedRouter(embeddings, model_path, decision_log=log)
+
+    await router.aroute("ambiguous query")
+    await router.arecord("ambiguous query", ["mid_year", "forecast"], 123.456)
+
+    (example,) = log.load()
+    assert example.sources == ["forecast", "mid_year"]
+    assert example.embedding == VECTORS["ambiguous query"]
+    assert example.llm_latency_ms == 123.5
+    assert embeddings.calls == 1
+
+
+async def test_record_without_log_is_a_no_op(model_path, tmp_path):
+    router = LearnedRouter(StubEmbeddings(), model_path)
+
+    await router.arecord("forecast query", ["forecast"], 10.0)
+
+    assert not list(tmp_path.glob("*.jsonl"))
@@ -0,0 +1,96 @@
+import io
+import sys
+
+import pytest
+
+from langgraph_runner import main
+from langgraph_runner.progress import StreamEvent
+
+
+class StubService:
+    """Chat service that echoes each message as one token."""
+
+    graph_name = "stub"
+
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.warmups = 0
+        self.messages: list[str] = []
+
+    async def awarmup(self) -> None:
+        self.warmups += 1
+
+    async def astream_events(self, message, **kwargs):
+        self.messages.append(message)
+        if message == self.fail_on:
+            raise RuntimeError("provider down")
+        yield StreamEvent("token", 0.0, {"content": f"echo {message}"})
+
+
+class StubPool:
+    def __init__(self):
+        self.closed = 0
+
+    async def aclose(self) -> None:
+        self.closed += 1
+
+
+@pytest.fixture
+def pool(monkeypatch) -> StubPool:
+    pool = StubPool()
+    monkeypatch.setattr(main, "model_pool", pool)
+    return pool
+
+
+def type_lines(monkeypatch, text: str) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+
+
+async def test_session_warms_up_once_and_closes_pool(monkeypatch, capsys, pool):
+    type_lines(monkeypatch, "first\n\nsecond\nquit\n")
+    service = StubService()
+
+    await main._chat_session(service)
+
+    assert service.warmups == 1
+    assert service.messages == ["first", "second"]
+    assert pool.closed == 1
+    out = capsys.readouterr().out
+    assert "echo first" in out
+    assert "echo second" in out
+
+
+async def test_session_closes_pool_at_end_of_input(monkeypatch, pool):
+    type_lines(monkeypatch, "first\n")
+    service = StubService()
+
+    await main._chat_session(service)
+
+    assert service.messages == ["first"]
+    assert pool.closed == 1
+
+
+async def test_failed_turn_keeps_the_session_going(monkeypatch, capsys, pool):
+    type_lines(monkeypatch, "first\nsecond\nexit\n")
+    service = StubService(fail_on="first")
+
+    await main._chat_session(service)
+
+    assert service.messages == ["first", "second"]
+    assert "Error: provider down" in capsys.readouterr().out
+    assert pool.closed == 1
+
+
+async def test_pool_is_closed_when_warmup_fails(monkeypatch, pool):
+    type_lines(monkeypatch, "first\n")
+    service = StubService()
+
+    async def fail():
+        raise RuntimeError("no network")
+
+    monkeypatch.setattr(service, "awarmup", fail)
+
+    with pytest.raises(RuntimeError):
+        await main._chat_session(service)
+    assert service.messages == []
+    assert pool.closed == 1
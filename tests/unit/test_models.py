@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+from pydantic import BaseModel
+
+from langgraph_runner.models import (
+    ChatModelPool,
+    RunnableCache,
+    bind_tools,
+    runnable_cache,
+    with_structured_output,
+)
+from langgraph_runner.transport import HttpClientPool
+
+MODEL_ID = "gpt-5-mini"
+
+
+class Route(BaseModel):
+    source: str
+
+
+class Answer(BaseModel):
+    text: str
+
+
+@tool
+def search(query: str) -> str:
+    """Search the documents."""
+    return query
+
+
+@tool
+def lookup(ticker: str) -> str:
+    """Look up a ticker."""
+    return ticker
+
+
+@pytest.fixture
+def http() -> HttpClientPool:
+    return HttpClientPool()
+
+
+@pytest.fixture
+def pool(http) -> ChatModelPool:
+    return ChatModelPool(http)
+
+
+async def test_same_arguments_share_an_instance_within_a_loop(pool):
+    model = pool.get(MODEL_ID, 0.0, max_tokens=100)
+
+    assert pool.get(MODEL_ID, 0.0, max_tokens=100) is model
+    assert pool.get(MODEL_ID, 0.5, max_tokens=100) is not model
+    assert pool.get(MODEL_ID, 0.0, max_tokens=200) is not model
+    assert pool.get(MODEL_ID, 0.0, hedge=True, max_tokens=100) is not model
+
+
+async def test_pooled_model_uses_the_loops_shared_client(http, pool):
+    model = pool.get(MODEL_ID, 0.0)
+    hedged = pool.get(MODEL_ID, 0.0, hedge=True)
+
+    assert model.http_async_client is http.async_client()
+    assert hedged.http_async_client is http.async_client(hedged=True)
+
+
+def test_each_loop_gets_its_own_instance(pool):
+    async def get():
+        return pool.get(MODEL_ID, 0.0)
+
+    first, second = asyncio.run(get()), asyncio.run(get())
+
+    assert first is not second
+
+
+def test_sync_callers_share_an_instance(pool):
+    assert pool.get(MODEL_ID, 0.0) is pool.get(MODEL_ID, 0.0)
+
+
+async def test_aclose_drops_models_and_clients(pool):
+    model = pool.get(MODEL_ID, 0.0)
+    client = model.http_async_client
+
+    await pool.aclose()
+
+    assert client.is_closed
+    recreated = pool.get(MODEL_ID, 0.0)
+    assert recreated is not model
+    assert not recreated.http_async_client.is_closed
+
+
+@pytest.fixture
+def cache():
+    runnable_cache.clear()
+    yield runnable_cache
+    runnable_cache.clear()
+
+
+def test_structured_output_is_reused_per_model_and_schema(pool, cache):
+    model = pool.get(MODEL_ID, 0.0)
+    runnable = with_structured_output(model, Route)
+
+    assert with_structured_output(model, Route) is runnable
+    assert with_structured_output(model, Answer) is not runnable
+    assert with_structured_output(model, Route, include_raw=True) is not runnable
+    assert with_structured_output(pool.get(MODEL_ID, 0.5), Route) is not runnable
+
+
+def test_bound_tools_are_reused_per_model_and_tool_set(pool, cache):
+    model = pool.get(MODEL_ID, 0.0)
+    runnable = bind_tools(model, [search])
+
+    assert bind_tools(model, [search]) is runnable
+    assert bind_tools(model, [search, lookup]) is not runnable
+    assert bind_tools(model, [search], tool_choice="search") is not runnable
+
+
+def test_runnable_cache_evicts_least_recently_used():
+    cache = RunnableCache(maxsize=2)
+    built: list[str] = []
+
+    def get(key):
+        def factory():
+            built.append(key)
+            return RunnableLambda(lambda x: x)
+
+        return cache.get_or_create(key, factory, refs=())
+
+    get("a")
+    get("b")
+    get("a")
+    get("c")
+    get("a")
+    get("b")
+
+    assert built == ["a", "b", "c", "b"]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+
+DIM = 16
+
+
+@pytest.fixture
+def store() -> NumpyVectorStore:
+    texts = [f"chunk {i}" for i in range(60)]
+    metadatas = [
+        {"doc_type": ("forecast", "mid_year", None)[i % 3], "page": i % 4}
+        for i in range(60)
+    ]
+    return NumpyVectorStore.from_texts(
+        texts, DeterministicFakeEmbedding(size=DIM), metadatas
+    )
+
+
+def brute_force(store, query, k, filter=None):
+    """Reference k-NN: squared L2 to every matching document, sorted."""
+    scored = []
+    for doc in store._documents:
+        if filter and any(doc.metadata.get(key) != v for key, v in filter.items()):
+            continue
+        vector = np.asarray(store.embeddings.embed_query(doc.page_content))
+        scored.append((doc.page_content, float(np.sum((vector - query) ** 2))))
+    return sorted(scored, key=lambda pair: pair[1])[:k]
+
+
+def assert_matches(results, expected):
+    assert [doc.page_content for doc, _ in results] == [t for t, _ in expected]
+    assert [d for _, d in results] == pytest.approx(
+        [d for _, d in expected], rel=1e-4, abs=1e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [None, {"doc_type": "forecast"}, {"doc_type": "mid_year", "page": 1}],
+)
+def test_search_matches_brute_force(store, filter):
+    query = np.random.default_rng(0).normal(size=DIM).astype(np.float32)
+
+    results = store.similarity_search_by_vector_with_relevance_scores(
+        query.tolist(), k=5, filter=filter
+    )
+
+    assert_matches(results, brute_force(store, query, 5, filter))
+
+
+def test_search_many_matches_per_query_search(store):
+    queries = np.random.default_rng(1).normal(size=(4, DIM)).astype(np.float32)
+    filters = [None, {"doc_type": "forecast"}, None, {"doc_type": "mid_year"}]
+
+    batched = store.search_many(queries, k=3, filters=filters)
+
+    for query, f, results in zip(queries, filters, batched, strict=True):
+        assert_matches(results, brute_force(store, query, 3, f))
+
+
+def test_k_larger_than_partition(store):
+    results = store.similarity_search("chunk 0", k=100, filter={"page": 0})
+
+    assert len(results) == 15
+
+
+def test_unmatched_filter_returns_nothing(store):
+    assert store.similarity_search("chunk 0", filter={"doc_type": "missing"}) == []
+
+
+def test_exact_match_is_nearest(store):
+    (doc, distance), *_ = store.similarity_search_with_score("chunk 7", k=3)
+
+    assert doc.page_content == "chunk 7"
+    assert distance == pytest.approx(0.0, abs=1e-4)
+
+
+async def test_add_texts_extends_partitions(store):
+    store.add_texts(["new chunk"], [{"doc_type": "forecast"}], ids=["new"])
+
+    results = await store.asimilarity_search(
+        "new chunk", k=1, filter={"doc_type": "forecast"}
+    )
+
+    assert len(store) == 61
+    assert results[0].id == "new"
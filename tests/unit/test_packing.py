@@ -0,0 +1,83 @@
+from langchain_core.documents import Document
+
+from langgraph_runner.retrieval.packing import ScoredChunk, pack_context
+from langgraph_runner.tokens import TOKEN_COUNT_KEY
+
+TEXT = (
+    "Gold rallied as real yields fell and central banks kept buying bullion "
+    "through the second quarter of the year."
+)
+
+
+def chunk(
+    text: str,
+    distance: float,
+    start: int | None = None,
+    tokens: int = 10,
+    source: str = "forecast",
+    page: int = 1,
+) -> ScoredChunk:
+    metadata = {"source": "outlook.pdf", "page_number": page, TOKEN_COUNT_KEY: tokens}
+    if start is not None:
+        metadata["start_index"] = start
+    return ScoredChunk(Document(page_content=text, metadata=metadata), distance, source)
+
+
+def test_merges_overlapping_chunks_from_the_same_parent():
+    first = chunk(TEXT[:60], 0.4, start=0)
+    second = chunk(TEXT[50:], 0.2, start=50)
+
+    packed, report = pack_context([first, second])
+
+    assert [c.document.page_content for c in packed] == [TEXT]
+    assert packed[0].distance == 0.2
+    assert report.merged == 1
+
+
+def test_merges_touching_chunks_across_a_dropped_separator():
+    first = chunk(TEXT[:40], 0.3, start=0)
+    second = chunk(TEXT[41:], 0.3, start=41)
+
+    packed, _ = pack_context([first, second])
+
+    assert len(packed) == 1
+
+
+def test_keeps_distant_chunks_and_other_pages_apart():
+    chunks = [
+        chunk(TEXT[:20], 0.1, start=0),
+        chunk(TEXT[60:80], 0.2, start=60),
+        chunk(TEXT[15:40], 0.3, start=15, page=2),
+        chunk(TEXT[15:40], 0.4, start=15, source="mid_year"),
+    ]
+
+    packed, report = pack_context(chunks, duplicate_threshold=1.1)
+
+    assert len(packed) == 4
+    assert report.merged == 0
+
+
+def test_drops_near_duplicates_keeping_the_best_scored():
+    best = chunk(TEXT, 0.1)
+    duplicate = chunk(TEXT.upper() + " Also", 0.3, source="mid_year")
+
+    packed, report = pack_context([duplicate, best])
+
+    assert packed == [best]
+    assert report.duplicates == 1
+
+
+def test_fills_the_budget_in_score_order():
+    chunks = [
+        chunk("alpha beta gamma", 0.3, tokens=40),
+        chunk("delta epsilon zeta", 0.1, tokens=50),
+        chunk("eta theta iota", 0.2, tokens=30),
+    ]
+
+    packed, report = pack_context(chunks, token_budget=90)
+
+    assert [c.distance for c in packed] == [0.1, 0.2]
+    assert report.over_budget == 1
+    assert report.input_tokens == 120
+    assert report.output_tokens == 80
+    assert report.tokens_saved == 40
@@ -0,0 +1,104 @@
+import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.partitioned import PartitionedVectorStore
+from langgraph_runner.retrieval.retriever import FilteredRetriever
+
+DOC_TYPES = ("forecast", "mid_year")
+TEXTS = [f"chunk {i}" for i in range(30)]
+METADATAS = [{"doc_type": DOC_TYPES[i % 2], "page": i % 3} for i in range(30)]
+
+
+@pytest.fixture
+def embedding() -> DeterministicFakeEmbedding:
+    return DeterministicFakeEmbedding(size=16)
+
+
+@pytest.fixture
+def partitioned(embedding) -> PartitionedVectorStore:
+    store = PartitionedVectorStore(
+        {doc_type: NumpyVectorStore(embedding) for doc_type in DOC_TYPES},
+        embedding=embedding,
+    )
+    store.add_texts(TEXTS, METADATAS)
+    return store
+
+
+@pytest.fixture
+def single(embedding) -> NumpyVectorStore:
+    """The same documents in one unpartitioned store."""
+    return NumpyVectorStore.from_texts(TEXTS, embedding, METADATAS)
+
+
+def contents(results):
+    return [doc.page_content for doc, _ in results]
+
+
+def test_documents_are_routed_to_their_partition(partitioned):
+    for doc_type, store in partitioned.partitions.items():
+        assert len(store) == 15
+        assert {d.metadata["doc_type"] for d in store._documents} == {doc_type}
+
+
+def test_add_documents_returns_ids_in_input_order(embedding):
+    store = PartitionedVectorStore(
+        {doc_type: NumpyVectorStore(embedding) for doc_type in DOC_TYPES},
+        embedding=embedding,
+        default_partition="forecast",
+    )
+    documents = [
+        Document(id="a", page_content="a", metadata={"doc_type": "mid_year"}),
+        Document(id="b", page_content="b"),
+        Document(id="c", page_content="c", metadata={"doc_type": "mid_year"}),
+    ]
+
+    assert store.add_documents(documents) == ["a", "b", "c"]
+    assert len(store.partitions["forecast"]) == 1
+
+
+def test_unknown_partition_is_rejected(partitioned):
+    with pytest.raises(ValueError, match="No partition for doc_type='other'"):
+        partitioned.add_texts(["x"], [{"doc_type": "other"}])
+
+
+def test_targets_route_by_partition_key(partitioned):
+    forecast = partitioned.partitions["forecast"]
+
+    assert partitioned.targets({"doc_type": "forecast"}) == [(forecast, None)]
+    assert partitioned.targets({"doc_type": "forecast", "page": 1}) == [
+        (forecast, {"page": 1})
+    ]
+    assert len(partitioned.targets(None)) == 2
+    assert partitioned.targets({"doc_type": "other"}) == []
+
+
+def test_filtered_search_matches_unpartitioned_store(partitioned, single):
+    for doc_type in DOC_TYPES:
+        expected = single.similarity_search_with_score(
+            "outlook", k=5, filter={"doc_type": doc_type}
+        )
+        results = partitioned.similarity_search_with_score(
+            "outlook", k=5, filter={"doc_type": doc_type}
+        )
+        assert contents(results) == contents(expected)
+
+
+def test_unfiltered_search_merges_partitions_by_distance(partitioned, single):
+    expected = single.similarity_search_with_score("outlook", k=6)
+    results = partitioned.similarity_search_with_score("outlook", k=6)
+
+    assert contents(results) == contents(expected)
+    assert {doc.metadata["doc_type"] for doc, _ in results} == set(DOC_TYPES)
+    distances = [distance for _, distance in results]
+    assert distances == sorted(distances)
+
+
+async def test_retriever_over_partitions_matches_single_store(partitioned, single):
+    requests = [("outlook", "forecast"), ("outlook", "mid_year"), ("outlook", "both")]
+
+    results = await FilteredRetriever(partitioned, k=4).retrieve_many(requests)
+    expected = await FilteredRetriever(single, k=4).retrieve_many(requests)
+
+    assert [contents(r) for r in results] == [contents(r) for r in expected]
@@ -0,0 +1,79 @@
+import pytest
+
+from langgraph_runner import progress
+from langgraph_runner.metrics import metrics
+from langgraph_runner.progress import StreamTimer
+
+
+class Clock:
+    """Stand-in for time.monotonic that advances only when told to."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(progress.time, "monotonic", clock)
+    return clock
+
+
+def test_first_token_is_announced_once(clock):
+    timer = StreamTimer("graph")
+    clock.now += 0.25
+
+    first = list(timer.tokens("Hel"))
+    second = list(timer.tokens("lo"))
+
+    assert [e.type for e in first] == ["first_token", "token"]
+    assert first[0].data == {"ttft_ms": 250.0}
+    assert first[1].data == {"content": "Hel"}
+    assert [e.type for e in second] == ["token"]
+
+
+def test_progress_payload_becomes_event(clock):
+    timer = StreamTimer("graph")
+    clock.now += 0.1
+
+    event = timer.progress({"event": "retrieved", "source": "forecast", "chunks": 3})
+
+    assert event.type == "retrieved"
+    assert event.t == clock.now
+    assert event.data == {"source": "forecast", "chunks": 3}
+
+
+def test_summary_reports_last_time_of_each_stage(clock):
+    timer = StreamTimer("graph")
+    clock.now += 0.1
+    timer.event("classified")
+    clock.now += 0.1
+    timer.event("retrieved")
+    clock.now += 0.2
+    timer.event("retrieved")
+    clock.now += 0.1
+    list(timer.tokens("answer"))
+    clock.now += 0.5
+
+    summary = timer.summary()
+
+    assert summary.type == "timing"
+    assert summary.data == {
+        "total_ms": 1000.0,
+        "ttft_ms": 500.0,
+        "stages": {"classified": 100.0, "retrieved": 400.0, "first_token": 500.0},
+    }
+    assert list(summary.data["stages"]) == ["classified", "retrieved", "first_token"]
+    assert metrics.percentile("stream.graph.first_token_ms", 50) == 500.0
+
+
+def test_summary_without_tokens(clock):
+    timer = StreamTimer("graph")
+    clock.now += 0.05
+
+    summary = timer.summary()
+
+    assert summary.data == {"total_ms": 50.0, "ttft_ms": None, "stages": {}}
@@ -0,0 +1,225 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from langgraph_runner import ratelimit
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import metrics
+from langgraph_runner.ratelimit import (
+    ModelRateLimiter,
+    TokenBucket,
+    parse_duration,
+    rate_limiter,
+    retry_after,
+)
+from langgraph_runner.transport import RateLimitTransport
+
+
+class Clock:
+    """Stand-in for time.monotonic that advances only when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(ratelimit, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def rate_limit_settings(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMITING", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_BURST_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_BACKOFF", 60.0)
+    rate_limiter.reset()
+    yield
+    rate_limiter.reset()
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("1.5", 1.5), ("20ms", 0.02), ("6m0s", 360.0), ("1h30m", 5400.0), ("soon", None)],
+)
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == pytest.approx(seconds)
+
+
+@pytest.mark.parametrize(
+    ("headers", "seconds"),
+    [
+        ({"retry-after-ms": "250", "retry-after": "9"}, 0.25),
+        ({"retry-after-ms": "later", "retry-after": "2"}, 2.0),
+        ({"retry-after": "1m"}, 60.0),
+        ({}, None),
+    ],
+)
+def test_retry_after(headers, seconds):
+    assert retry_after(headers) == seconds
+
+
+def test_token_bucket_paces_reservations_in_arrival_order():
+    bucket = TokenBucket(rate=2.0, capacity=2.0, now=0.0)
+
+    delays = [bucket.reserve(1, now=0.0) for _ in range(4)]
+
+    assert delays == [0.0, 0.0, 0.5, 1.0]
+
+
+def test_token_bucket_refills_up_to_capacity():
+    bucket = TokenBucket(rate=2.0, capacity=2.0, now=0.0)
+    bucket.reserve(2, now=0.0)
+
+    assert bucket.reserve(2, now=100.0) == 0.0
+    assert bucket.reserve(1, now=100.0) == 0.5
+
+
+def test_token_bucket_pause_and_drain():
+    bucket = TokenBucket(rate=1.0, capacity=5.0, now=0.0)
+
+    bucket.pause_until(3.0, now=0.0)
+    assert bucket.reserve(1, now=0.0) == 4.0
+
+    bucket = TokenBucket(rate=1.0, capacity=5.0, now=0.0)
+    bucket.drain_to(0, now=0.0)
+    assert bucket.reserve(1, now=0.0) == 1.0
+
+
+def test_limiter_paces_to_rpm(clock):
+    limiter = ModelRateLimiter("m", rpm=60, tpm=None)
+
+    assert limiter.reserve(100) == 0.0
+    assert limiter.reserve(100) == 1.0
+    assert metrics.counter("ratelimit.m.tokens") == 200
+
+
+def test_limiter_paces_to_tpm(clock):
+    limiter = ModelRateLimiter("m", rpm=None, tpm=6000)
+
+    assert limiter.reserve(100) == 0.0
+    assert limiter.reserve(50) == pytest.approx(0.5)
+
+
+def test_throttle_pauses_and_halves_rate(clock):
+    limiter = ModelRateLimiter("m", rpm=60, tpm=None)
+    limiter.reserve(0)
+
+    wait = limiter.throttled({"retry-after": "2"}, attempt=0)
+
+    assert wait == 2.0
+    assert limiter.reserve(0) >= 2.0
+    assert limiter._buckets["requests"].rate == pytest.approx(0.5)
+    assert metrics.counter("ratelimit.m.throttled") == 1
+
+
+def test_concurrent_throttles_decrease_rate_once(clock):
+    limiter = ModelRateLimiter("m", rpm=60, tpm=None)
+
+    limiter.throttled({"retry-after": "2"}, attempt=0)
+    clock.now += 0.5
+    limiter.throttled({"retry-after": "2"}, attempt=0)
+
+    assert limiter._buckets["requests"].rate == pytest.approx(0.5)
+
+
+def test_rate_recovers_additively_after_throttle(clock):
+    limiter = ModelRateLimiter("m", rpm=60, tpm=None)
+    limiter.throttled({"retry-after": "1"}, attempt=0)
+
+    for _ in range(5):
+        limiter.update({})
+    assert limiter._buckets["requests"].rate == pytest.approx(0.6)
+
+    for _ in range(100):
+        limiter.update({})
+    assert limiter._buckets["requests"].rate == pytest.approx(1.0)
+
+
+def test_backoff_without_retry_after_is_capped(clock, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_BACKOFF", 3.0)
+    limiter = ModelRateLimiter("m", rpm=None, tpm=None)
+
+    assert 0.25 <= limiter.throttled({}, attempt=0) <= 0.5
+    assert limiter.throttled({}, attempt=10) == 3.0
+
+
+def test_limits_learned_from_headers(clock):
+    limiter = ModelRateLimiter("m", rpm=None, tpm=None)
+    assert limiter.reserve(10) == 0.0
+
+    limiter.update(
+        {"x-ratelimit-limit-requests": "120", "x-ratelimit-remaining-requests": "0"}
+    )
+
+    assert limiter.reserve(10) == pytest.approx(0.5)
+
+
+def stub_transport(*responses: httpx.Response):
+    """MockTransport answering with responses in order, recording requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        template = responses[len(requests) - 1]
+        return httpx.Response(
+            template.status_code, headers=template.headers, content=template.content
+        )
+
+    return httpx.MockTransport(handler), requests
+
+
+async def post(transport: httpx.AsyncBaseTransport) -> httpx.Response:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await client.post(
+            "https://api.test/v1/chat/completions", json={"model": "m"}
+        )
+
+
+THROTTLED = httpx.Response(429, headers={"retry-after-ms": "10"})
+
+
+async def test_transport_retries_429_after_backoff():
+    mock, requests = stub_transport(THROTTLED, THROTTLED, httpx.Response(200))
+
+    response = await post(RateLimitTransport(mock))
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert metrics.counter("ratelimit.m.throttled") == 2
+
+
+async def test_transport_returns_429_once_retries_are_exhausted():
+    mock, requests = stub_transport(*[THROTTLED] * 4)
+
+    response = await post(RateLimitTransport(mock))
+
+    assert response.status_code == 429
+    assert len(requests) == settings.RATE_LIMIT_MAX_RETRIES + 1
+
+
+async def test_transport_does_not_retry_exhausted_quota():
+    mock, requests = stub_transport(
+        httpx.Response(429, json={"error": {"code": "insufficient_quota"}})
+    )
+
+    response = await post(RateLimitTransport(mock))
+
+    assert response.status_code == 429
+    assert len(requests) == 1
+
+
+async def test_transport_passes_through_requests_without_a_model():
+    mock, requests = stub_transport(THROTTLED)
+
+    async with httpx.AsyncClient(transport=RateLimitTransport(mock)) as client:
+        response = await client.get("https://api.test/v1/models")
+
+    assert response.status_code == 429
+    assert len(requests) == 1
@@ -0,0 +1,217 @@
+from typing import Any, TypedDict
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.tools import BaseTool, tool
+from langgraph.graph import END, START, StateGraph
+
+from langgraph_runner.config import settings
+from langgraph_runner.graphs.base.runner import ChatRequest
+from langgraph_runner.graphs.jpm_react_agent import _create_tools
+from langgraph_runner.graphs.react_agent import (
+    DIRECT_RETURN_NODE,
+    ReactAgentRunner,
+    build_react_agent,
+    direct_return_tools,
+)
+from langgraph_runner.graphs.react_agent import graph as agent_graph
+
+ANSWER = "Gold rallied 25% [Mid-Year Outlook]"
+
+
+class AgentModel(GenericFakeChatModel):
+    """Scripted agent model that counts its calls and accepts any tools."""
+
+    calls: int = 0
+
+    def _generate(self, *args: Any, **kwargs: Any):
+        self.calls += 1
+        return super()._generate(*args, **kwargs)
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "AgentModel":
+        return self
+
+
+def agent_model(*responses: AIMessage) -> AgentModel:
+    # Tool calls are lost when the fake streams, so the agent answers whole
+    return AgentModel(messages=iter(responses), disable_streaming=True)
+
+
+def search_call(query: str = "gold") -> AIMessage:
+    return AIMessage(
+        content="", tool_calls=[{"name": "search", "args": {"query": query}, "id": "1"}]
+    )
+
+
+class RAGState(TypedDict, total=False):
+    query: str
+    route: str
+    answer: str
+
+
+def rag_graph(note: str = ""):
+    """Two LLM nodes, like the RAG graph: only synthesize writes the answer."""
+
+    async def classify(state: RAGState) -> RAGState:
+        model = GenericFakeChatModel(messages=iter([AIMessage(content="mid_year")]))
+        return {"route": (await model.ainvoke(state["query"])).text}
+
+    async def synthesize(state: RAGState) -> RAGState:
+        model = GenericFakeChatModel(messages=iter([AIMessage(content=ANSWER)]))
+        return {"answer": (await model.ainvoke(state["query"])).text + note}
+
+    builder = StateGraph(RAGState)
+    builder.add_node("classify", classify)
+    builder.add_node("synthesize", synthesize)
+    builder.add_edge(START, "classify")
+    builder.add_edge("classify", "synthesize")
+    builder.add_edge("synthesize", END)
+    return builder.compile()
+
+
+def search_tool(
+    direct: bool = True, note: str = "", coalesced: bool = False
+) -> BaseTool:
+    graph = rag_graph(note)
+
+    @tool
+    async def search(query: str, config: RunnableConfig) -> str:
+        """Search the documents."""
+        if coalesced:
+            # Joined another caller's run: the answer arrives without tokens
+            return ANSWER + note
+        return (await graph.ainvoke({"query": query}, config))["answer"]
+
+    if not direct:
+        return search
+    return search.model_copy(
+        update={"return_direct": True, "metadata": {DIRECT_RETURN_NODE: "synthesize"}}
+    )
+
+
+@pytest.fixture
+def use_model(monkeypatch):
+    def use(model: AgentModel) -> AgentModel:
+        monkeypatch.setattr(agent_graph, "load_chat_model", lambda *a, **k: model)
+        return model
+
+    return use
+
+
+def runner(tool: BaseTool) -> ReactAgentRunner:
+    return ReactAgentRunner(
+        build_react_agent([tool]),
+        system_prompt="You answer questions.",
+        direct_return=direct_return_tools([tool]),
+    )
+
+
+async def stream(runner: ReactAgentRunner, model_tier: str | None = None) -> list:
+    request = ChatRequest(
+        messages=[{"role": "user", "content": "How did gold do?"}],
+        model_id="big",
+        model_tier=model_tier,
+    )
+    return [event async for event in runner.astream_events(request)]
+
+
+def tokens(events: list) -> list[str]:
+    return [e.data["content"] for e in events if e.type == "token"]
+
+
+@pytest.mark.parametrize("model_tier", ["fast", "default"])
+async def test_fixed_tier_skips_tier_signals(use_model, monkeypatch, model_tier):
+    def fail(messages):
+        raise AssertionError("tier signals computed for a fixed tier")
+
+    monkeypatch.setattr(agent_graph, "_tier_signals", fail)
+    use_model(agent_model(AIMessage(content="Hello!")))
+
+    events = await stream(runner(search_tool()), model_tier)
+
+    assert "".join(tokens(events)) == "Hello!"
+
+
+async def test_auto_tier_computes_signals(use_model, monkeypatch):
+    seen = []
+    tier_signals = agent_graph._tier_signals
+
+    def spy(messages):
+        seen.append(len(messages))
+        return tier_signals(messages)
+
+    monkeypatch.setattr(agent_graph, "_tier_signals", spy)
+    use_model(agent_model(AIMessage(content="Hello!")))
+
+    await stream(runner(search_tool()), "auto")
+
+    assert seen == [1]
+
+
+async def test_direct_return_streams_synthesis_tokens_once(use_model):
+    model = use_model(agent_model(search_call()))
+
+    events = await stream(runner(search_tool()))
+
+    assert "".join(tokens(events)) == ANSWER
+    assert len(tokens(events)) > 1  # Streamed as generated, not at the end
+    assert [e.type for e in events].count("first_token") == 1
+    assert model.calls == 1
+
+
+async def test_direct_return_appends_unstreamed_note(use_model):
+    use_model(agent_model(search_call()))
+
+    events = await stream(runner(search_tool(note="\n\n(cut short)")))
+
+    assert "".join(tokens(events)) == ANSWER + "\n\n(cut short)"
+    assert tokens(events)[-1] == "\n\n(cut short)"
+
+
+async def test_coalesced_result_is_emitted_from_tool_update(use_model):
+    model = use_model(agent_model(search_call()))
+
+    events = await stream(runner(search_tool(coalesced=True)))
+
+    assert tokens(events) == [ANSWER]
+    assert model.calls == 1
+
+
+async def test_parallel_calls_go_back_to_the_agent(use_model):
+    parallel = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "search", "args": {"query": "gold"}, "id": "1"},
+            {"name": "search", "args": {"query": "oil"}, "id": "2"},
+        ],
+    )
+    model = use_model(agent_model(parallel, AIMessage(content="Both rose.")))
+
+    events = await stream(runner(search_tool()))
+
+    assert "".join(tokens(events)) == "Both rose."
+    assert model.calls == 2
+
+
+async def test_without_direct_return_only_agent_tokens_stream(use_model):
+    model = use_model(agent_model(search_call(), AIMessage(content="Gold rose.")))
+
+    events = await stream(runner(search_tool(direct=False)))
+
+    assert "".join(tokens(events)) == "Gold rose."
+    assert model.calls == 2
+    assert next(e for e in events if e.type == "tool_called").data == {
+        "tools": ["search"]
+    }
+
+
+def test_jpm_agent_streams_rag_synthesis_in_direct_return_mode(monkeypatch):
+    monkeypatch.setattr(settings, "RAG_TOOL_DIRECT_RETURN", True)
+    assert direct_return_tools(_create_tools()) == {
+        "search_jpm_documents": "synthesize"
+    }
+
+    monkeypatch.setattr(settings, "RAG_TOOL_DIRECT_RETURN", False)
+    assert direct_return_tools(_create_tools()) == {}
@@ -0,0 +1,91 @@
+import uuid
+
+import pytest
+from langchain_chroma import Chroma
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+
+from langgraph_runner.retrieval.numpy_store import NumpyVectorStore
+from langgraph_runner.retrieval.retriever import FilteredRetriever
+
+DOC_TYPES = ("forecast", "mid_year")
+TEXTS = [f"chunk {i}" for i in range(30)]
+METADATAS = [{"doc_type": DOC_TYPES[i % 2]} for i in range(30)]
+
+REQUESTS = [
+    ("equities outlook", "forecast"),
+    ("gold performance", "mid_year"),
+    ("equities outlook", None),
+    ("rates", "both"),
+]
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic fake embeddings that record each batch embedded."""
+
+    def __init__(self):
+        self._fake = DeterministicFakeEmbedding(size=16)
+        self.batches: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return self._fake.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+@pytest.fixture
+def embeddings() -> CountingEmbeddings:
+    return CountingEmbeddings()
+
+
+@pytest.fixture(params=["numpy", "chroma"])
+def retriever(request, embeddings) -> FilteredRetriever:
+    if request.param == "numpy":
+        store = NumpyVectorStore.from_texts(TEXTS, embeddings, METADATAS)
+    else:
+        # In-memory collection; a unique name keeps tests independent
+        store = Chroma(
+            collection_name=f"test_{uuid.uuid4().hex}",
+            embedding_function=embeddings,
+        )
+        store.add_texts(TEXTS, METADATAS)
+    embeddings.batches.clear()
+    return FilteredRetriever(store, k=4)
+
+
+def contents(results):
+    return [(doc.page_content, doc.metadata["doc_type"]) for doc, _ in results]
+
+
+async def test_retrieve_many_matches_per_query_retrieval(retriever):
+    batched = await retriever.retrieve_many(REQUESTS)
+    single = [
+        await retriever.retrieve_with_scores(query, doc_type)
+        for query, doc_type in REQUESTS
+    ]
+
+    assert [contents(r) for r in batched] == [contents(r) for r in single]
+    for batched_results, single_results in zip(batched, single, strict=True):
+        assert [score for _, score in batched_results] == pytest.approx(
+            [score for _, score in single_results]
+        )
+
+
+async def test_retrieve_many_embeds_distinct_queries_once(retriever, embeddings):
+    await retriever.retrieve_many(REQUESTS)
+
+    assert embeddings.batches == [["equities outlook", "gold performance", "rates"]]
+
+
+async def test_retrieve_many_applies_doc_type_filters(retriever):
+    forecast, mid_year, unfiltered, both = await retriever.retrieve_many(REQUESTS)
+
+    assert {doc_type for _, doc_type in contents(forecast)} == {"forecast"}
+    assert {doc_type for _, doc_type in contents(mid_year)} == {"mid_year"}
+    assert len(unfiltered) == len(both) == 4
+
+
+async def test_retrieve_many_of_nothing(retriever, embeddings):
+    assert await retriever.retrieve_many([]) == []
+    assert embeddings.batches == []
@@ -0,0 +1,68 @@
+import pytest
+
+from langgraph_runner.graphs.jpm_rag.rules import create_rule_router
+from langgraph_runner.routing.rules import RoutingRule, RuleRouter, keyword_query
+
+
+@pytest.fixture
+def router() -> RuleRouter:
+    return create_rule_router()
+
+
+@pytest.mark.parametrize(
+    ("query", "sources"),
+    [
+        ("What does Outlook 2025 say about gold?", {"forecast"}),
+        ("According to the Outlook, where are rates heading?", {"forecast"}),
+        ("What did the Mid-Year Outlook 2025 say about gold?", {"mid_year"}),
+        ("Compare predictions vs actual results for oil", {"forecast", "mid_year"}),
+        ("What was forecast for US GDP?", {"forecast"}),
+        ("How has the S&P 500 performed so far?", {"mid_year"}),
+    ],
+)
+def test_routes_unambiguous_queries(router, query, sources):
+    decision = router.route(query)
+
+    assert decision is not None
+    assert set(decision.routes) == sources
+    assert decision.router == "rules"
+
+
+def test_lowercase_the_outlook_is_not_a_document_reference(router):
+    decision = router.route("What is the outlook for Japanese equities?")
+
+    assert decision is None or decision.matched != ["explicit_forecast"]
+    assert "outlook" in router.sub_query("What is the outlook for Japanese equities?")
+
+
+def test_capitalised_the_outlook_is_a_document_reference(router):
+    decision = router.route("What does the Outlook say about Japanese equities?")
+
+    assert decision is not None
+    assert decision.matched == ["explicit_forecast"]
+    assert decision.routes == {"forecast": "Japanese equities"}
+
+
+def test_conflicting_rules_in_a_tier_defer(router):
+    assert router.route("What was expected and what actually happened?") is None
+
+
+def test_no_match_defers(router):
+    assert router.route("Tell me about gold") is None
+
+
+def test_lower_priority_tier_only_used_without_higher_match():
+    router = RuleRouter(
+        [
+            RoutingRule("late", frozenset({"b"}), (r"\bgold\b",), priority=1),
+            RoutingRule("early", frozenset({"a"}), (r"\bdoc\b",), priority=0),
+        ]
+    )
+
+    assert router.route("doc on gold").matched == ["early"]
+    assert router.route("gold price").matched == ["late"]
+
+
+def test_keyword_query_drops_stopwords_and_duplicates():
+    assert keyword_query("What is the price of Gold and gold?") == "price Gold"
+    assert keyword_query("what is the") == "what is the"
@@ -0,0 +1,294 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from langgraph_runner.admission import AdmissionRejected
+from langgraph_runner.progress import StreamEvent
+from langgraph_runner.server import _MAX_BODY_BYTES, ChatServer
+
+GRAPH = "jpm_rag"
+
+
+class StubService:
+    """Stands in for ChatService, recording calls and scripting failures."""
+
+    def __init__(self, tokens=("Hello", " world"), error: Exception | None = None):
+        self.tokens = tokens
+        self.error = error
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.hang = False
+        self.closed = asyncio.Event()
+
+    async def achat(self, message: str, thread_id: str, **kwargs) -> str:
+        self.calls.append((message, {"thread_id": thread_id, **kwargs}))
+        if self.error:
+            raise self.error
+        return "".join(self.tokens)
+
+    async def astream_chat(
+        self, message: str, thread_id: str, **kwargs
+    ) -> AsyncIterator[str]:
+        self.calls.append((message, {"thread_id": thread_id, **kwargs}))
+        try:
+            for token in self.tokens:
+                yield token
+            if self.error:
+                raise self.error
+            if self.hang:
+                await asyncio.Event().wait()
+        finally:
+            self.closed.set()
+
+    async def astream_events(
+        self, message: str, thread_id: str, **kwargs
+    ) -> AsyncIterator[StreamEvent]:
+        yield StreamEvent("classified", 1.0, {"sources": ["forecast"]})
+        async for token in self.astream_chat(message, thread_id, **kwargs):
+            yield StreamEvent("token", 2.0, {"content": token})
+
+
+class Client:
+    """Drives the ASGI app with a fake receive/send pair."""
+
+    def __init__(self, app: ChatServer):
+        self.app = app
+        self.inbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.sent: list[dict[str, Any]] = []
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        chunks: list[bytes] | None = None,
+    ) -> None:
+        if chunks is None:
+            chunks = [b"" if body is None else json.dumps(body).encode()]
+        for i, chunk in enumerate(chunks):
+            self.inbox.put_nowait(
+                {
+                    "type": "http.request",
+                    "body": chunk,
+                    "more_body": i < len(chunks) - 1,
+                }
+            )
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "headers": [(k.encode(), v.encode()) for k, v in (headers or {}).items()],
+        }
+        await self.app(scope, self.inbox.get, self._send)
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        self.sent.append(message)
+
+    @property
+    def status(self) -> int:
+        return self.sent[0]["status"]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {k.decode(): v.decode() for k, v in self.sent[0]["headers"]}
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(m.get("body", b"") for m in self.sent[1:])
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def events(self) -> list[tuple[str, dict[str, Any]]]:
+        events = []
+        for frame in self.body.decode().split("\n\n"):
+            if frame:
+                event, data = frame.split("\n")
+                assert event.startswith("event: ") and data.startswith("data: ")
+                events.append((event[7:], json.loads(data[6:])))
+        return events
+
+
+@pytest.fixture
+def service() -> StubService:
+    return StubService()
+
+
+@pytest.fixture
+def client(service) -> Client:
+    app = ChatServer(warmup_graphs=(), drain_timeout=0.1)
+    app._services[GRAPH] = service
+    return Client(app)
+
+
+async def test_health_and_graphs(client):
+    await client.request("GET", "/health")
+    assert (client.status, client.json()) == (200, {"status": "ok"})
+
+    client.sent.clear()
+    await client.request("GET", "/graphs")
+    assert GRAPH in client.json()["graphs"]
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [
+        ("POST", "/health"),
+        ("DELETE", "/graphs"),
+        ("GET", f"/graphs/{GRAPH}/chat"),
+        ("PUT", f"/graphs/{GRAPH}/stream"),
+    ],
+)
+async def test_wrong_method_is_405(client, method, path):
+    await client.request(method, path)
+
+    assert client.status == 405
+
+
+@pytest.mark.parametrize(
+    "path", ["/", "/graphs/unknown/chat", f"/graphs/{GRAPH}/other", "/health/x"]
+)
+async def test_unknown_route_or_graph_is_404(client, path):
+    await client.request("POST", path, {"message": "hi"})
+
+    assert client.status == 404
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"message": "  "},
+        {"message": "hi", "temperature": "hot"},
+        {"message": "hi", "timeout_s": 0},
+        {"message": "hi", "timeout_s": "soon"},
+        {"message": "hi", "model_tier": "huge"},
+        {"message": "hi", "events": "yes"},
+        ["hi"],
+    ],
+)
+async def test_invalid_body_is_400(client, service, body):
+    await client.request("POST", f"/graphs/{GRAPH}/chat", body)
+
+    assert client.status == 400
+    assert "error" in client.json()
+    assert service.calls == []
+
+
+async def test_invalid_json_is_400(client):
+    await client.request("POST", f"/graphs/{GRAPH}/chat", chunks=[b"{not json"])
+
+    assert client.status == 400
+
+
+async def test_oversized_body_is_413(client):
+    chunk = b" " * (_MAX_BODY_BYTES // 2 + 1)
+
+    await client.request("POST", f"/graphs/{GRAPH}/chat", chunks=[chunk, chunk])
+
+    assert client.status == 413
+
+
+async def test_chat(client, service):
+    await client.request(
+        "POST",
+        f"/graphs/{GRAPH}/chat",
+        {"message": "hi", "thread_id": "t1", "model_tier": "fast", "timeout_s": 5},
+    )
+
+    assert client.status == 200
+    assert client.json() == {"content": "Hello world", "thread_id": "t1"}
+    ((message, kwargs),) = service.calls
+    assert message == "hi"
+    assert kwargs["model_tier"] == "fast"
+    assert kwargs["deadline"] is not None
+
+
+async def test_request_id_is_echoed_or_generated(client):
+    await client.request("GET", "/health", headers={"X-Request-ID": "abc123"})
+    assert client.headers["x-request-id"] == "abc123"
+
+    client.sent.clear()
+    await client.request("GET", "/health")
+    assert client.headers["x-request-id"]
+
+
+async def test_stream_frames_tokens_then_done(client):
+    await client.request(
+        "POST", f"/graphs/{GRAPH}/stream", {"message": "hi", "thread_id": "t1"}
+    )
+
+    assert client.status == 200
+    assert client.headers["content-type"] == "text/event-stream"
+    assert client.events() == [
+        ("token", {"content": "Hello"}),
+        ("token", {"content": " world"}),
+        ("done", {"thread_id": "t1"}),
+    ]
+    assert client.sent[-1].get("more_body", False) is False
+
+
+async def test_stream_with_progress_events(client):
+    await client.request(
+        "POST", f"/graphs/{GRAPH}/stream", {"message": "hi", "events": True}
+    )
+
+    events = client.events()
+    assert events[0] == ("classified", {"t": 1.0, "sources": ["forecast"]})
+    assert events[1] == ("token", {"t": 2.0, "content": "Hello"})
+    assert events[-1][0] == "done"
+
+
+@pytest.mark.parametrize(
+    ("error", "detail"),
+    [
+        (RuntimeError("boom"), "Internal server error"),
+        (AdmissionRejected("model:m", "queue full"), "Server overloaded, retry later"),
+    ],
+)
+async def test_stream_error_is_sent_in_stream(client, service, error, detail):
+    service.error = error
+
+    await client.request("POST", f"/graphs/{GRAPH}/stream", {"message": "hi"})
+
+    assert client.status == 200
+    assert client.events()[-1] == ("error", {"error": detail})
+
+
+async def test_shed_chat_is_503(client, service):
+    service.error = AdmissionRejected("model:m", "queue full")
+
+    await client.request("POST", f"/graphs/{GRAPH}/chat", {"message": "hi"})
+
+    assert client.status == 503
+
+
+async def test_draining_rejects_chat_with_503(client, service):
+    await client.app.ashutdown()
+
+    await client.request("POST", f"/graphs/{GRAPH}/chat", {"message": "hi"})
+    assert client.status == 503
+    assert service.calls == []
+
+    client.sent.clear()
+    await client.request("GET", "/health")
+    assert (client.status, client.json()) == (503, {"status": "draining"})
+
+
+async def test_disconnect_cancels_stream(client, service):
+    service.hang = True
+    request = asyncio.create_task(
+        client.request("POST", f"/graphs/{GRAPH}/stream", {"message": "hi"})
+    )
+    while len(client.sent) < 3:  # Headers and both tokens
+        await asyncio.sleep(0)
+
+    client.inbox.put_nowait({"type": "http.disconnect"})
+    await asyncio.wait_for(request, 1)
+
+    assert service.closed.is_set()
+    assert all(e[0] != "done" for e in client.events())
+    assert client.app._inflight == 0
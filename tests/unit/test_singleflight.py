@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from langgraph_runner.metrics import metrics
+from langgraph_runner.singleflight import SingleFlight, normalize_query
+
+
+@pytest.fixture
+def flight() -> SingleFlight:
+    return SingleFlight("test_flight")
+
+
+def test_normalize_query():
+    assert normalize_query("  What IS\tgold?\n") == "what is gold?"
+
+
+async def test_concurrent_calls_share_one_execution(flight):
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "answer"
+
+    waiters = [asyncio.create_task(flight.do("key", fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["answer"] * 3
+    assert calls == 1
+    assert metrics.counter("test_flight.miss") == 1
+    assert metrics.counter("test_flight.hit") == 2
+
+
+async def test_finished_key_runs_again(flight):
+    calls = 0
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", fn) == 1
+    assert await flight.do("key", fn) == 2
+
+
+async def test_errors_reach_every_waiter(flight):
+    async def fn():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fn), flight.do("key", fn), return_exceptions=True
+    )
+
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+
+async def test_one_waiter_leaving_does_not_cancel_the_others(flight):
+    release = asyncio.Event()
+
+    async def fn():
+        await release.wait()
+        return "answer"
+
+    leaving = asyncio.create_task(flight.do("key", fn))
+    staying = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    leaving.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await staying == "answer"
+    assert leaving.cancelled()
+
+
+async def test_last_waiter_leaving_cancels_the_call(flight):
+    cancelled = asyncio.Event()
+
+    async def fn():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiter = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_late_stream_subscriber_gets_replay(flight):
+    first_sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def tokens():
+        yield "a"
+        first_sent.set()
+        await release.wait()
+        yield "b"
+
+    async def collect():
+        return [chunk async for chunk in flight.stream("key", tokens)]
+
+    early = asyncio.create_task(collect())
+    await first_sent.wait()
+    late = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await early == ["a", "b"]
+    assert await late == ["a", "b"]
+    assert metrics.hit_rate("test_flight") == 0.5
+
+
+async def test_stream_error_reaches_subscribers(flight):
+    async def tokens():
+        yield "a"
+        raise RuntimeError("boom")
+
+    received = []
+    with pytest.raises(RuntimeError):
+        async for chunk in flight.stream("key", tokens):
+            received.append(chunk)
+
+    assert received == ["a"]
+
+
+async def test_stream_closed_when_every_subscriber_leaves(flight):
+    closed = asyncio.Event()
+
+    async def tokens():
+        try:
+            yield "a"
+            await asyncio.sleep(10)
+            yield "b"
+        finally:
+            closed.set()
+
+    stream = flight.stream("key", tokens)
+    assert await anext(stream) == "a"
+    await stream.aclose()
+
+    await asyncio.wait_for(closed.wait(), 1)
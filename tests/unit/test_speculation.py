@@ -0,0 +1,104 @@
+import asyncio
+
+from langchain_core.documents import Document
+
+from langgraph_runner.deadline import deadline_after
+from langgraph_runner.graphs.jpm_rag.speculation import (
+    SPECULATION_METRIC,
+    SpeculativeRetrieval,
+    keyword_overlap,
+)
+from langgraph_runner.graphs.jpm_rag.state import Classification
+from langgraph_runner.metrics import metrics
+
+RAW_QUERY = "What does J.P. Morgan expect for US equities in 2025?"
+
+
+class StubRetriever:
+    """Returns one document per call, naming the source it searched."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls: list[tuple[str, str | None]] = []
+        self.cancelled: list[str | None] = []
+
+    async def retrieve_with_scores(self, query, doc_type=None):
+        self.calls.append((query, doc_type))
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled.append(doc_type)
+            raise
+        return [(Document(page_content=f"{doc_type}: {query}"), 0.1)]
+
+
+async def test_rewritten_sub_query_reuses_speculative_result():
+    retriever = StubRetriever()
+    speculation = SpeculativeRetrieval(retriever, RAW_QUERY)
+
+    [resolved] = await speculation.aresolve(
+        [Classification(source="forecast", query="US equities 2025 outlook")],
+        "match",
+    )
+
+    assert resolved.prefetched is not None
+    assert resolved.prefetched[0][0].page_content == f"forecast: {RAW_QUERY}"
+    assert metrics.counter(f"{SPECULATION_METRIC}.hit") == 1
+    assert metrics.counter(f"{SPECULATION_METRIC}.cancelled") == 1
+
+
+async def test_unrelated_sub_query_is_rerun():
+    speculation = SpeculativeRetrieval(StubRetriever(), RAW_QUERY)
+
+    [resolved] = await speculation.aresolve(
+        [Classification(source="mid_year", query="gold price performance")],
+        "match",
+    )
+
+    assert resolved.prefetched is None
+    assert metrics.counter(f"{SPECULATION_METRIC}.miss") == 1
+
+
+async def test_always_policy_reuses_any_selected_source():
+    speculation = SpeculativeRetrieval(StubRetriever(), RAW_QUERY)
+
+    [resolved] = await speculation.aresolve(
+        [Classification(source="mid_year", query="gold price performance")],
+        "always",
+    )
+
+    assert resolved.prefetched is not None
+
+
+async def test_unselected_sources_are_cancelled():
+    retriever = StubRetriever(latency=1.0)
+    speculation = SpeculativeRetrieval(retriever, RAW_QUERY)
+    await asyncio.sleep(0)
+
+    await speculation.aresolve(
+        [Classification(source="forecast", query="gold price performance")],
+        "match",
+    )
+    await asyncio.sleep(0)
+
+    assert sorted(retriever.cancelled) == ["forecast", "mid_year"]
+
+
+async def test_result_missing_the_deadline_falls_back():
+    speculation = SpeculativeRetrieval(StubRetriever(latency=1.0), RAW_QUERY)
+
+    [resolved] = await speculation.aresolve(
+        [Classification(source="forecast", query="US equities 2025")],
+        "match",
+        deadline_after(0.01),
+    )
+    speculation.cancel()
+
+    assert resolved.prefetched is None
+    assert metrics.counter(f"{SPECULATION_METRIC}.miss") == 1
+
+
+def test_keyword_overlap():
+    assert keyword_overlap(RAW_QUERY, "US equities 2025 outlook") == 0.75
+    comparison = "Compare gold forecasts with actual results"
+    assert keyword_overlap(comparison, "gold price forecast") < 0.5
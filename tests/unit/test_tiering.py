@@ -0,0 +1,63 @@
+import pytest
+
+from langgraph_runner.config import settings
+from langgraph_runner.metrics import metrics
+from langgraph_runner.tiering import TierSignals, is_comparison, select_model
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setattr(settings, "TIERING_MAX_SOURCES", 1)
+    monkeypatch.setattr(settings, "TIERING_MAX_CONTEXT_TOKENS", 1000)
+    monkeypatch.setattr(settings, "TIERING_MAX_QUERY_TOKENS", 50)
+
+
+def signals(**overrides) -> TierSignals:
+    return TierSignals(**{"query_tokens": 10, "context_tokens": 100, **overrides})
+
+
+@pytest.mark.parametrize(
+    ("overrides", "tier", "reason"),
+    [
+        ({}, "fast", "simple"),
+        ({"comparison": True}, "default", "comparison"),
+        ({"sources": 2}, "default", "multiple_sources"),
+        ({"context_tokens": 1001}, "default", "large_context"),
+        ({"query_tokens": 51}, "default", "long_query"),
+        ({"context_tokens": 1000, "query_tokens": 50}, "fast", "simple"),
+    ],
+)
+def test_auto_tier(overrides, tier, reason):
+    decision = select_model("auto", "big", "small", signals(**overrides))
+
+    assert (decision.tier, decision.reason) == (tier, reason)
+    assert decision.model_id == ("small" if tier == "fast" else "big")
+    assert metrics.counter(f"model_tier.{tier}") == 1
+
+
+@pytest.mark.parametrize(
+    ("setting", "model_id"), [("fast", "small"), ("default", "big")]
+)
+def test_fixed_tier_ignores_signals(setting, model_id):
+    decision = select_model(setting, "big", "small", signals(comparison=True))
+
+    assert decision.model_id == model_id
+    assert decision.reason == "configured"
+
+
+def test_auto_needs_signals():
+    with pytest.raises(ValueError):
+        select_model("auto", "big", "small")
+
+
+def test_signals_from_query():
+    s = TierSignals.from_query("Compare gold vs oil", context_tokens=300, sources=2)
+
+    assert s.comparison
+    assert s.query_tokens > 0
+    assert (s.context_tokens, s.sources) == (300, 2)
+
+
+def test_is_comparison():
+    assert is_comparison("What are the differences between the outlooks?")
+    assert not is_comparison("What happened to gold?")